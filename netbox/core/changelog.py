@@ -0,0 +1,125 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models.signals import post_save
+
+from netbox.bulk import register_bulk_context
+
+__all__ = (
+    'ChangeLogBatch',
+    'batched_change_logging',
+    'compress_change_records',
+    'get_changelog_batch',
+)
+
+logger = logging.getLogger('netbox.core.changelog')
+
+# Holds the active ChangeLogBatch (if any) for the current thread
+_local = threading.local()
+
+
+class ChangeLogBatch:
+    """
+    A collection of ObjectChange records pending creation. The most recent record for each object is tracked so that
+    subsequent many-to-many changes can be merged into it in memory.
+    """
+    def __init__(self):
+        self.objectchanges = []
+        self._latest = {}
+
+    def __len__(self):
+        return len(self.objectchanges)
+
+    def add(self, objectchange):
+        """
+        Queue an ObjectChange record for creation.
+        """
+        self.objectchanges.append(objectchange)
+        key = (objectchange.changed_object_type_id, objectchange.changed_object_id, objectchange.request_id)
+        self._latest[key] = objectchange
+
+    def get_latest(self, object_type, object_id, request_id):
+        """
+        Return the most recent ObjectChange queued for the specified object by the specified request, if any.
+        """
+        return self._latest.get((object_type.pk, object_id, request_id))
+
+    def flush(self):
+        """
+        Create all queued ObjectChange records using a single bulk query. The post_save signal is sent for each record
+        to preserve compatibility with any receivers.
+        """
+        from core.models import ObjectChange
+
+        # Record the user's name and the object's representation as static strings (as done by ObjectChange.save())
+        for objectchange in self.objectchanges:
+            if not objectchange.user_name:
+                objectchange.user_name = objectchange.user.username
+            if not objectchange.object_repr:
+                objectchange.object_repr = str(objectchange.changed_object)
+
+        compress_change_records(self.objectchanges)
+        using = router.db_for_write(ObjectChange)
+        ObjectChange.objects.using(using).bulk_create(self.objectchanges)
+        if post_save.has_listeners(ObjectChange):
+            for objectchange in self.objectchanges:
+                post_save.send(
+                    sender=ObjectChange,
+                    instance=objectchange,
+                    created=True,
+                    update_fields=None,
+                    raw=False,
+                    using=using
+                )
+
+        logger.debug(f'Created {len(self.objectchanges)} change records')
+        self.objectchanges = []
+        self._latest = {}
+
+
+def compress_change_records(objectchanges):
+    """
+    Compress the pre-change data of the given (unsaved) ObjectChange records to include only the changed attributes,
+    if enabled by CHANGELOG_COMPACT_RECORDS.
+    """
+    if not settings.CHANGELOG_COMPACT_RECORDS:
+        return
+    for objectchange in objectchanges:
+        objectchange.compress()
+
+
+def get_changelog_batch():
+    """
+    Return the ChangeLogBatch for the current thread, or None if change records are being saved immediately.
+    """
+    return getattr(_local, 'batch', None)
+
+
+@register_bulk_context
+@contextmanager
+def batched_change_logging():
+    """
+    Defer the creation of ObjectChange records until the end of the block. Within the block, change records are
+    queued in memory (with many-to-many changes merged into any record already queued for the object); when the
+    block exits, all queued records are created together. The block runs inside a transaction, so the change records
+    are committed along with the changes they describe.
+
+    Nested invocations join the outermost block.
+    """
+    from core.models import ObjectChange
+
+    if get_changelog_batch() is not None:
+        yield
+        return
+
+    batch = _local.batch = ChangeLogBatch()
+    try:
+        with transaction.atomic(using=router.db_for_write(ObjectChange)):
+            yield
+            _local.batch = None
+            batch.flush()
+    finally:
+        _local.batch = None
@@ -1,11 +1,13 @@
 import sys
+import time
 from datetime import timedelta
 from importlib import import_module
 
 import requests
 from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Exists, OuterRef, Subquery
+from django.db import router, transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 from packaging import version
 
@@ -17,6 +19,7 @@ from utilities.proxy import resolve_proxies
 
 from .choices import DataSourceStatusChoices, JobIntervalChoices, ObjectChangeActionChoices
 from .models import DataSource
+from .partitions import create_changelog_partitions, drop_changelog_partitions, is_changelog_partitioned
 
 
 class SyncDataSourceJob(JobRunner):
@@ -48,7 +51,7 @@ class SyncDataSourceJob(JobRunner):
 
             # Update the search cache for DataFiles belonging to this source
             self.logger.debug("Updating search cache for data files")
-            search_backend.cache(datasource.datafiles.iterator())
+            search_backend.cache(datasource.datafiles.defer('data').iterator())
 
         except Exception as e:
             self.logger.error(f"Error syncing data source: {e}")
@@ -77,6 +80,7 @@ class SystemHousekeepingJob(JobRunner):
 
         self.send_census_report()
         self.clear_expired_sessions()
+        self.create_changelog_partitions()
         self.prune_changelog()
         self.delete_expired_jobs()
         self.check_for_new_releases()
@@ -123,6 +127,17 @@ class SystemHousekeepingJob(JobRunner):
                 f"clearing sessions; skipping."
             )
 
+    def create_changelog_partitions(self):
+        """
+        Create upcoming monthly partitions of the changelog table (if partitioned).
+        """
+        if not is_changelog_partitioned():
+            return
+
+        self.logger.info('Creating changelog partitions...')
+        for name in create_changelog_partitions():
+            self.logger.info(f'Created changelog partition {name}')
+
     def prune_changelog(self):
         """
         Delete any ObjectChange records older than the configured changelog retention time (if any).
@@ -149,28 +164,53 @@ class SystemHousekeepingJob(JobRunner):
                 changed_object_id=OuterRef('changed_object_id'),
             )
 
-            # Keep create records only where no delete exists for that object
-            create_pks_to_keep = (
-                ObjectChange.objects.filter(action=ObjectChangeActionChoices.ACTION_CREATE)
-                .annotate(has_delete=Exists(deleted_exists))
-                .filter(has_delete=False)
-                .values('pk')
+            # An update record is the most recent for its object if no later update record exists. (These are evaluated
+            # per record so that each batch is resolved using the index on the changed object.)
+            newer_update_exists = ObjectChange.objects.filter(
+                Q(time__gt=OuterRef('time')) | Q(time=OuterRef('time'), pk__gt=OuterRef('pk')),
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+                changed_object_type_id=OuterRef('changed_object_type_id'),
+                changed_object_id=OuterRef('changed_object_id'),
             )
 
-            # Keep the most recent update per object only where no delete exists for the object
-            latest_update_pks_to_keep = (
-                ObjectChange.objects.filter(action=ObjectChangeActionChoices.ACTION_UPDATE)
-                .annotate(has_delete=Exists(deleted_exists))
-                .filter(has_delete=False)
-                .order_by('changed_object_type_id', 'changed_object_id', '-time', '-pk')
-                .distinct('changed_object_type_id', 'changed_object_id')
-                .values('pk')
+            expired_qs = expired_qs.annotate(
+                has_delete=Exists(deleted_exists),
+                has_newer_update=Exists(newer_update_exists),
+            ).exclude(
+                # Keep create records only where no delete exists for that object
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+                has_delete=False,
+            ).exclude(
+                # Keep the most recent update per object only where no delete exists for the object
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+                has_delete=False,
+                has_newer_update=False,
             )
 
-            expired_qs = expired_qs.exclude(pk__in=Subquery(create_pks_to_keep))
-            expired_qs = expired_qs.exclude(pk__in=Subquery(latest_update_pks_to_keep))
+        # If the changelog is partitioned, drop any partitions containing only expired records. (This is not possible
+        # when retaining certain records.)
+        elif is_changelog_partitioned():
+            for name in drop_changelog_partitions(before=cutoff):
+                self.logger.info(f'Dropped expired changelog partition {name}')
+
+        # Delete expired records in batches (ordered by primary key), each in its own transaction, to avoid holding
+        # locks on the table for an extended period. Records are deleted directly, without first being loaded.
+        batch_size = settings.CHANGELOG_PRUNE_BATCH_SIZE
+        using = router.db_for_write(ObjectChange)
+        count = 0
+        last_pk = 0
+        while pks := list(
+            expired_qs.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        ):
+            with transaction.atomic(using=using):
+                count += ObjectChange.objects.filter(pk__in=pks)._raw_delete(using)
+            last_pk = pks[-1]
+            self.logger.debug(f'Deleted {count} expired changelog records (through ID {last_pk})')
+            if len(pks) < batch_size:
+                break
+            if settings.CHANGELOG_PRUNE_DELAY:
+                time.sleep(settings.CHANGELOG_PRUNE_DELAY)
 
-        count = expired_qs.delete()[0]
         self.logger.info(f'Deleted {count} expired changelog records')
 
     def delete_expired_jobs(self):
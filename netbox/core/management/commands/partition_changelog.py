@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.partitions import (
+    PARTITION_MONTHS_AHEAD,
+    convert_changelog_to_partitioned,
+    create_changelog_partitions,
+    is_changelog_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = "Create upcoming monthly partitions of the changelog table, optionally converting it to a partitioned table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert', action='store_true',
+            help="Convert the changelog table to a partitioned table (this locks the table while records are copied)"
+        )
+        parser.add_argument(
+            '--months', type=int, default=PARTITION_MONTHS_AHEAD,
+            help="The number of months beyond the current month for which to create partitions"
+        )
+
+    def handle(self, *args, **options):
+        if options['months'] < 0:
+            raise CommandError("The number of months cannot be negative.")
+
+        if options['convert']:
+            if is_changelog_partitioned():
+                raise CommandError("The changelog table is already partitioned.")
+            self.stdout.write("Converting the changelog table to a partitioned table...")
+            try:
+                convert_changelog_to_partitioned(months_ahead=options['months'])
+            except ValueError as e:
+                raise CommandError(e)
+            self.stdout.write(self.style.SUCCESS("Finished."))
+            return
+
+        if not is_changelog_partitioned():
+            raise CommandError("The changelog table is not partitioned. Use --convert to convert it.")
+
+        created = create_changelog_partitions(months_ahead=options['months'])
+        for name in created:
+            self.stdout.write(f"Created partition {name}")
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partitions."))
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_job_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='objectchange',
+            name='compact',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
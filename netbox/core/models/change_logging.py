@@ -11,7 +11,7 @@ from mptt.models import MPTTModel
 from core.choices import ObjectChangeActionChoices
 from core.querysets import ObjectChangeQuerySet
 from netbox.models.features import ChangeLoggingMixin, has_feature
-from utilities.data import deep_compare_dict
+from utilities.data import deep_compare_dict, deepmerge, get_changed_data
 
 __all__ = (
     'ObjectChange',
@@ -99,6 +99,12 @@ class ObjectChange(models.Model):
         blank=True,
         null=True
     )
+    compact = models.BooleanField(
+        verbose_name=_('compact'),
+        editable=False,
+        default=False,
+        help_text=_('The pre-change data includes only the changed attributes')
+    )
 
     objects = ObjectChangeQuerySet.as_manager()
 
@@ -150,6 +156,42 @@ class ObjectChange(models.Model):
     def has_changes(self):
         return self.prechange_data != self.postchange_data
 
+    def compress(self):
+        """
+        Reduce the pre-change data of an update to only the attributes which have changed. The complete pre-change data
+        is reconstructed on demand from the post-change data (see get_data()). Records whose pre- and post-change data
+        differ in their set of attributes are left intact.
+        """
+        if self.action != ObjectChangeActionChoices.ACTION_UPDATE:
+            return
+        if self.prechange_data is None or self.postchange_data is None:
+            return
+        if (prechange_data := get_changed_data(self.prechange_data, self.postchange_data)) is None:
+            return
+        self.prechange_data = prechange_data
+        self.compact = True
+
+    def set_postchange_data(self, data):
+        """
+        Replace the post-change data of the record (e.g. to include a subsequent change to a many-to-many field),
+        retaining the record's format.
+        """
+        if not self.compact:
+            self.postchange_data = data
+            return
+        self.prechange_data = self.get_data('prechange')
+        self.postchange_data = data
+        self.compact = False
+        self.compress()
+
+    def get_data(self, prefix):
+        """
+        Return the complete pre- or post-change data, reconstructing the pre-change data of a compact record.
+        """
+        if self.compact and prefix == 'prechange':
+            return deepmerge(self.postchange_data, self.prechange_data)
+        return getattr(self, f'{prefix}_data')
+
     @cached_property
     def diff_exclude_fields(self):
         """
@@ -175,7 +217,7 @@ class ObjectChange(models.Model):
         Return only the pre-/post-change attributes which are relevant for calculating a diff.
         """
         ret = {}
-        change_data = getattr(self, f'{prefix}_data') or {}
+        change_data = self.get_data(prefix) or {}
         for k, v in change_data.items():
             if k not in self.diff_exclude_fields and not k.startswith('_'):
                 ret[k] = v
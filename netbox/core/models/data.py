@@ -1,6 +1,7 @@
 import hashlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatchcase
 from urllib.parse import urlparse
 
@@ -31,6 +32,23 @@ __all__ = (
 
 logger = logging.getLogger('netbox.core.data')
 
+# The number of threads used to hash files during synchronization
+SYNC_HASH_WORKERS = 8
+
+# The number of new or modified files to be read and saved at once during synchronization
+SYNC_BATCH_SIZE = 100
+
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """
+    Return the SHA256 hash of a file, reading it in chunks.
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
 
 class DataSource(JobsMixin, PrimaryModel):
     """
@@ -202,42 +220,62 @@ class DataSource(JobsMixin, PrimaryModel):
         with backend.fetch() as local_path:
 
             logger.debug(f'Syncing files from source root {local_path}')
-            data_files = self.datafiles.all()
-            known_paths = {df.path for df in data_files}
-            logger.debug(f'Starting with {len(known_paths)} known files')
+            known_files = {
+                path: (pk, file_hash, size, last_updated)
+                for pk, path, file_hash, size, last_updated in self.datafiles.values_list(
+                    'pk', 'path', 'hash', 'size', 'last_updated'
+                )
+            }
+            logger.debug(f'Starting with {len(known_files)} known files')
+            paths = self._walk(local_path)
 
-            # Check for any updated/deleted files
-            updated_files = []
-            deleted_file_ids = []
-            for datafile in data_files:
+            # Bulk delete deleted files
+            deleted_file_ids = [pk for path, (pk, *__) in known_files.items() if path not in paths]
+            deleted_count, __ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
+            logger.debug(f"Deleted {deleted_count} files")
 
-                try:
-                    if datafile.refresh_from_disk(source_root=local_path):
+            # Skip any known files whose size is unchanged and which have not been modified since last updated
+            candidate_paths = []
+            for path in paths:
+                if path in known_files:
+                    __, __, size, last_updated = known_files[path]
+                    stat = os.stat(os.path.join(local_path, path))
+                    if stat.st_size == size and stat.st_mtime < last_updated.timestamp():
+                        continue
+                candidate_paths.append(path)
+
+            # Hash the remaining files in parallel, and identify those which are new or have been modified
+            with ThreadPoolExecutor(max_workers=SYNC_HASH_WORKERS) as executor:
+                hashes = executor.map(lambda path: hash_file(os.path.join(local_path, path)), candidate_paths)
+                changed_files = {
+                    path: file_hash for path, file_hash in zip(candidate_paths, hashes)
+                    if path not in known_files or known_files[path][1] != file_hash
+                }
+
+            # Read and save the data of modified & new files in batches
+            updated_count = created_count = 0
+            changed_paths = sorted(changed_files)
+            for i in range(0, len(changed_paths), SYNC_BATCH_SIZE):
+                updated_files = []
+                new_datafiles = []
+                for path in changed_paths[i:i + SYNC_BATCH_SIZE]:
+                    datafile = DataFile(source=self, path=path)
+                    datafile.load_from_disk(source_root=local_path, file_hash=changed_files[path])
+                    if path in known_files:
+                        datafile.pk = known_files[path][0]
                         updated_files.append(datafile)
-                except FileNotFoundError:
-                    # File no longer exists
-                    deleted_file_ids.append(datafile.pk)
-                    continue
+                    else:
+                        # Uniqueness is assured, as new files have been excluded from known paths
+                        datafile.full_clean(validate_unique=False, validate_constraints=False)
+                        new_datafiles.append(datafile)
 
-            # Bulk update modified files
-            updated_count = DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
-            logger.debug(f"Updated {updated_count} files")
+                # Bulk update modified files
+                updated_count += DataFile.objects.bulk_update(updated_files, ('last_updated', 'size', 'hash', 'data'))
 
-            # Bulk delete deleted files
-            deleted_count, __ = DataFile.objects.filter(pk__in=deleted_file_ids).delete()
-            logger.debug(f"Deleted {deleted_count} files")
+                # Bulk create new files
+                created_count += len(DataFile.objects.bulk_create(new_datafiles))
 
-            # Walk the local replication to find new files
-            new_paths = self._walk(local_path) - known_paths
-
-            # Bulk create new files
-            new_datafiles = []
-            for path in new_paths:
-                datafile = DataFile(source=self, path=path)
-                datafile.refresh_from_disk(source_root=local_path)
-                datafile.full_clean()
-                new_datafiles.append(datafile)
-            created_count = len(DataFile.objects.bulk_create(new_datafiles, batch_size=100))
+            logger.debug(f"Updated {updated_count} files")
             logger.debug(f"Created {created_count} data files")
 
         # Update status & last_synced time
@@ -361,20 +399,25 @@ class DataFile(models.Model):
         Update instance attributes from the file on disk. Returns True if any attribute
         has changed.
         """
-        file_path = os.path.join(source_root, self.path)
-        with open(file_path, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        file_hash = hash_file(os.path.join(source_root, self.path))
 
         # Update instance file attributes & data
         if is_modified := file_hash != self.hash:
-            self.last_updated = timezone.now()
-            self.size = os.path.getsize(file_path)
-            self.hash = file_hash
-            with open(file_path, 'rb') as f:
-                self.data = f.read()
+            self.load_from_disk(source_root, file_hash=file_hash)
 
         return is_modified
 
+    def load_from_disk(self, source_root, file_hash=None):
+        """
+        Read the file's data & attributes from disk. The SHA256 hash of the file may be passed if already known.
+        """
+        file_path = os.path.join(source_root, self.path)
+        with open(file_path, 'rb') as f:
+            self.data = f.read()
+        self.last_updated = timezone.now()
+        self.size = len(self.data)
+        self.hash = file_hash or hashlib.sha256(self.data).hexdigest()
+
 
 class AutoSyncRecord(models.Model):
     """
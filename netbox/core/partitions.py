@@ -0,0 +1,239 @@
+import logging
+import re
+from datetime import UTC, datetime
+
+from django.db import DatabaseError, connections, router, transaction
+
+__all__ = (
+    'PARTITION_MONTHS_AHEAD',
+    'convert_changelog_to_partitioned',
+    'create_changelog_partitions',
+    'drop_changelog_partitions',
+    'get_changelog_partitions',
+    'is_changelog_partitioned',
+)
+
+logger = logging.getLogger('netbox.core.partitions')
+
+# The number of months beyond the current month for which changelog partitions are created in advance
+PARTITION_MONTHS_AHEAD = 3
+
+
+def _get_table():
+    from core.models import ObjectChange
+    return ObjectChange._meta.db_table
+
+
+def _get_connection(using=None):
+    from core.models import ObjectChange
+    return connections[using or router.db_for_write(ObjectChange)]
+
+
+def _month_start(dt, offset=0):
+    """
+    Return the start of the month (in UTC) containing the given datetime, optionally offset by a number of months.
+    """
+    dt = dt.astimezone(UTC)
+    year, month = divmod(dt.year * 12 + dt.month - 1 + offset, 12)
+    return datetime(year, month + 1, 1, tzinfo=UTC)
+
+
+def _partition_name(table, start):
+    return f'{table}_p{start:%Y%m}'
+
+
+def is_changelog_partitioned(using=None):
+    """
+    Return True if the ObjectChange table has been converted to a partitioned table.
+    """
+    connection = _get_connection(using)
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid '
+            'WHERE c.relname = %s AND pg_table_is_visible(c.oid))',
+            [_get_table()]
+        )
+        return cursor.fetchone()[0]
+
+
+def get_changelog_partitions(using=None):
+    """
+    Return a list of the monthly partitions of the ObjectChange table as (name, start, end) tuples, ordered by start
+    time. The default partition (if any) is excluded.
+    """
+    table = _get_table()
+    pattern = re.compile(rf'^{re.escape(table)}_p(\d{{4}})(\d{{2}})$')
+    with _get_connection(using).cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid '
+            'JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s AND pg_table_is_visible(p.oid)',
+            [table]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = []
+    for name in names:
+        if match := pattern.match(name):
+            start = datetime(int(match[1]), int(match[2]), 1, tzinfo=UTC)
+            partitions.append((name, start, _month_start(start, 1)))
+
+    return sorted(partitions, key=lambda p: p[1])
+
+
+def create_changelog_partitions(months_ahead=PARTITION_MONTHS_AHEAD, using=None):
+    """
+    Create any missing monthly partitions of the ObjectChange table from the current month through the specified
+    number of months ahead. Returns the names of the partitions created.
+
+    Any records already held by the default partition for the month of a new partition are moved to it (PostgreSQL
+    would otherwise refuse to create the partition). A partition which cannot be created is logged and skipped.
+    """
+    connection = _get_connection(using)
+    table = _get_table()
+    existing = {name for name, _, _ in get_changelog_partitions(using=connection.alias)}
+
+    created = []
+    now = datetime.now(UTC)
+    for offset in range(months_ahead + 1):
+        start, end = _month_start(now, offset), _month_start(now, offset + 1)
+        if (name := _partition_name(table, start)) not in existing:
+            try:
+                _create_changelog_partition(connection, name, start, end)
+            except DatabaseError as e:
+                logger.error(f'Unable to create changelog partition {name}: {e}')
+                continue
+            logger.debug(f'Created changelog partition {name}')
+            created.append(name)
+
+    return created
+
+
+def _create_changelog_partition(connection, name, start, end):
+    """
+    Create a partition of the ObjectChange table for the given range of time, moving any records within the range out
+    of the default partition.
+    """
+    qn = connection.ops.quote_name
+    table = _get_table()
+    default = f'{table}_default'
+    bounds = f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [default])
+        if cursor.fetchone()[0]:
+            # Block new records from being added to the default partition until the new partition has been attached
+            cursor.execute(f'LOCK TABLE {qn(default)} IN EXCLUSIVE MODE')
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM {qn(default)} WHERE time >= %s AND time < %s)',
+                [start, end]
+            )
+            if cursor.fetchone()[0]:
+                cursor.execute(
+                    f'CREATE TABLE {qn(name)} (LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+                )
+                cursor.execute(
+                    f'WITH moved AS (DELETE FROM {qn(default)} WHERE time >= %s AND time < %s RETURNING *) '
+                    f'INSERT INTO {qn(name)} SELECT * FROM moved',
+                    [start, end]
+                )
+                logger.info(f'Moved {cursor.rowcount} records from the default changelog partition to {name}')
+                cursor.execute(f'ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} {bounds}')
+                return
+
+        cursor.execute(f'CREATE TABLE {qn(name)} PARTITION OF {qn(table)} {bounds}')
+
+
+def drop_changelog_partitions(before, using=None):
+    """
+    Drop all monthly partitions of the ObjectChange table which contain only records older than the given time.
+    Returns the names of the partitions dropped.
+    """
+    connection = _get_connection(using)
+    qn = connection.ops.quote_name
+
+    dropped = []
+    with connection.cursor() as cursor:
+        for name, _, end in get_changelog_partitions(using=connection.alias):
+            if end > before:
+                break
+            cursor.execute(f'DROP TABLE {qn(name)}')
+            logger.debug(f'Dropped changelog partition {name}')
+            dropped.append(name)
+
+    return dropped
+
+
+def convert_changelog_to_partitioned(months_ahead=PARTITION_MONTHS_AHEAD, using=None):
+    """
+    Convert the ObjectChange table to a table partitioned by month on the time of each change. A partition is created
+    for each month from the earliest existing record through the specified number of months ahead, along with a
+    default partition for any records falling outside of them. All existing records are copied into the new table.
+
+    The table's primary key becomes (id, time), as PostgreSQL requires the partition key to be included in any unique
+    constraint. The table is locked for the duration of the conversion.
+    """
+    connection = _get_connection(using)
+    if connection.vendor != 'postgresql':
+        raise ValueError('Changelog partitioning requires PostgreSQL.')
+    qn = connection.ops.quote_name
+    table = _get_table()
+    new_table = f'{table}_partitioned'
+    sequence = f'{table}_partitioned_id_seq'
+
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        if is_changelog_partitioned(using=connection.alias):
+            raise ValueError('The changelog is already partitioned.')
+        cursor.execute(f'LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE')
+
+        # Record the definitions of the table's indexes (other than the primary key) and foreign keys, to be recreated
+        # on the new table
+        cursor.execute(
+            'SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i '
+            'WHERE i.indrelid = %s::regclass AND NOT i.indisprimary',
+            [table]
+        )
+        index_defs = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            'SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint '
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT MIN(time), MAX(id) FROM {qn(table)}')
+        earliest, max_id = cursor.fetchone()
+
+        # Create the partitioned table. (Identity columns are not supported on partitioned tables prior to PostgreSQL
+        # 17, so IDs are assigned from a sequence continuing from the existing records.)
+        cursor.execute(
+            f'CREATE TABLE {qn(new_table)} (LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (time)'
+        )
+        cursor.execute(f'CREATE SEQUENCE {qn(sequence)} OWNED BY {qn(new_table)}.id')
+        cursor.execute('SELECT setval(%s, %s, %s)', [sequence, max_id or 1, max_id is not None])
+        cursor.execute(f"ALTER TABLE {qn(new_table)} ALTER COLUMN id SET DEFAULT nextval('{sequence}')")
+        cursor.execute(f'ALTER TABLE {qn(new_table)} ADD PRIMARY KEY (id, time)')
+
+        # Create the partitions
+        now = datetime.now(UTC)
+        start = _month_start(earliest or now)
+        cursor.execute(f'CREATE TABLE {qn(table + "_default")} PARTITION OF {qn(new_table)} DEFAULT')
+        while start <= _month_start(now, months_ahead):
+            end = _month_start(start, 1)
+            cursor.execute(
+                f'CREATE TABLE {qn(_partition_name(table, start))} PARTITION OF {qn(new_table)} '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+            start = end
+
+        # Copy all records into the new table and replace the original
+        cursor.execute(f'INSERT INTO {qn(new_table)} SELECT * FROM {qn(table)}')
+        logger.info(f'Copied {cursor.rowcount} records to the partitioned changelog table')
+        cursor.execute(f'DROP TABLE {qn(table)}')
+        cursor.execute(f'ALTER TABLE {qn(new_table)} RENAME TO {qn(table)}')
+        cursor.execute(f'ALTER SEQUENCE {qn(sequence)} RENAME TO {qn(f"{table}_id_seq")}')
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}')
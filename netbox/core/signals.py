@@ -11,10 +11,11 @@ from django.dispatch import Signal, receiver
 from django.utils.translation import gettext_lazy as _
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 
+from core.changelog import compress_change_records, get_changelog_batch
 from core.choices import JobStatusChoices, ObjectChangeActionChoices
 from core.events import *
 from core.models import ObjectType
-from extras.events import enqueue_event
+from extras.events import discard_spilled_events, enqueue_event
 from extras.models import Tag
 from extras.utils import run_validators
 from netbox.config import get_config
@@ -129,25 +130,37 @@ def handle_changed_object(sender, instance, **kwargs):
         OBJECT_DELETED: ObjectChangeActionChoices.ACTION_DELETE,
     }[event_type]
     objectchange = instance.to_objectchange(action)
+    changelog_batch = get_changelog_batch()
     # If this is a many-to-many field change, check for a previous ObjectChange instance recorded
-    # for this object by this request and update it
-    if m2m_changed and (
+    # for this object by this request and update it. Any change record still queued in the active
+    # batch is updated in memory.
+    if m2m_changed and changelog_batch is not None and (
+        prev_change := changelog_batch.get_latest(
+            ContentType.objects.get_for_model(instance), instance.pk, request.id
+        )
+    ):
+        prev_change.set_postchange_data(objectchange.postchange_data)
+    elif m2m_changed and (
         prev_change := ObjectChange.objects.filter(
             changed_object_type=ContentType.objects.get_for_model(instance),
             changed_object_id=instance.pk,
             request_id=request.id
         ).first()
     ):
-        prev_change.postchange_data = objectchange.postchange_data
+        prev_change.set_postchange_data(objectchange.postchange_data)
         prev_change.save()
     elif objectchange and objectchange.has_changes:
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if changelog_batch is not None:
+            changelog_batch.add(objectchange)
+        else:
+            compress_change_records([objectchange])
+            objectchange.save()
 
     # Ensure that we're working with fresh M2M assignments
     if m2m_changed:
-        instance.refresh_from_db()
+        instance._prefetched_objects_cache = {}
 
     # Enqueue the object for event processing
     queue = events_queue.get()
@@ -200,7 +213,10 @@ def handle_deleted_object(sender, instance, **kwargs):
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         objectchange.user = request.user
         objectchange.request_id = request.id
-        objectchange.save()
+        if (changelog_batch := get_changelog_batch()) is not None:
+            changelog_batch.add(objectchange)
+        else:
+            objectchange.save()
 
     # Django does not automatically send an m2m_changed signal for the reverse direction of a
     # many-to-many relationship (see https://code.djangoproject.com/ticket/17688), so we need to
@@ -274,6 +290,8 @@ def clear_events_queue(sender, **kwargs):
     logger = logging.getLogger('events')
     logger.info(f"Clearing {len(events_queue.get())} queued events ({sender})")
     events_queue.set({})
+    if request := current_request.get():
+        discard_spilled_events(request)
 
 
 #
@@ -4,11 +4,12 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase, override_settings
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
+from core.changelog import batched_change_logging
 from core.choices import ObjectChangeActionChoices
 from core.jobs import SystemHousekeepingJob
 from core.models import ObjectChange, ObjectType
@@ -28,6 +29,8 @@ from dcim.models import (
 )
 from extras.choices import *
 from extras.models import CustomField, CustomFieldChoiceSet, Tag
+from netbox.context_managers import event_tracking
+from users.models import User
 from utilities.testing import APITestCase
 from utilities.testing.utils import create_tags, create_test_device, post_data
 from utilities.testing.views import ModelViewTestCase
@@ -703,6 +706,105 @@ class ChangeLogAPITestCase(APITestCase):
         self.assertEqual(changes[3].action, ObjectChangeActionChoices.ACTION_DELETE)
 
 
+class BatchedChangeLoggingTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser')
+        create_tags('Alpha', 'Bravo')
+
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.request.id = uuid.uuid4()
+        self.request.user = self.user
+
+    def test_batched_change_logging(self):
+        with event_tracking(self.request):
+            with batched_change_logging():
+                sites = [Site.objects.create(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)]
+
+                # Change records are not created until the batch is complete
+                self.assertFalse(ObjectChange.objects.exists())
+
+            site = sites[0]
+            site.snapshot()
+            with batched_change_logging():
+                site.delete()
+
+        objectchanges = ObjectChange.objects.filter(request_id=self.request.id).order_by('time')
+        self.assertEqual(objectchanges.count(), 4)
+        for objectchange, site in zip(objectchanges, sites):
+            self.assertEqual(objectchange.changed_object_id, site.pk)
+            self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_CREATE)
+            self.assertEqual(objectchange.user_name, self.user.username)
+            self.assertEqual(objectchange.object_repr, site.name)
+        self.assertEqual(objectchanges.last().action, ObjectChangeActionChoices.ACTION_DELETE)
+
+    def test_batched_m2m_changes(self):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+
+        with event_tracking(self.request), batched_change_logging():
+            site.snapshot()
+            site.description = 'New description'
+            site.save()
+            site.tags.set(Tag.objects.all())
+
+        # The tag assignments are merged into the change record for the update
+        objectchange = ObjectChange.objects.get(request_id=self.request.id)
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(objectchange.postchange_data['description'], 'New description')
+        self.assertEqual(objectchange.postchange_data['tags'], ['Alpha', 'Bravo'])
+
+    def test_batch_discarded_on_error(self):
+        with event_tracking(self.request):
+            with self.assertRaises(ValueError), batched_change_logging():
+                Site.objects.create(name='Site 1', slug='site-1')
+                raise ValueError()
+
+        self.assertFalse(Site.objects.exists())
+        self.assertFalse(ObjectChange.objects.exists())
+
+
+class CompactChangeLoggingTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser')
+
+    @override_settings(CHANGELOG_COMPACT_RECORDS=True)
+    def test_compact_change_records(self):
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        with event_tracking(request):
+            site = Site.objects.create(name='Site 1', slug='site-1')
+            for i in range(1, 4):
+                site.snapshot()
+                site.description = f'Description {i}'
+                site.save()
+
+        objectchanges = list(ObjectChange.objects.order_by('time', 'pk'))
+        self.assertEqual([oc.compact for oc in objectchanges], [False, True, True, True])
+
+        # Compact records store only the changed pre-change attributes, and the complete post-change data
+        objectchange = objectchanges[2]
+        self.assertEqual(objectchange.prechange_data, {'description': 'Description 1'})
+        self.assertEqual(objectchange.postchange_data['name'], 'Site 1')
+        self.assertEqual(objectchange.postchange_data['description'], 'Description 2')
+
+        # The complete data is reconstructed from the record alone
+        ObjectChange.objects.exclude(pk=objectchange.pk).delete()
+        objectchange = ObjectChange.objects.get(pk=objectchange.pk)
+        self.assertEqual(objectchange.prechange_data_clean['name'], 'Site 1')
+        self.assertEqual(objectchange.prechange_data_clean['description'], 'Description 1')
+        self.assertEqual(objectchange.prechange_data_clean.keys(), objectchange.postchange_data_clean.keys())
+        self.assertEqual(objectchange.diff(), {
+            'pre': {'description': 'Description 1'},
+            'post': {'description': 'Description 2'},
+        })
+
+
 class ChangelogPruneRetentionTestCase(TestCase):
     """Test suite for Changelog pruning retention settings."""
 
@@ -797,3 +899,23 @@ class ChangelogPruneRetentionTestCase(TestCase):
         self.assertNotIn(x_create, remaining)
         self.assertNotIn(x_update, remaining)
         self.assertIn(y_delete, remaining)
+
+    @override_settings(CHANGELOG_PRUNE_BATCH_SIZE=2)
+    def test_prune_in_batches(self):
+        ct = ContentType.objects.get_for_model(Site)
+
+        retention_days = 90
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        expired = cutoff - timedelta(days=1)
+        not_expired = cutoff + timedelta(days=1)
+
+        for obj_id in range(1, 6):
+            self._make_oc(ct=ct, obj_id=obj_id, action=ObjectChangeActionChoices.ACTION_UPDATE, ts=expired)
+        z_update = self._make_oc(ct=ct, obj_id=20, action=ObjectChangeActionChoices.ACTION_UPDATE, ts=not_expired)
+
+        # Expired records are deleted in three batches
+        with patch.object(ObjectChange.objects, 'filter', wraps=ObjectChange.objects.filter) as mock_filter:
+            self._run_prune(retention_days=retention_days, retain_create_last_update=False)
+        self.assertEqual(len([c for c in mock_filter.call_args_list if 'pk__in' in c.kwargs]), 3)
+
+        self.assertEqual(list(ObjectChange.objects.values_list('pk', flat=True)), [z_update])
@@ -1,3 +1,6 @@
+import hashlib
+import os
+import tempfile
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -33,6 +36,59 @@ class DataSourceIgnoreRulesTestCase(TestCase):
         self.assertFalse(ds._ignore('prod/script.py'))
 
 
+class DataSourceSyncTestCase(TestCase):
+
+    @staticmethod
+    def _write_file(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def test_sync(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_file(os.path.join(temp_dir, 'file1.txt'), 'File 1')
+            self._write_file(os.path.join(temp_dir, 'file2.txt'), 'File 2')
+            self._write_file(os.path.join(temp_dir, 'dir1', 'file3.txt'), 'File 3')
+
+            datasource = DataSource.objects.create(name='Data Source 1', type='local', source_url=temp_dir)
+            datasource.sync()
+
+            self.assertEqual(
+                sorted(datasource.datafiles.values_list('path', flat=True)),
+                ['dir1/file3.txt', 'file1.txt', 'file2.txt']
+            )
+            datafile = datasource.datafiles.get(path='dir1/file3.txt')
+            self.assertEqual(datafile.data_as_string, 'File 3')
+            self.assertEqual(datafile.size, 6)
+            self.assertEqual(datafile.hash, hashlib.sha256(b'File 3').hexdigest())
+
+            # Modify, delete, and add files
+            self._write_file(os.path.join(temp_dir, 'file1.txt'), 'File 1 (modified)')
+            os.remove(os.path.join(temp_dir, 'file2.txt'))
+            self._write_file(os.path.join(temp_dir, 'file4.txt'), 'File 4')
+            datasource.sync()
+
+            self.assertEqual(
+                sorted(datasource.datafiles.values_list('path', flat=True)),
+                ['dir1/file3.txt', 'file1.txt', 'file4.txt']
+            )
+            self.assertEqual(datasource.datafiles.get(path='file1.txt').data_as_string, 'File 1 (modified)')
+
+    def test_sync_skips_unmodified_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_file(os.path.join(temp_dir, 'file1.txt'), 'File 1')
+
+            datasource = DataSource.objects.create(name='Data Source 1', type='local', source_url=temp_dir)
+            datasource.sync()
+            last_updated = datasource.datafiles.get().last_updated
+
+            # Files which have not been modified since they were last synced are not hashed
+            with patch('core.models.data.hash_file') as mock_hash_file:
+                datasource.sync()
+            mock_hash_file.assert_not_called()
+            self.assertEqual(datasource.datafiles.get().last_updated, last_updated)
+
+
 class DataSourceChangeLoggingTestCase(TestCase):
 
     def test_password_added_on_create(self):
@@ -0,0 +1,69 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
+from core.partitions import (
+    _month_start,
+    convert_changelog_to_partitioned,
+    create_changelog_partitions,
+    drop_changelog_partitions,
+    get_changelog_partitions,
+    is_changelog_partitioned,
+)
+from dcim.models import Site
+
+
+class ChangelogPartitionTestCase(TestCase):
+
+    @staticmethod
+    def _make_oc(ts):
+        oc = ObjectChange.objects.create(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            changed_object_id=1,
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            user_name='test',
+            request_id=uuid.uuid4(),
+            object_repr='Object 1',
+        )
+        ObjectChange.objects.filter(pk=oc.pk).update(time=ts)
+        return oc.pk
+
+    def test_partition_changelog(self):
+        now = datetime.now(UTC)
+        old_pk = self._make_oc(now - timedelta(days=100))
+        new_pk = self._make_oc(now)
+
+        self.assertFalse(is_changelog_partitioned())
+        convert_changelog_to_partitioned(months_ahead=1)
+        self.assertTrue(is_changelog_partitioned())
+
+        # Existing records are retained, and new records receive subsequent IDs
+        self.assertEqual(set(ObjectChange.objects.values_list('pk', flat=True)), {old_pk, new_pk})
+        self._make_oc(now)
+        self.assertGreater(ObjectChange.objects.latest('pk').pk, new_pk)
+
+        # Partitions exist from the earliest record through next month
+        partitions = get_changelog_partitions()
+        self.assertLessEqual(partitions[0][1], now - timedelta(days=100))
+        self.assertGreater(partitions[-1][2], now + timedelta(days=28))
+        self.assertEqual(create_changelog_partitions(months_ahead=1), [])
+
+        # Records held by the default partition are moved to a newly created partition covering them
+        future_pk = self._make_oc(_month_start(now, 2))
+        created = create_changelog_partitions(months_ahead=2)
+        self.assertEqual(len(created), 1)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id FROM {connection.ops.quote_name(created[0])}')
+            self.assertEqual(cursor.fetchall(), [(future_pk,)])
+        self.assertTrue(ObjectChange.objects.filter(pk=future_pk).exists())
+
+        # Dropping expired partitions deletes only the records they contain
+        dropped = drop_changelog_partitions(before=now - timedelta(days=40))
+        self.assertEqual(dropped[0], partitions[0][0])
+        self.assertNotIn(old_pk, ObjectChange.objects.values_list('pk', flat=True))
+        self.assertTrue(ObjectChange.objects.filter(pk=new_pk).exists())
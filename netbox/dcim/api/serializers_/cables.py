@@ -92,7 +92,7 @@ class CablePathSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CablePath
-        fields = ['id', 'path', 'is_active', 'is_complete', 'is_split']
+        fields = ['id', 'path', 'is_active', 'is_complete', 'is_split', 'is_pending']
 
     @extend_schema_field(serializers.ListField)
     def get_path(self, obj):
@@ -12,6 +12,7 @@ from dcim import filtersets
 from dcim.constants import CABLE_TRACE_SVG_DEFAULT_WIDTH
 from dcim.models import *
 from dcim.svg import CableTraceSVG
+from dcim.tracing import batched_path_tracing
 from extras.api.mixins import ConfigContextQuerySetMixin, RenderConfigMixin
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
 from netbox.api.metadata import ContentTypeMetadata
@@ -77,6 +78,32 @@ class PathEndpointMixin:
         return Response(path)
 
 
+class BatchedPathTracingMixin:
+    """
+    Trace all cable paths affected by a write request together, once the request's changes have been made (see
+    batched_path_tracing()).
+    """
+    def perform_create(self, serializer):
+        with batched_path_tracing():
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        with batched_path_tracing():
+            super().perform_update(serializer)
+
+    def perform_destroy(self, instance):
+        with batched_path_tracing():
+            super().perform_destroy(instance)
+
+    def perform_bulk_update(self, objects, update_data, partial):
+        with batched_path_tracing():
+            return super().perform_bulk_update(objects, update_data, partial)
+
+    def perform_bulk_destroy(self, objects, changelog_messages=None):
+        with batched_path_tracing():
+            super().perform_bulk_destroy(objects, changelog_messages)
+
+
 class PassThroughPortMixin:
 
     @action(detail=True, url_path='paths')
@@ -573,7 +600,7 @@ class MACAddressViewSet(NetBoxModelViewSet):
 # Cables
 #
 
-class CableViewSet(NetBoxModelViewSet):
+class CableViewSet(BatchedPathTracingMixin, NetBoxModelViewSet):
     queryset = Cable.objects.prefetch_related('terminations__termination')
     serializer_class = serializers.CableSerializer
     filterset_class = filtersets.CableFilterSet
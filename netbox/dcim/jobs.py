@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.db import router, transaction
+from django.utils import timezone
+from django_pglocks import advisory_lock
+
+from netbox.constants import ADVISORY_LOCK_KEYS
+from netbox.jobs import JobRunner
+
+from .models import CablePath
+from .tracing import PathTraceBatch
+
+__all__ = (
+    'TraceCablePathsJob',
+)
+
+
+class TraceCablePathsJob(JobRunner):
+    """
+    Trace all cable paths affected by changes deferred per DEFER_CABLE_PATH_TRACING.
+    """
+    class Meta:
+        name = 'Cable path tracing'
+
+    # Delay before retrying the deferred changes after tracing them has failed
+    retry_delay = timedelta(minutes=1)
+
+    def run(self, *args, **kwargs):
+        # Jobs which overlap (e.g. a retry and a newly scheduled job) would otherwise share the changes being traced
+        with advisory_lock(ADVISORY_LOCK_KEYS['cable-path-tracing']):
+            self.trace_deferred()
+
+    def trace_deferred(self):
+        batch = PathTraceBatch.load_deferred()
+        if not batch:
+            PathTraceBatch.clear_deferred()
+            self.logger.info("No deferred cable path changes found")
+            return
+
+        affected_nodes = batch.retrace_nodes | batch.rebuild_nodes
+        self.logger.info(
+            f"Tracing cable paths for {len(batch.origins)} origins and {len(affected_nodes)} modified nodes"
+        )
+        try:
+            with transaction.atomic(using=router.db_for_write(CablePath)):
+                batch.flush()
+        except Exception:
+            # Retain the deferred changes, and schedule a job to trace them unless one is already pending
+            if PathTraceBatch.restore_deferred():
+                self.logger.warning("Cable path tracing failed; scheduling a retry")
+                self.enqueue(schedule_at=timezone.now() + self.retry_delay)
+            raise
+        PathTraceBatch.clear_deferred()
+        self.logger.info("Cable path tracing completed")
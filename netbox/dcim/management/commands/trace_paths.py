@@ -1,3 +1,5 @@
+import itertools
+
 from django.core.management.base import BaseCommand
 from django.core.management.color import no_style
 from django.db import connection
@@ -5,6 +7,7 @@ from django.db.models import Q
 
 from dcim.models import CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
 from dcim.signals import create_cablepaths
+from dcim.tracing import batched_path_tracing
 
 ENDPOINT_MODELS = (
     ConsolePort,
@@ -80,10 +83,16 @@ class Command(BaseCommand):
                 continue
             self.stdout.write(f'Retracing {origins_count} cabled {model._meta.verbose_name_plural}...')
             i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepaths([obj])
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
+            origins = origins.iterator(chunk_size=100)
+            while True:
+                # Trace paths in batches of 100 origins, writing each batch's paths in bulk
+                with batched_path_tracing(defer=False) as batch:
+                    for obj in itertools.islice(origins, 100):
+                        create_cablepaths([obj])
+                        i += 1
+                if not batch:
+                    break
+                self.draw_progress_bar(i * 100 / origins_count)
             self.draw_progress_bar(100)
             self.stdout.write(self.style.SUCCESS(f'\n  Retraced {i} {model._meta.verbose_name_plural}'))
 
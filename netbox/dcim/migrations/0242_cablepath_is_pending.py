@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dcim', '0241_nullify_empty_cable_end'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cablepath',
+            name='is_pending',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -737,7 +737,8 @@ class CablePath(models.Model):
 
     `is_active` is set to True only if every Cable within the path has a status of "connected". `is_complete` is True
     if the instance represents a complete end-to-end path from origin(s) to destination(s). `is_split` is True if the
-    path diverges across multiple cables.
+    path diverges across multiple cables. `is_pending` is True if a change affecting the path has been made, but the
+    path has not yet been retraced by a background job (see DEFER_CABLE_PATH_TRACING).
 
     `_nodes` retains a flattened list of all nodes within the path to enable simple filtering.
     """
@@ -757,6 +758,10 @@ class CablePath(models.Model):
         verbose_name=_('is split'),
         default=False
     )
+    is_pending = models.BooleanField(
+        verbose_name=_('is pending'),
+        default=False
+    )
     _nodes = PathField()
 
     _netbox_private = True
@@ -1152,6 +1157,7 @@ class CablePath(models.Model):
             self.is_complete = _new.is_complete
             self.is_active = _new.is_active
             self.is_split = _new.is_split
+            self.is_pending = False
             self.save()
         else:
             self.delete()
@@ -26,6 +26,7 @@ from netbox.config import ConfigItem
 from netbox.models import NestedGroupModel, OrganizationalModel, PrimaryModel
 from netbox.models.features import ContactsMixin, ImageAttachmentsMixin
 from netbox.models.mixins import WeightMixin
+from utilities.counters import batched_counter_updates
 from utilities.exceptions import AbortRequest
 from utilities.fields import ColorField, CounterCacheField
 from utilities.prefetch import get_prefetchable_fields
@@ -734,6 +735,11 @@ class Device(
 
     objects = ConfigContextModelQuerySet.as_manager()
 
+    config_context_dependencies = (
+        'site', 'site__region', 'site__group', 'location', 'rack', 'device_type', 'role', 'platform', 'cluster',
+        'cluster__type', 'cluster__group', 'tenant', 'tenant__group',
+    )
+
     clone_fields = (
         'device_type', 'role', 'tenant', 'platform', 'site', 'location', 'rack', 'face', 'status', 'airflow',
         'cluster', 'virtual_chassis',
@@ -1052,22 +1058,24 @@ class Device(
 
         # If this is a new Device, instantiate all the related components per the DeviceType definition
         if is_new:
-            self._instantiate_components(self.device_type.consoleporttemplates.all())
-            self._instantiate_components(self.device_type.consoleserverporttemplates.all())
-            self._instantiate_components(self.device_type.powerporttemplates.all())
-            self._instantiate_components(self.device_type.poweroutlettemplates.all())
-            self._instantiate_components(self.device_type.interfacetemplates.all())
-            self._instantiate_components(self.device_type.rearporttemplates.all())
-            self._instantiate_components(self.device_type.frontporttemplates.all())
-            # Replicate any front/rear port mappings from the DeviceType
-            create_port_mappings(self, self.device_type)
-            # Disable bulk_create to accommodate MPTT
-            self._instantiate_components(self.device_type.modulebaytemplates.all(), bulk_create=False)
-            self._instantiate_components(self.device_type.devicebaytemplates.all())
-            # Disable bulk_create to accommodate MPTT
-            self._instantiate_components(self.device_type.inventoryitemtemplates.all(), bulk_create=False)
-            # Interface bridges have to be set after interface instantiation
-            update_interface_bridges(self, self.device_type.interfacetemplates.all())
+            # Apply counter changes for all components together
+            with batched_counter_updates():
+                self._instantiate_components(self.device_type.consoleporttemplates.all())
+                self._instantiate_components(self.device_type.consoleserverporttemplates.all())
+                self._instantiate_components(self.device_type.powerporttemplates.all())
+                self._instantiate_components(self.device_type.poweroutlettemplates.all())
+                self._instantiate_components(self.device_type.interfacetemplates.all())
+                self._instantiate_components(self.device_type.rearporttemplates.all())
+                self._instantiate_components(self.device_type.frontporttemplates.all())
+                # Replicate any front/rear port mappings from the DeviceType
+                create_port_mappings(self, self.device_type)
+                # Disable bulk_create to accommodate MPTT
+                self._instantiate_components(self.device_type.modulebaytemplates.all(), bulk_create=False)
+                self._instantiate_components(self.device_type.devicebaytemplates.all())
+                # Disable bulk_create to accommodate MPTT
+                self._instantiate_components(self.device_type.inventoryitemtemplates.all(), bulk_create=False)
+                # Interface bridges have to be set after interface instantiation
+                update_interface_bridges(self, self.device_type.interfacetemplates.all())
 
         # Update Site and Rack assignment for any child Devices
         devices = Device.objects.filter(parent_bay__device=self)
@@ -15,6 +15,7 @@ from extras.models import CustomField
 from netbox.models import PrimaryModel
 from netbox.models.features import ImageAttachmentsMixin
 from netbox.models.mixins import WeightMixin
+from utilities.counters import batched_counter_updates
 from utilities.fields import CounterCacheField
 from utilities.jsonschema import validate_schema
 from utilities.string import title
@@ -353,6 +354,15 @@ class Module(TrackingModelMixin, PrimaryModel):
         if not is_new or (disable_replication and not adopt_components):
             return
 
+        # Apply counter changes for all components together
+        with batched_counter_updates():
+            self._instantiate_components(adopt_components, disable_replication)
+
+    def _instantiate_components(self, adopt_components, disable_replication):
+        """
+        Instantiate components for the module from its ModuleType's component templates, optionally adopting any
+        existing components on the device with matching names.
+        """
         # Iterate all component types
         for templates, component_attribute, component_model in [
             ("consoleporttemplates", "consoleports", ConsolePort),
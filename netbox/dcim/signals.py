@@ -2,7 +2,7 @@ import logging
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models import F, Q
+from django.db.models import F
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
@@ -37,6 +37,7 @@ from .models import (
 )
 from .models.cables import trace_paths
 from .search import DeviceIndex
+from .tracing import get_path_trace_batch
 from .utils import create_cablepaths, rebuild_paths
 
 COMPONENT_MODELS = (
@@ -197,11 +198,10 @@ def update_virtualchassis_member_search_cache(instance, created, raw=False, upda
     # The VC name is the only VC attribute cached on member Devices; skip saves that can't change it.
     if update_fields is not None and 'name' not in update_fields:
         return
-    search_backend.cache(
-        Device.objects.filter(virtual_chassis=instance).select_related('virtual_chassis'),
-        indexer=DeviceIndex,
-        remove_existing=True
-    )
+    devices = Device.objects.filter(virtual_chassis=instance).select_related('virtual_chassis')
+    # Defer caching until the end of any bulk operation or request, as members may also be saved along with the VC
+    if not search_backend.defer_caching(Device, devices):
+        search_backend.cache(devices, indexer=DeviceIndex, remove_existing=True)
 
 
 #
@@ -250,6 +250,10 @@ def retrace_cable_paths(instance, **kwargs):
     """
     When a Cable is deleted, check for and update its connected endpoints
     """
+    if (batch := get_path_trace_batch()) is not None:
+        batch.retrace_paths(instance)
+        return
+
     for cablepath in CablePath.objects.filter(_nodes__contains=instance):
         cablepath.retrace()
 
@@ -259,9 +263,11 @@ def update_passthrough_port_paths(instance, **kwargs):
     """
     When a PortMapping is created or deleted, retrace any CablePaths which traverse its front and/or rear ports.
     """
-    for cablepath in CablePath.objects.filter(
-        Q(_nodes__contains=instance.front_port) | Q(_nodes__contains=instance.rear_port)
-    ):
+    if (batch := get_path_trace_batch()) is not None:
+        batch.retrace_paths(instance.front_port, instance.rear_port)
+        return
+
+    for cablepath in CablePath.objects.filter(_nodes__overlap=[instance.front_port, instance.rear_port]):
         cablepath.retrace()
 
 
@@ -284,6 +290,11 @@ def nullify_connected_endpoints(instance, **kwargs):
     if Cable._is_being_deleted(instance.cable_id):
         return
 
+    if (batch := get_path_trace_batch()) is not None:
+        batch.remove_origin(instance.termination)
+        batch.retrace_paths(instance.cable)
+        return
+
     for cablepath in CablePath.objects.filter(_nodes__contains=instance.cable):
         # Remove the deleted CableTermination if it's one of the path's originating nodes
         if instance.termination in cablepath.origins:
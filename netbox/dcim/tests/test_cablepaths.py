@@ -1,8 +1,12 @@
+from unittest.mock import patch
+
 from circuits.models import *
 from dcim.choices import LinkStatusChoices
 from dcim.models import *
 from dcim.svg import CableTraceSVG
 from dcim.tests.utils import BaseCablePathTestCase
+from dcim.tracing import PathTraceBatch, batched_path_tracing
+from dcim.utils import object_to_path_node
 from utilities.exceptions import AbortRequest
 
 
@@ -3033,3 +3037,158 @@ class LegacyCablePathTestCase(BaseCablePathTestCase):
         self.assertEqual(CablePath.objects.count(), 1)
         interface.refresh_from_db()
         self.assertPathIsSet(interface, path)
+
+
+class BatchedCablePathTestCase(BaseCablePathTestCase):
+    """
+    Test the tracing of CablePaths deferred within a batched_path_tracing() block.
+    """
+    def test_create_paths_in_batch(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1')
+        frontport1 = FrontPort.objects.create(device=self.device, name='Front Port 1')
+        PortMapping.objects.create(
+            device=self.device,
+            front_port=frontport1,
+            front_port_position=1,
+            rear_port=rearport1,
+            rear_port_position=1
+        )
+
+        with batched_path_tracing():
+            cable1 = Cable(a_terminations=[interface1], b_terminations=[frontport1])
+            cable1.save()
+            cable2 = Cable(a_terminations=[rearport1], b_terminations=[interface2])
+            cable2.save()
+
+            # No paths are traced until the batch exits
+            self.assertEqual(CablePath.objects.count(), 0)
+
+        path1 = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport1, cable2, interface2),
+            is_complete=True,
+            is_active=True
+        )
+        path2 = self.assertPathExists(
+            (interface2, cable2, rearport1, frontport1, cable1, interface1),
+            is_complete=True,
+            is_active=True
+        )
+        self.assertEqual(CablePath.objects.count(), 2)
+        interface1.refresh_from_db()
+        interface2.refresh_from_db()
+        self.assertPathIsSet(interface1, path1)
+        self.assertPathIsSet(interface2, path2)
+
+        # Delete cable 2; the path from interface 1 is retraced in place
+        with batched_path_tracing():
+            cable2.delete()
+        path1_retraced = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport1),
+            is_complete=False
+        )
+        self.assertEqual(path1_retraced.pk, path1.pk)
+        self.assertEqual(CablePath.objects.count(), 1)
+        interface1.refresh_from_db()
+        interface2.refresh_from_db()
+        self.assertPathIsSet(interface1, path1)
+        self.assertPathIsNotSet(interface2)
+
+    def test_repatch_port_mappings_in_batch(self):
+        """
+        [IF1] --C1-- [FP1] [RP1] --C2-- [IF3]
+                     [FP2] [RP2] --C3-- [IF4]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface3 = Interface.objects.create(device=self.device, name='Interface 3')
+        interface4 = Interface.objects.create(device=self.device, name='Interface 4')
+        frontport1 = FrontPort.objects.create(device=self.device, name='Front Port 1')
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1')
+        rearport2 = RearPort.objects.create(device=self.device, name='Rear Port 2')
+        mapping = PortMapping.objects.create(
+            device=self.device,
+            front_port=frontport1,
+            front_port_position=1,
+            rear_port=rearport1,
+            rear_port_position=1
+        )
+        cable1 = Cable(a_terminations=[interface1], b_terminations=[frontport1])
+        cable1.save()
+        cable2 = Cable(a_terminations=[rearport1], b_terminations=[interface3])
+        cable2.save()
+        cable3 = Cable(a_terminations=[rearport2], b_terminations=[interface4])
+        cable3.save()
+        path1 = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport1, cable2, interface3),
+            is_complete=True
+        )
+
+        # Re-patch front port 1 to rear port 2
+        with batched_path_tracing():
+            mapping.delete()
+            PortMapping.objects.create(
+                device=self.device,
+                front_port=frontport1,
+                front_port_position=1,
+                rear_port=rearport2,
+                rear_port_position=1
+            )
+
+        path1_retraced = self.assertPathExists(
+            (interface1, cable1, frontport1, rearport2, cable3, interface4),
+            is_complete=True
+        )
+        self.assertEqual(path1_retraced.pk, path1.pk)
+        self.assertPathExists(
+            (interface4, cable3, rearport2, frontport1, cable1, interface1),
+            is_complete=True
+        )
+        self.assertPathExists(
+            (interface3, cable2, rearport1),
+            is_complete=False
+        )
+
+    def test_defer_paths(self):
+        """
+        [IF1] --C1-- [IF2]
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        cable1 = Cable(a_terminations=[interface1], b_terminations=[interface2])
+        cable1.save()
+        path1 = self.assertPathExists((interface1, cable1, interface2), is_complete=True, is_pending=False)
+        cable1_node = object_to_path_node(cable1)
+
+        # Discard any changes left behind by previous tests
+        PathTraceBatch.load_deferred()
+        PathTraceBatch.clear_deferred()
+
+        with patch('dcim.jobs.TraceCablePathsJob.enqueue') as enqueue:
+            with self.captureOnCommitCallbacks(execute=True):
+                with batched_path_tracing(defer=True):
+                    cable1.delete()
+        enqueue.assert_called_once()
+
+        # The affected paths are flagged as pending until the deferred changes have been traced
+        path1.refresh_from_db()
+        self.assertTrue(path1.is_pending)
+        self.assertEqual(CablePath.objects.filter(is_pending=True).count(), 2)
+
+        # Deferred changes are retained if tracing fails, and a new job must be scheduled unless one already has been
+        batch = PathTraceBatch.load_deferred()
+        self.assertIn(cable1_node, batch.retrace_nodes)
+        self.assertTrue(PathTraceBatch.restore_deferred())
+        self.assertFalse(PathTraceBatch.restore_deferred())
+        batch = PathTraceBatch.load_deferred()
+        self.assertIn(cable1_node, batch.retrace_nodes)
+
+        batch.flush()
+        PathTraceBatch.clear_deferred()
+        self.assertEqual(CablePath.objects.count(), 0)
+
+        # Deferred changes are consumed only once
+        self.assertFalse(PathTraceBatch.load_deferred())
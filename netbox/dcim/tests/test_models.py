@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import ProtectedError
 from django.db.models.signals import post_save
 from django.test import TestCase, tag
@@ -2313,6 +2314,48 @@ class CableTerminationTestCase(TestCase):
             cable_termination.cache_related_objects()
 
 
+class CablePathTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        device = Device.objects.create(device_type=device_type, role=role, name='Device 1', site=site)
+        interfaces = Interface.objects.bulk_create([
+            Interface(device=device, name=f'eth{i}', type=InterfaceTypeChoices.TYPE_1GE_FIXED) for i in range(4)
+        ])
+        cls.cable1 = Cable(a_terminations=[interfaces[0]], b_terminations=[interfaces[1]])
+        cls.cable1.save()
+        cls.cable2 = Cable(a_terminations=[interfaces[2]], b_terminations=[interfaces[3]])
+        cls.cable2.save()
+
+    def test_nodes_contains_lookup(self):
+        self.assertEqual(CablePath.objects.filter(_nodes__contains=self.cable1).count(), 2)
+        self.assertEqual(CablePath.objects.filter(_nodes__contains=self.cable2).count(), 2)
+
+    def test_nodes_overlap_lookup(self):
+        self.assertEqual(CablePath.objects.filter(_nodes__overlap=[self.cable1]).count(), 2)
+        self.assertEqual(CablePath.objects.filter(_nodes__overlap=[self.cable1, self.cable2]).count(), 4)
+        # Compiled path nodes are accepted as well
+        cable_ct = ObjectType.objects.get_for_model(Cable)
+        self.assertEqual(CablePath.objects.filter(_nodes__overlap=[f'{cable_ct.pk}:{self.cable2.pk}']).count(), 2)
+
+    def test_node_lookups_use_index(self):
+        """
+        Node lookups must be able to use the GIN index on _nodes. (Sequential scans are disabled, as the planner
+        would otherwise prefer them on a table this small.)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        for queryset in (
+            CablePath.objects.filter(_nodes__contains=self.cable1),
+            CablePath.objects.filter(_nodes__overlap=[self.cable1, self.cable2]),
+        ):
+            self.assertIn('dcim_cablep__nodes_b23b96_gin', queryset.explain())
+
+
 class VirtualDeviceContextTestCase(TestCase):
 
     @classmethod
@@ -0,0 +1,392 @@
+import itertools
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import BigIntegerField, Case, Value, When
+from django_rq.queues import get_connection
+
+from core.models import ObjectType
+from dcim.exceptions import UnsupportedCablePath
+from dcim.utils import decompile_path_node, object_to_path_node
+from netbox.bulk import register_bulk_context
+from netbox.constants import RQ_QUEUE_DEFAULT
+from utilities.exceptions import AbortRequest
+
+__all__ = (
+    'PathTraceBatch',
+    'batched_path_tracing',
+    'get_path_trace_batch',
+)
+
+logger = logging.getLogger('netbox.dcim.cable')
+
+# Redis keys under which deferred path changes are coalesced until traced by TraceCablePathsJob
+DEFERRED_TRACE_KEYS = {
+    'origins': 'netbox:dcim:cablepaths:origins',
+    'retrace_nodes': 'netbox:dcim:cablepaths:retrace',
+    'rebuild_nodes': 'netbox:dcim:cablepaths:rebuild',
+    'removed_origins': 'netbox:dcim:cablepaths:removed',
+}
+DEFERRED_TRACE_SCHEDULED_KEY = 'netbox:dcim:cablepaths:scheduled'
+
+# Holds the PathTraceBatch (if any) collecting path changes for the current thread
+_local = threading.local()
+
+
+def get_path_trace_batch():
+    """
+    Return the PathTraceBatch collecting CablePath changes for the current thread, or None if path changes are being
+    applied immediately.
+    """
+    return getattr(_local, 'batch', None)
+
+
+@register_bulk_context
+@contextmanager
+def batched_path_tracing(defer=None):
+    """
+    Defer all CablePath tracing triggered within the block until it exits. Rather than retracing each affected path
+    as every cable, termination, or port mapping is saved, the affected nodes and origins are collected and resolved
+    together: every affected path is traced exactly once, and the resulting CablePaths are written back in bulk. The
+    block runs inside a transaction, so the paths are committed along with the changes that produced them.
+
+    If `defer` is True, the collected changes are instead handed off to a background job for tracing (see
+    PathTraceBatch.defer()). It defaults to the value of the DEFER_CABLE_PATH_TRACING setting.
+
+    Nested invocations join the outermost batch.
+    """
+    from dcim.models import CablePath
+
+    if (batch := get_path_trace_batch()) is not None:
+        yield batch
+        return
+
+    batch = _local.batch = PathTraceBatch()
+    try:
+        with transaction.atomic(using=router.db_for_write(CablePath)):
+            yield batch
+            _local.batch = None
+            if settings.DEFER_CABLE_PATH_TRACING if defer is None else defer:
+                batch.defer()
+            else:
+                batch.flush()
+    finally:
+        _local.batch = None
+
+
+class PathTraceBatch:
+    """
+    Collects the CablePath changes resulting from a set of cable, termination, and port mapping changes so that they
+    can be resolved together by flush().
+
+    Nodes are recorded in their compiled (<ContentType ID>:<Object ID>) form and resolved to objects only when the
+    batch is flushed, so tracing always operates on the final state of each object.
+    """
+    def __init__(self):
+        # Groups of origin nodes from which new CablePaths are to be traced
+        self.origins = {}
+        # Existing CablePaths traversing any of these nodes will be retraced from their origins
+        self.retrace_nodes = set()
+        # Existing CablePaths traversing any of these nodes will be deleted and recreated from their origins
+        self.rebuild_nodes = set()
+        # Nodes which are no longer valid origins for any existing CablePath
+        self.removed_origins = set()
+
+    def __bool__(self):
+        return bool(self.origins or self.retrace_nodes or self.rebuild_nodes)
+
+    def create_paths(self, objects):
+        """
+        Queue the creation of CablePaths originating from the specified objects (see create_cablepaths()).
+        """
+        nodes = tuple(object_to_path_node(obj) for obj in objects)
+        if nodes:
+            self.origins[frozenset(nodes)] = nodes
+
+    def retrace_paths(self, *objects):
+        """
+        Queue the retracing of all CablePaths which traverse any of the specified objects.
+        """
+        self.retrace_nodes.update(object_to_path_node(obj) for obj in objects)
+
+    def rebuild_paths(self, *objects):
+        """
+        Queue the rebuilding of all CablePaths which traverse any of the specified objects (see rebuild_paths()).
+        """
+        self.rebuild_nodes.update(object_to_path_node(obj) for obj in objects)
+
+    def remove_origin(self, obj):
+        """
+        Record that the specified object no longer originates any existing CablePath (e.g. because its cable
+        termination has been deleted).
+        """
+        self.removed_origins.add(object_to_path_node(obj))
+
+    def defer(self):
+        """
+        Hand off the changes recorded in this batch to be traced by TraceCablePathsJob, flagging any existing paths
+        they affect as pending retrace. Deferred changes are coalesced in Redis by node, so changes made by multiple
+        requests before the job runs are traced together, and each affected path is traced only once.
+        """
+        from dcim.jobs import TraceCablePathsJob
+        from dcim.models import CablePath
+
+        if not self:
+            return
+
+        if affected_nodes := self.retrace_nodes | self.rebuild_nodes:
+            CablePath.objects.filter(_nodes__overlap=list(affected_nodes)).update(is_pending=True)
+
+        members = {
+            'origins': [','.join(nodes) for nodes in self.origins.values()],
+            'retrace_nodes': list(self.retrace_nodes),
+            'rebuild_nodes': list(self.rebuild_nodes),
+            'removed_origins': list(self.removed_origins),
+        }
+
+        def enqueue():
+            connection = get_connection(RQ_QUEUE_DEFAULT)
+            with connection.pipeline() as pipe:
+                for attr, key in DEFERRED_TRACE_KEYS.items():
+                    if members[attr]:
+                        pipe.sadd(key, *members[attr])
+                pipe.set(DEFERRED_TRACE_SCHEDULED_KEY, 1, nx=True)
+                scheduled = pipe.execute()[-1]
+            # Enqueue a new job only if one has not already been scheduled to pick up these changes
+            if scheduled:
+                TraceCablePathsJob.enqueue()
+
+        # Wait until the changes which prompted the retrace have been committed
+        transaction.on_commit(enqueue, using=router.db_for_write(CablePath))
+        logger.debug(f"Deferred tracing of cable paths affected by {len(affected_nodes)} nodes")
+
+    @classmethod
+    def load_deferred(cls):
+        """
+        Return all deferred changes as a new PathTraceBatch. The changes are moved aside to processing keys in Redis
+        (along with any left behind by a previous attempt which did not complete), where they remain until removed by
+        clear_deferred() once they have been traced successfully, or returned by restore_deferred() on failure.
+
+        The processing keys are shared, so the caller must hold the cable path tracing advisory lock until the changes
+        have been cleared or restored.
+        """
+        connection = get_connection(RQ_QUEUE_DEFAULT)
+
+        # Clear the scheduled flag first, so that changes deferred from this point on schedule a new job
+        with connection.pipeline() as pipe:
+            pipe.delete(DEFERRED_TRACE_SCHEDULED_KEY)
+            for key in DEFERRED_TRACE_KEYS.values():
+                processing_key = f'{key}:processing'
+                pipe.sunionstore(processing_key, processing_key, key)
+                pipe.delete(key)
+                pipe.smembers(processing_key)
+            results = pipe.execute()[3::3]
+
+        batch = cls()
+        for attr, members in zip(DEFERRED_TRACE_KEYS, results):
+            members = [m.decode() if isinstance(m, bytes) else m for m in members]
+            if attr == 'origins':
+                for origin in members:
+                    nodes = tuple(origin.split(','))
+                    batch.origins[frozenset(nodes)] = nodes
+            else:
+                getattr(batch, attr).update(members)
+
+        return batch
+
+    @staticmethod
+    def clear_deferred():
+        """
+        Discard the changes returned by load_deferred(), once they have been traced.
+        """
+        connection = get_connection(RQ_QUEUE_DEFAULT)
+        connection.delete(*[f'{key}:processing' for key in DEFERRED_TRACE_KEYS.values()])
+
+    @staticmethod
+    def restore_deferred():
+        """
+        Return the changes loaded by load_deferred() to the deferred changes (e.g. because tracing them has failed),
+        to be picked up by the next TraceCablePathsJob. Returns True if no job has been scheduled since the changes
+        were loaded, in which case the caller is responsible for scheduling one.
+        """
+        connection = get_connection(RQ_QUEUE_DEFAULT)
+        with connection.pipeline() as pipe:
+            for key in DEFERRED_TRACE_KEYS.values():
+                processing_key = f'{key}:processing'
+                pipe.sunionstore(key, key, processing_key)
+                pipe.delete(processing_key)
+            pipe.set(DEFERRED_TRACE_SCHEDULED_KEY, 1, nx=True)
+            return bool(pipe.execute()[-1])
+
+    @staticmethod
+    def _resolve_nodes(nodes):
+        """
+        Resolve an iterable of compiled path nodes to their objects with one query per object type. Returns a
+        dictionary mapping each node to its object; nodes for objects which no longer exist are omitted.
+        """
+        pks_by_type = defaultdict(set)
+        for node in nodes:
+            ct_id, object_id = decompile_path_node(node)
+            pks_by_type[ct_id].add(object_id)
+
+        resolved = {}
+        for ct_id, pks in pks_by_type.items():
+            model = ObjectType.objects.get_for_id(ct_id).model_class()
+            for pk, obj in model.objects.in_bulk(pks).items():
+                resolved[f'{ct_id}:{pk}'] = obj
+        return resolved
+
+    def flush(self):
+        """
+        Retrace, rebuild, and create all CablePaths affected by the recorded changes, then write the results to the
+        database in bulk.
+        """
+        from dcim.models import CablePath, PathEndpoint
+
+        if not self:
+            return
+
+        # Find all existing CablePaths affected by the recorded changes with a single query
+        affected_nodes = self.retrace_nodes | self.rebuild_nodes
+        existing_paths = list(CablePath.objects.filter(_nodes__overlap=list(affected_nodes))) if affected_nodes else []
+
+        # Determine the origin nodes of every path to be traced
+        retrace = []          # (CablePath, origin nodes)
+        rebuild_origins = []  # Origin nodes of paths to be deleted & recreated
+        delete_pks = set()
+        stale_origins = defaultdict(set)  # CablePath PK -> origin nodes to be detached from it
+        for cablepath in existing_paths:
+            origins = [node for node in cablepath.path[0] if node not in self.removed_origins]
+            if removed := set(cablepath.path[0]) - set(origins):
+                stale_origins[cablepath.pk].update(removed)
+            if self.rebuild_nodes.intersection(cablepath._nodes):
+                delete_pks.add(cablepath.pk)
+                rebuild_origins.append(origins)
+            else:
+                retrace.append((cablepath, origins))
+
+        # Resolve all origin nodes to objects in bulk
+        all_origins = set(node for nodes in self.origins.values() for node in nodes)
+        all_origins.update(node for nodes in rebuild_origins for node in nodes)
+        all_origins.update(node for _, nodes in retrace for node in nodes)
+        resolved = self._resolve_nodes(all_origins)
+
+        def resolve(nodes):
+            return [resolved[node] for node in nodes if node in resolved]
+
+        try:
+            # Retrace existing paths. A retraced path keeps its PK.
+            existing_keys = set()
+            changed = []
+            unchanged = []
+            for cablepath, origins in retrace:
+                existing_keys.add(frozenset(origins))
+                new = CablePath.from_origin(resolve(origins))
+                if new is None:
+                    delete_pks.add(cablepath.pk)
+                elif (
+                    new.path != cablepath.path or
+                    new.is_active != cablepath.is_active or
+                    new.is_complete != cablepath.is_complete or
+                    new.is_split != cablepath.is_split
+                ):
+                    new.pk = cablepath.pk
+                    changed.append(new)
+                else:
+                    unchanged.append(cablepath)
+
+            # Trace new paths (grouping origins by cable connector, as create_cablepaths() does). Any origin set
+            # which already originates a path being retraced has been handled above.
+            for nodes in [*self.origins.values(), *rebuild_origins]:
+                if frozenset(nodes) in existing_keys:
+                    continue
+                by_connector = defaultdict(list)
+                for obj in resolve(nodes):
+                    by_connector[obj.cable_connector].append(obj)
+                for objects in by_connector.values():
+                    if new := CablePath.from_origin(objects):
+                        changed.append(new)
+        except UnsupportedCablePath as e:
+            raise AbortRequest(e)
+
+        # Detach origins which have been removed from existing paths
+        for pk, nodes in stale_origins.items():
+            self._update_origins(nodes, dict.fromkeys(nodes), path_pk=pk)
+
+        # Delete paths which no longer exist (clearing any back-references from their origins first)
+        if delete_pks:
+            for model in self._origin_models(existing_paths, delete_pks):
+                model.objects.filter(_path__in=delete_pks).update(_path=None)
+            CablePath.objects.filter(pk__in=delete_pks).delete()
+
+        # Write all new and modified paths with a single upsert
+        for cp in changed:
+            cp._nodes = list(itertools.chain(*cp.path))
+        if changed:
+            CablePath.objects.bulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=['pk'],
+                update_fields=['path', '_nodes', 'is_active', 'is_complete', 'is_split', 'is_pending'],
+            )
+        if unchanged:
+            CablePath.objects.filter(pk__in=[cp.pk for cp in unchanged], is_pending=True).update(is_pending=False)
+        logger.debug(
+            f"Flushed cable path batch: {len(changed)} paths written, {len(unchanged)} unchanged, "
+            f"{len(delete_pks)} deleted"
+        )
+
+        # Record a reference to each CablePath on its originating PathEndpoint(s)
+        back_references = {}
+        for cp in [*changed, *unchanged]:
+            for node in cp.path[0]:
+                back_references[node] = cp.pk
+        self._update_origins(back_references.keys(), back_references, endpoint_class=PathEndpoint)
+
+    @staticmethod
+    def _origin_models(cablepaths, pks):
+        """
+        Return the set of PathEndpoint models originating any of the given CablePaths.
+        """
+        from dcim.models import PathEndpoint
+
+        models = set()
+        for cablepath in cablepaths:
+            if cablepath.pk in pks and cablepath.path:
+                model = cablepath.origin_type.model_class()
+                if issubclass(model, PathEndpoint):
+                    models.add(model)
+        return models
+
+    @staticmethod
+    def _update_origins(nodes, values, path_pk=None, endpoint_class=None):
+        """
+        Set the `_path` reference on each of the given origin nodes to the value mapped to it, issuing a single UPDATE
+        per origin model. If `path_pk` is given, only origins currently referencing that path are updated.
+        """
+        from dcim.models import PathEndpoint
+
+        endpoint_class = endpoint_class or PathEndpoint
+        pks_by_type = defaultdict(list)
+        for node in nodes:
+            ct_id, object_id = decompile_path_node(node)
+            pks_by_type[ct_id].append((node, object_id))
+
+        for ct_id, entries in pks_by_type.items():
+            model = ObjectType.objects.get_for_id(ct_id).model_class()
+            if not issubclass(model, endpoint_class):
+                continue
+            queryset = model.objects.filter(pk__in=[pk for _, pk in entries])
+            if path_pk is not None:
+                queryset = queryset.filter(_path=path_pk)
+            if all(values[node] is None for node, _ in entries):
+                queryset.update(_path=None)
+            else:
+                queryset.update(_path=Case(
+                    *[When(pk=pk, then=Value(values[node])) for node, pk in entries],
+                    output_field=BigIntegerField(),
+                ))
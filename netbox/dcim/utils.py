@@ -93,6 +93,12 @@ def create_cablepaths(objects):
     :param objects: Iterable of cabled objects (e.g. Interfaces)
     """
     from dcim.models import CablePath
+    from dcim.tracing import get_path_trace_batch
+
+    # Defer to the active batch (if any)
+    if (batch := get_path_trace_batch()) is not None:
+        batch.create_paths(objects)
+        return
 
     # Arrange objects by cable connector. All objects with a null connector are grouped together.
     origins = defaultdict(list)
@@ -109,14 +115,20 @@ def rebuild_paths(terminations):
     Rebuild all CablePaths which traverse the specified nodes.
     """
     from dcim.models import CablePath
+    from dcim.tracing import get_path_trace_batch
+
+    # Defer to the active batch (if any)
+    if (batch := get_path_trace_batch()) is not None:
+        batch.rebuild_paths(*terminations)
+        return
 
-    for obj in terminations:
-        cable_paths = CablePath.objects.filter(_nodes__contains=obj)
+    # Find all paths traversing any of the nodes with a single (indexed) query
+    cable_paths = CablePath.objects.filter(_nodes__overlap=list(terminations))
 
-        with transaction.atomic(using=router.db_for_write(CablePath)):
-            for cp in cable_paths:
-                cp.delete()
-                create_cablepaths(cp.origins)
+    with transaction.atomic(using=router.db_for_write(CablePath)):
+        for cp in cable_paths:
+            cp.delete()
+            create_cablepaths(cp.origins)
 
 
 def update_interface_bridges(device, interface_templates, module=None):
@@ -191,6 +203,8 @@ def reconcile_port_mappings(mapping_model, parent_field, parent, desired):
             for the opposite-port FK, e.g. {'front_port_position': 1, 'rear_port_id': 5,
             'rear_port_position': 2}. save() derives device/device_type/module_type from the front port.
     """
+    from dcim.tracing import batched_path_tracing
+
     key_field = f'{parent_field}_position'
     other_field = 'rear_port' if parent_field == 'front_port' else 'front_port'
     value_fields = (f'{other_field}_id', f'{other_field}_position')
@@ -203,7 +217,9 @@ def reconcile_port_mappings(mapping_model, parent_field, parent, desired):
 
     desired_by_key = {d[key_field]: d for d in desired}
 
-    with transaction.atomic(using=router.db_for_write(mapping_model)):
+    # Each mapping created or deleted below triggers a retrace of the paths traversing its ports; batch these so
+    # that re-patching a port retraces each affected path only once.
+    with batched_path_tracing(), transaction.atomic(using=router.db_for_write(mapping_model)):
         # Lock the parent's existing mappings for the duration of the reconcile. Two requests editing
         # the same port would otherwise read the same snapshot and race, the second colliding on a
         # unique constraint when it recreates rows the first has already committed.
@@ -55,6 +55,7 @@ from .choices import DeviceFaceChoices, InterfaceModeChoices
 from .models import *
 from .models.device_components import PortMapping
 from .object_actions import BulkAddComponents, BulkDisconnect
+from .tracing import batched_path_tracing
 from .ui import panels
 
 CABLE_TERMINATION_TYPES = {
@@ -4396,6 +4397,11 @@ class CableBulkImportView(generic.BulkImportView):
     queryset = Cable.objects.all()
     model_form = forms.CableImportForm
 
+    def create_and_update_objects(self, form, request):
+        # Trace the paths affected by all imported cables together
+        with batched_path_tracing():
+            return super().create_and_update_objects(form, request)
+
 
 @register_model_view(Cable, 'bulk_edit', path='edit', detail=False)
 class CableBulkEditView(generic.BulkEditView):
@@ -4407,6 +4413,11 @@ class CableBulkEditView(generic.BulkEditView):
     table = tables.CableTable
     form = forms.CableBulkEditForm
 
+    def _update_objects(self, form, request):
+        # Retrace the paths affected by all modified cables together
+        with batched_path_tracing():
+            return super()._update_objects(form, request)
+
 
 @register_model_view(Cable, 'bulk_rename', path='rename', detail=False)
 class CableBulkRenameView(generic.BulkRenameView):
@@ -14,6 +14,37 @@ AND = 'and'
 OR = 'or'
 
 
+class Accessor:
+    """
+    A callable which retrieves the value at a dotted key path (e.g. "status.value") from a dictionary. Where a key
+    resolves to a list, the remainder of the path is applied to each of its items.
+
+    :param attr: The dotted key path
+    """
+    __slots__ = ('keys',)
+
+    def __init__(self, attr):
+        self.keys = tuple(attr.split('.'))
+
+    def __call__(self, data):
+        value = data
+        for key in self.keys:
+            if isinstance(value, list):
+                value = [operator.getitem(item or {}, key) for item in value]
+            else:
+                value = operator.getitem(value or {}, key)
+        return value
+
+
+@functools.cache
+def get_accessor(attr):
+    """
+    Return the Accessor for the given key path. Accessors are shared among all conditions which evaluate the same
+    attribute.
+    """
+    return Accessor(attr)
+
+
 def is_ruleset(data):
     """
     Determine whether the given dictionary looks like a rule set.
@@ -70,18 +101,28 @@ class Condition:
         self.op = op
         self.eval_func = getattr(self, f'eval_{op}')
         self.negate = negate
+        self.accessor = get_accessor(attr)
+
+        # Compile regular expressions once, rather than upon each evaluation
+        if op == self.REGEX:
+            try:
+                self.regex = re.compile(value)
+            except re.error as e:
+                raise ValueError(_("Invalid regular expression: {value} ({error})").format(value=value, error=e))
+
+    @property
+    def fields(self):
+        """
+        Return the name of the top-level attribute evaluated by the condition (as a set).
+        """
+        return {self.accessor.keys[0]}
 
     def eval(self, data):
         """
         Evaluate the provided data to determine whether it matches the condition.
         """
-        def _get(obj, key):
-            if isinstance(obj, list):
-                return [operator.getitem(item or {}, key) for item in obj]
-            return operator.getitem(obj or {}, key)
-
         try:
-            value = functools.reduce(_get, self.attr.split('.'), data)
+            value = self.accessor(data)
         except KeyError:
             raise InvalidCondition(f"Invalid key path: {self.attr}")
         try:
@@ -126,7 +167,7 @@ class Condition:
     # Regular expressions
 
     def eval_regex(self, value):
-        return re.match(self.value, value) is not None
+        return self.regex.match(value) is not None
 
 
 class ConditionSet:
@@ -161,6 +202,13 @@ class ConditionSet:
             except TypeError:
                 raise ValueError(_("Incorrect key(s) informed. Please check documentation."))
 
+    @property
+    def fields(self):
+        """
+        Return the set of top-level attributes evaluated by the conditions within this set.
+        """
+        return set().union(*(d.fields for d in self.conditions))
+
     def eval(self, data):
         """
         Evaluate the provided data to determine whether it matches this set of conditions.
@@ -35,6 +35,8 @@ SCRIPT_MODULE_NAME_PREFIX = '_netbox_script_module_'
 
 # Webhooks
 HTTP_CONTENT_TYPE_JSON = 'application/json'
+WEBHOOK_BATCH_SIZE_MAX = 1000
+WEBHOOK_BATCH_LINGER_MAX = 3600
 
 WEBHOOK_EVENT_TYPES = {
     # Map registered event types to public webhook "event" equivalents
@@ -1,7 +1,13 @@
 import logging
+import pickle
+import uuid
+import weakref
 from collections import UserDict, defaultdict
+from copy import copy
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
 from django.utils import timezone
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext as _
@@ -11,6 +17,7 @@ from core.events import *
 from core.models import ObjectType
 from netbox.config import get_config
 from netbox.constants import RQ_QUEUE_DEFAULT
+from netbox.context import query_cache
 from netbox.models.features import has_feature
 from utilities.api import get_serializer_for_model
 from utilities.request import copy_safe_request
@@ -19,9 +26,32 @@ from utilities.serialization import serialize_object
 
 from .choices import EventRuleActionChoices
 from .models import EventRule
+from .webhooks import enqueue_webhook_batch
 
 logger = logging.getLogger('netbox.events_processor')
 
+# The built-in events pipeline, which processes EventRules
+DEFAULT_EVENTS_PIPELINE = 'extras.events.process_event_queue'
+
+# Redis key under which the events queued by a request are held once spilled (see spill_events())
+EVENTS_SPILL_KEY = 'netbox:events:{}'
+
+# The number of spilled events processed at once
+EVENTS_SPILL_CHUNK_SIZE = 1000
+
+# The time (in seconds) for which spilled events are retained after they were last added to (e.g. should the request
+# be aborted before they can be processed or discarded)
+EVENTS_SPILL_TIMEOUT = 86400
+
+# Cache key holding the current version of the set of EventRules (see get_event_rules_version())
+EVENT_RULES_VERSION_KEY = 'netbox:extras:eventrules:version'
+
+# In-memory index of enabled event rules (see get_event_rules_index())
+_event_rules_index = None
+
+# The outermost atomic blocks of any transactions with uncommitted changes to EventRules
+_event_rules_pending = weakref.WeakSet()
+
 
 class EventContext(UserDict):
     """
@@ -44,12 +74,16 @@ class EventContext(UserDict):
         if 'object' in self:
             self._serialization_source = super().__getitem__('object')
 
+        # Partial serializations of the object, keyed by the included fields
+        self._partial_data = {}
+
     def refresh_serialization_source(self, instance):
         """
         Point lazy serialization at a fresher instance, invalidating any
         already-materialized ``data``.
         """
         self._serialization_source = instance
+        self._partial_data = {}
         # UserDict.__contains__ checks the backing dict directly, so `in`
         # does not trigger __getitem__'s lazy serialization.
         if 'data' in self:
@@ -63,6 +97,20 @@ class EventContext(UserDict):
         super().__setitem__('data', serialize_for_event(instance))
         self._serialization_source = None
 
+    def get_data(self, fields=None):
+        """
+        Return the serialized representation of the object. If a subset of fields is specified (and the complete
+        payload has not already been materialized), only those fields are serialized.
+        """
+        if not fields or 'data' in self:
+            return self['data']
+
+        fields = tuple(sorted(fields))
+        if fields not in self._partial_data:
+            source = self._serialization_source or super().__getitem__('object')
+            self._partial_data[fields] = serialize_for_event(source, fields=fields)
+        return self._partial_data[fields]
+
     def __getitem__(self, item):
         if item == 'data' and 'data' not in self:
             # Materialize the payload only when an event consumer asks for it.
@@ -76,15 +124,19 @@ class EventContext(UserDict):
         return super().__getitem__(item)
 
 
-def serialize_for_event(instance):
+def serialize_for_event(instance, fields=None):
     """
-    Return a serialized representation of the given instance suitable for use in a queued event.
+    Return a serialized representation of the given instance suitable for use in a queued event. If specified, only
+    the given fields are included.
     """
     serializer_class = get_serializer_for_model(instance.__class__)
     serializer_context = {
         'request': None,
     }
-    serializer = serializer_class(instance, context=serializer_context)
+    if fields:
+        serializer = serializer_class(instance, context=serializer_context, fields=fields)
+    else:
+        serializer = serializer_class(instance, context=serializer_context)
 
     return serializer.data
 
@@ -161,13 +213,201 @@ def enqueue_event(queue, instance, request, event_type):
 
     # For delete events, eagerly serialize the payload before the row is gone.
     # This covers both first-time enqueues and coalesced update→delete promotions.
-    if event_type == OBJECT_DELETED:
+    # The payload is skipped if it cannot be consumed.
+    if event_type == OBJECT_DELETED and is_event_data_required(queue[key]['object_type'], event_type):
         queue[key].freeze_data(instance)
 
+    # Move queued events to Redis once the queue reaches the configured threshold (if any)
+    if settings.EVENTS_QUEUE_SPILL_THRESHOLD and len(queue) >= settings.EVENTS_QUEUE_SPILL_THRESHOLD:
+        spill_events(queue, request)
+
+
+def spill_events(queue, request):
+    """
+    Move all events from the queue to a Redis list, to be processed by a background worker once the request has
+    completed (see flush_events()). The payload of each event is serialized, and its request is replaced with a safe
+    copy. Events which cannot be consumed are discarded.
+
+    Subsequent changes to an object are not coalesced with a spilled event for the object.
+    """
+    events = []
+    for event in queue.values():
+        if not is_event_data_required(event['object_type'], event['event_type']):
+            continue
+        spilled_event = {k: v for k, v in event.items() if k not in ('object', 'data', 'request')}
+        spilled_event['data'] = event['data']
+        if 'request' in event:
+            spilled_event['request'] = copy_safe_request(event['request'], include_files=False)
+        events.append(pickle.dumps(spilled_event))
+    queue.clear()
+
+    if events:
+        key = EVENTS_SPILL_KEY.format(request.id)
+        with get_queue(RQ_QUEUE_DEFAULT).connection.pipeline() as pipe:
+            pipe.rpush(key, *events)
+            pipe.expire(key, EVENTS_SPILL_TIMEOUT)
+            pipe.execute()
+        logger.debug(f'Spilled {len(events)} queued events for request {request.id}')
+
+
+def discard_spilled_events(request):
+    """
+    Delete any events spilled to Redis for the given request.
+    """
+    if settings.EVENTS_QUEUE_SPILL_THRESHOLD:
+        get_queue(RQ_QUEUE_DEFAULT).connection.delete(EVENTS_SPILL_KEY.format(request.id))
+
+
+def process_spilled_events(key):
+    """
+    Process the events spilled to Redis under the given key in chunks, passing each chunk through the events pipeline.
+    """
+    connection = get_queue(RQ_QUEUE_DEFAULT).connection
+    while True:
+        # Atomically pop a chunk of events from the head of the list
+        with connection.pipeline() as pipe:
+            pipe.lrange(key, 0, EVENTS_SPILL_CHUNK_SIZE - 1)
+            pipe.ltrim(key, EVENTS_SPILL_CHUNK_SIZE, -1)
+            items, __ = pipe.execute()
+        if not items:
+            break
+        run_events_pipeline([pickle.loads(item) for item in items])
+
+
+def is_event_data_required(object_type, event_type):
+    """
+    Return True if the serialized payload of an event may be consumed: i.e. if any enabled EventRule applies to the
+    object type and event type, or if any events pipeline in addition to the default is configured.
+    """
+    if any(name != DEFAULT_EVENTS_PIPELINE for name in settings.EVENTS_PIPELINE):
+        return True
+
+    # Reuse the event rules index for the duration of a request
+    request_cache = query_cache.get()
+    if request_cache is None:
+        index = get_event_rules_index()
+    elif (index := request_cache['event_rules'].get('index')) is None:
+        index = request_cache['event_rules']['index'] = get_event_rules_index()
+
+    return (object_type.pk, event_type) in index
+
 
-def process_event_rules(event_rules, object_type, event):
+def get_event_rules_version():
     """
-    Process a list of EventRules against an event.
+    Return the current version of the set of EventRules, which changes whenever an EventRule is created, modified, or
+    deleted (see bump_event_rules_version()).
+    """
+    if (version := cache.get(EVENT_RULES_VERSION_KEY)) is None:
+        # The version has not been set (or has been evicted): assign a new one, unless another process has done so
+        cache.add(EVENT_RULES_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(EVENT_RULES_VERSION_KEY)
+    return version
+
+
+def bump_event_rules_version():
+    """
+    Assign a new version to the set of EventRules, prompting every process to rebuild its index of event rules. This
+    should be called once changes to EventRules have been committed.
+    """
+    cache.set(EVENT_RULES_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def get_pending_event_rules_transaction():
+    """
+    Return the outermost atomic block of the current transaction if it has made uncommitted changes to EventRules,
+    or None.
+    """
+    connection = transaction.get_connection(router.db_for_write(EventRule))
+    if connection.in_atomic_block and connection.atomic_blocks[0] in _event_rules_pending:
+        return connection.atomic_blocks[0]
+    return None
+
+
+def invalidate_event_rules_index():
+    """
+    Prompt the index of event rules to be rebuilt following a change to an EventRule. The current process rebuilds
+    its index immediately, to reflect the change within the current transaction, and every process rebuilds its index
+    once the change has been committed.
+    """
+    global _event_rules_index
+
+    using = router.db_for_write(EventRule)
+    connection = transaction.get_connection(using)
+    atomic = connection.atomic_blocks[0] if connection.in_atomic_block else None
+    _event_rules_index = None
+
+    def commit():
+        if atomic is not None:
+            _event_rules_pending.discard(atomic)
+        bump_event_rules_version()
+
+    if atomic is not None:
+        _event_rules_pending.add(atomic)
+    transaction.on_commit(commit, using=using)
+
+
+def get_event_rules_index():
+    """
+    Return an index of all enabled EventRules, mapping each (object type ID, event type) to a list of the applicable
+    rules (with their conditions compiled). The index is held in memory and rebuilt only when the version of the set
+    of EventRules held in the cache has changed (see get_event_rules_version()). An index which reflects uncommitted
+    changes to EventRules is used only within the transaction which made them, so that it is discarded should that
+    transaction be rolled back.
+    """
+    global _event_rules_index
+
+    # The version must be retrieved before the rules, so that any concurrent change prompts a subsequent rebuild
+    version = get_event_rules_version()
+    pending = get_pending_event_rules_transaction()
+    if _event_rules_index is None or _event_rules_index[:2] != (version, pending):
+        index = defaultdict(list)
+        count = 0
+        for event_rule in EventRule.objects.filter(enabled=True).prefetch_related('object_types'):
+            count += 1
+            if event_rule.conditions:
+                try:
+                    event_rule.get_condition_set()
+                except ValueError:
+                    # Invalid conditions will be reported upon evaluation
+                    pass
+            for object_type in event_rule.object_types.all():
+                for event_type in event_rule.event_types:
+                    index[(object_type.pk, event_type)].append(event_rule)
+        _event_rules_index = (version, pending, dict(index))
+        logger.debug(f"Indexed {count} event rules")
+
+    return _event_rules_index[2]
+
+
+def get_event_rules(object_type, event_type, index=None):
+    """
+    Return a list of the enabled EventRules which apply to the given object type and event type. Each rule is a copy
+    of the indexed instance, so that related objects (e.g. the action object) are retrieved anew.
+    """
+    if index is None:
+        index = get_event_rules_index()
+    return [copy(event_rule) for event_rule in index.get((object_type.pk, event_type), [])]
+
+
+def get_condition_data(event, event_rule):
+    """
+    Return the event data against which the conditions of an EventRule are evaluated. For lazily-serialized events,
+    only the fields referenced by the conditions are serialized.
+    """
+    if not isinstance(event, EventContext):
+        return event['data']
+    try:
+        fields = event_rule.get_condition_set().fields
+    except ValueError:
+        # Invalid conditions will be reported upon evaluation
+        fields = None
+    return event.get_data(fields=fields)
+
+
+def process_event_rules(event_rules, object_type, event, webhook_batches=None):
+    """
+    Process a list of EventRules against an event. Events for batched webhooks are appended to webhook_batches (a
+    mapping of Webhooks to lists of events) if provided, or else added to the webhook's pending batch immediately.
 
     Notes on event sources:
     - Object change events (created/updated/deleted) are enqueued via
@@ -183,8 +423,8 @@ def process_event_rules(event_rules, object_type, event):
 
     for event_rule in event_rules:
 
-        # Evaluate event rule conditions (if any)
-        if not event_rule.eval_conditions(event['data']):
+        # Evaluate event rule conditions (if any), serializing only the fields which they reference
+        if event_rule.conditions and not event_rule.eval_conditions(get_condition_data(event, event_rule)):
             continue
 
         # Guard against action_data that is valid JSON but not a dict
@@ -237,8 +477,17 @@ def process_event_rules(event_rules, object_type, event):
                 # which can cause pickle errors with Pillow.
                 params['request'] = copy_safe_request(event['request'], include_files=False)
 
-            # Enqueue the task
-            rq_queue.enqueue('extras.webhooks.send_webhook', **params)
+            # Enqueue the task (or add the event to the webhook's batch)
+            webhook = event_rule.action_object
+            if webhook.is_batched:
+                del params['event_rule']
+                del params['retry']
+                if webhook_batches is not None:
+                    webhook_batches[webhook].append(params)
+                else:
+                    enqueue_webhook_batch(rq_queue, webhook, [params])
+            else:
+                rq_queue.enqueue('extras.webhooks.send_webhook', **params)
 
         # Scripts
         elif event_rule.action_type == EventRuleActionChoices.SCRIPT:
@@ -285,6 +534,8 @@ def process_event_queue(events):
     This is the default processor listed in EVENTS_PIPELINE.
     """
     events_cache = defaultdict(dict)
+    event_rules_index = get_event_rules_index()
+    webhook_batches = defaultdict(list)
 
     for event in events:
         event_type = event['event_type']
@@ -292,23 +543,43 @@ def process_event_queue(events):
 
         # Cache applicable Event Rules
         if object_type not in events_cache[event_type]:
-            events_cache[event_type][object_type] = EventRule.objects.filter(
-                event_types__contains=[event['event_type']],
-                object_types=object_type,
-                enabled=True
-            )
+            events_cache[event_type][object_type] = get_event_rules(object_type, event_type, event_rules_index)
         event_rules = events_cache[event_type][object_type]
 
         process_event_rules(
             event_rules=event_rules,
             object_type=object_type,
             event=event,
+            webhook_batches=webhook_batches,
         )
 
+    # Add the events for each batched webhook to its pending batch
+    if webhook_batches:
+        rq_queue = get_queue(get_config().QUEUE_MAPPINGS.get('webhook', RQ_QUEUE_DEFAULT))
+        for webhook, webhook_events in webhook_batches.items():
+            enqueue_webhook_batch(rq_queue, webhook, webhook_events)
+
+
+def flush_events(events, request=None):
+    """
+    Flush a list of object representations to RQ for event processing. If any events queued by the given request have
+    been spilled to Redis, the remaining events are spilled as well, and all are processed by a background worker.
+    """
+    if request is not None and settings.EVENTS_QUEUE_SPILL_THRESHOLD:
+        key = EVENTS_SPILL_KEY.format(request.id)
+        rq_queue = get_queue(RQ_QUEUE_DEFAULT)
+        if rq_queue.connection.exists(key):
+            if events:
+                spill_events({i: event for i, event in enumerate(events)}, request)
+            rq_queue.enqueue('extras.events.process_spilled_events', key=key)
+            return
+
+    run_events_pipeline(events)
+
 
-def flush_events(events):
+def run_events_pipeline(events):
     """
-    Flush a list of object representations to RQ for event processing.
+    Pass a list of events to each function in EVENTS_PIPELINE.
     """
     if events:
         for name in settings.EVENTS_PIPELINE:
@@ -2,6 +2,7 @@ from django import forms
 from django.utils.translation import gettext_lazy as _
 
 from extras.choices import *
+from extras.constants import WEBHOOK_BATCH_LINGER_MAX, WEBHOOK_BATCH_SIZE_MAX
 from extras.models import *
 from netbox.events import get_event_type_choices
 from netbox.forms import NetBoxModelBulkEditForm, PrimaryModelBulkEditForm
@@ -274,6 +275,18 @@ class WebhookBulkEditForm(OwnerMixin, NetBoxModelBulkEditForm):
         required=False,
         label=_('CA file path')
     )
+    batch_size = forms.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=WEBHOOK_BATCH_SIZE_MAX,
+        label=_('Batch size')
+    )
+    batch_linger = forms.IntegerField(
+        required=False,
+        min_value=0,
+        max_value=WEBHOOK_BATCH_LINGER_MAX,
+        label=_('Batch linger')
+    )
 
     nullable_fields = ('secret', 'ca_file_path')
 
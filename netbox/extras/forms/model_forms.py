@@ -538,6 +538,7 @@ class WebhookForm(OwnerMixin, NetBoxModelForm):
             name=_('HTTP Request')
         ),
         FieldSet('ssl_verification', 'ca_file_path', name=_('SSL')),
+        FieldSet('batch_size', 'batch_linger', name=_('Batching')),
     )
 
     class Meta:
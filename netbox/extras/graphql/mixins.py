@@ -36,8 +36,8 @@ class ConfigContextMixin:
 
         return queryset
 
-    # Ensure `local_context_data` is fetched when `config_context` is requested
-    @strawberry_django.field(only=['local_context_data'])
+    # Ensure `local_context_data` and any cached data are fetched when `config_context` is requested
+    @strawberry_django.field(only=['local_context_data', '_config_context'])
     def config_context(self) -> strawberry.scalars.JSON:
         return self.get_config_context()
 
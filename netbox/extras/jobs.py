@@ -1,6 +1,6 @@
 import logging
 import traceback
-from contextlib import ExitStack
+from contextlib import ExitStack, nullcontext
 
 from django.db import DEFAULT_DB_ALIAS, router, transaction
 from django.utils.translation import gettext as _
@@ -8,6 +8,7 @@ from django.utils.translation import gettext as _
 from core.signals import clear_events
 from dcim.models import Device
 from extras.models import Script as ScriptModel
+from netbox.bulk import bulk_operation
 from netbox.context_managers import event_tracking
 from netbox.jobs import JobRunner
 from netbox.registry import registry
@@ -27,6 +28,13 @@ class ScriptJob(JobRunner):
     class Meta:
         name = 'Run Script'
 
+    @staticmethod
+    def get_script_context(script):
+        """
+        Return the context within which the script is run: a bulk operation, if enabled by the script.
+        """
+        return bulk_operation() if script.bulk_operation else nullcontext()
+
     def run_script(self, script, request, data, commit):
         """
         Core script execution task. We capture this within a method to allow for conditionally wrapping it with the
@@ -52,12 +60,13 @@ class ScriptJob(JobRunner):
                     # otherwise the changes might get committed to the default database
                     # if there are any raised exceptions.
                     if changeloged_db != DEFAULT_DB_ALIAS:
-                        with transaction.atomic(using=changeloged_db):
+                        with transaction.atomic(using=changeloged_db), self.get_script_context(script):
                             script.output = script.run(data, commit)
                             if not commit:
                                 raise AbortTransaction()
                     else:
-                        script.output = script.run(data, commit)
+                        with self.get_script_context(script):
+                            script.output = script.run(data, commit)
                         if not commit:
                             raise AbortTransaction()
             except AbortTransaction:
@@ -1,10 +1,44 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, models, router, transaction
 from django.utils.translation import gettext as _
 
+from extras.models import CachedValue
 from netbox.registry import registry
 from netbox.search.backends import search_backend
 
+# Cache key under which the progress of a reindex is recorded
+CHECKPOINT_KEY = 'extras.reindex.checkpoint'
+
+
+def reindex_shard(label, start, end):
+    """
+    Reindex all objects of the specified model with a primary key in the range [start, end). Either bound may be
+    None to indicate an open range. Any existing cache entries for objects in the range are deleted in a single
+    query. Returns the number of entries cached.
+    """
+    model = apps.get_model(label)
+    indexer = registry['search'][label.lower()]
+    content_type = ContentType.objects.get_for_model(model)
+
+    queryset = model.objects.order_by('pk')
+    cached_values = CachedValue.objects.filter(object_type=content_type)
+    if start is not None:
+        queryset = queryset.filter(pk__gte=start)
+        cached_values = cached_values.filter(object_id__gte=start)
+    if end is not None:
+        queryset = queryset.filter(pk__lt=end)
+        cached_values = cached_values.filter(object_id__lt=end)
+
+    with transaction.atomic(using=router.db_for_write(CachedValue)):
+        cached_values._raw_delete(using=cached_values.db)
+        return search_backend.cache(queryset.iterator(), indexer=indexer, remove_existing=False)
+
 
 class Command(BaseCommand):
     help = 'Reindex objects for search'
@@ -21,6 +55,23 @@ class Command(BaseCommand):
             action='store_true',
             help="For each model, reindex objects only if no cache entries already exist"
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="The number of worker processes among which to divide the reindexing of objects"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help="The range of primary keys to be reindexed by a worker at once"
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help="Resume an interrupted reindex, skipping any objects which have already been reindexed"
+        )
 
     def _get_indexers(self, *model_names):
         indexers = {}
@@ -59,25 +110,55 @@ class Command(BaseCommand):
 
         return indexers
 
+    def _get_shards(self, model, chunk_size):
+        """
+        Divide the primary keys of a model into ranges of (at most) chunk_size. The first and last ranges are open,
+        so that cache entries for any objects outside the current range of primary keys are also deleted.
+        """
+        if not isinstance(model._meta.pk, models.IntegerField):
+            return [(None, None)]
+
+        pk_range = model.objects.aggregate(start=models.Min('pk'), end=models.Max('pk'))
+        if pk_range['start'] is None:
+            return [(None, None)]
+
+        bounds = list(range(pk_range['start'] + chunk_size, pk_range['end'] + 1, chunk_size))
+        return list(zip([None, *bounds], [*bounds, None]))
+
+    def _clear(self, indexers, model_labels):
+        """
+        Clear cached values for the specified models (or all cached values if no models were specified).
+        """
+        if model_labels:
+            content_types = [ContentType.objects.get_for_model(model) for model in indexers.keys()]
+        else:
+            content_types = None
+
+        self.stdout.write('Clearing cached values... ', ending='')
+        self.stdout.flush()
+        deleted_count = search_backend.clear(object_types=content_types)
+        self.stdout.write(f'{deleted_count} entries deleted.')
+
     def handle(self, *model_labels, **kwargs):
 
         # Determine which models to reindex
         indexers = self._get_indexers(*model_labels)
         if not indexers:
             raise CommandError(_("No indexers found!"))
+
+        if kwargs['workers'] < 1:
+            raise CommandError(_("The number of workers must be at least 1."))
+        if kwargs['chunk_size'] < 1:
+            raise CommandError(_("The chunk size must be at least 1."))
+        if kwargs['workers'] > 1 or kwargs['resume']:
+            self._handle_sharded(indexers, model_labels, **kwargs)
+            return
+
         self.stdout.write(f'Reindexing {len(indexers)} models.')
 
         # Clear cached values for the specified models (if not being lazy)
         if not kwargs['lazy']:
-            if model_labels:
-                content_types = [ContentType.objects.get_for_model(model) for model in indexers.keys()]
-            else:
-                content_types = None
-
-            self.stdout.write('Clearing cached values... ', ending='')
-            self.stdout.flush()
-            deleted_count = search_backend.clear(object_types=content_types)
-            self.stdout.write(f'{deleted_count} entries deleted.')
+            self._clear(indexers, model_labels)
 
         # Index models
         self.stdout.write('Indexing models')
@@ -99,7 +180,86 @@ class Command(BaseCommand):
             else:
                 self.stdout.write('No objects found.')
 
+        self._complete()
+
+    def _handle_sharded(self, indexers, model_labels, **kwargs):
+        """
+        Reindex models divided into shards by primary key range, recording the completion of each shard in a
+        checkpoint from which an interrupted reindex can be resumed.
+        """
+        if kwargs['resume']:
+            if (checkpoint := cache.get(CHECKPOINT_KEY)) is None:
+                raise CommandError(_("No interrupted reindex found to resume."))
+            self.stdout.write(
+                f"Resuming reindex ({len(checkpoint['completed'])} of {len(checkpoint['shards'])} shards completed)."
+            )
+        else:
+            self.stdout.write(f'Reindexing {len(indexers)} models.')
+
+            # Clear cached values for the specified models (if not being lazy)
+            if not kwargs['lazy']:
+                self._clear(indexers, model_labels)
+
+            shards = []
+            for model in indexers:
+                label = model._meta.label_lower
+
+                if kwargs['lazy']:
+                    content_type = ContentType.objects.get_for_model(model)
+                    if cached_count := search_backend.count(object_types=[content_type]):
+                        self.stdout.write(f'  {label}... Skipping (found {cached_count} existing).')
+                        continue
+
+                shards.extend((label, start, end) for start, end in self._get_shards(model, kwargs['chunk_size']))
+
+            checkpoint = {
+                'shards': shards,
+                'completed': set(),
+            }
+            cache.set(CHECKPOINT_KEY, checkpoint, timeout=None)
+
+        # Index models
+        shards = [shard for shard in checkpoint['shards'] if shard not in checkpoint['completed']]
+        self.stdout.write(f'Indexing models ({len(shards)} shards, {kwargs["workers"]} workers)')
+        counts = dict.fromkeys([shard[0] for shard in shards], 0)
+        for shard, count in self._reindex(shards, kwargs['workers']):
+            counts[shard[0]] += count
+            checkpoint['completed'].add(shard)
+            cache.set(CHECKPOINT_KEY, checkpoint, timeout=None)
+            if kwargs['verbosity'] > 1:
+                self.stdout.write(f'  {shard[0]} [{shard[1]}, {shard[2]})... {count} entries cached.')
+
+        for label, count in counts.items():
+            if count:
+                self.stdout.write(f'  {label}... {count} entries cached.')
+            else:
+                self.stdout.write(f'  {label}... No objects found.')
+
+        cache.delete(CHECKPOINT_KEY)
+        self._complete()
+
+    def _complete(self):
         msg = 'Completed.'
         if total_count := search_backend.size:
             msg += f' Total entries: {total_count}'
         self.stdout.write(msg, self.style.SUCCESS)
+
+    @staticmethod
+    def _reindex(shards, workers):
+        """
+        Reindex each shard (in the current process or using a pool of worker processes), yielding each shard with the
+        number of entries cached as it is completed.
+        """
+        if workers == 1:
+            for shard in shards:
+                yield shard, reindex_shard(*shard)
+            return
+
+        # Close any open database connections, which must not be shared with forked worker processes
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = {
+                executor.submit(reindex_shard, *shard): shard for shard in shards
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
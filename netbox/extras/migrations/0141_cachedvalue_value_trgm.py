@@ -0,0 +1,27 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Build the index without blocking writes to the (potentially very large) search cache
+    atomic = False
+
+    dependencies = [
+        ('extras', '0140_imageattachment_image_size'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='cachedvalue',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper('value'),
+                    name='gin_trgm_ops'
+                ),
+                name='extras_cachedvalue_value_trgm'
+            ),
+        ),
+    ]
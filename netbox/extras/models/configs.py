@@ -1,3 +1,4 @@
+import itertools
 import os
 import re
 import sys
@@ -6,7 +7,7 @@ import traceback
 import jsonschema
 from django.conf import settings
 from django.core.validators import ValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from jinja2.exceptions import TemplateError
@@ -14,6 +15,9 @@ from jsonschema.exceptions import ValidationError as JSONValidationError
 
 from extras.models.mixins import RenderTemplateMixin
 from extras.querysets import ConfigContextQuerySet
+from extras.utils import bump_config_context_version, get_config_context_version
+from netbox.config import get_config
+from netbox.context import config_context_cache_queue
 from netbox.models import ChangeLoggedModel, PrimaryModel
 from netbox.models.features import CloningMixin, CustomLinksMixin, ExportTemplatesMixin, SyncedDataMixin, TagsMixin
 from netbox.models.mixins import OwnerMixin
@@ -223,6 +227,10 @@ class ConfigContextModel(models.Model):
     """
     A model which includes local configuration context data. This local data will override any inherited data from
     ConfigContexts.
+
+    The merged data of all applicable ConfigContexts is cached on the object once rendered. The cache is cleared
+    whenever the object is saved, and by signal handlers when any of the objects listed in
+    config_context_dependencies (lookups relative to the model) are modified.
     """
     local_context_data = models.JSONField(
         blank=True,
@@ -232,9 +240,36 @@ class ConfigContextModel(models.Model):
         )
     )
 
+    # Cached merged data of all applicable ConfigContexts (excluding local context data)
+    _config_context = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False,
+        serialize=False
+    )
+
+    config_context_dependencies = ()
+
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        # Any change to the object may affect which ConfigContexts apply to it
+        self.invalidate_config_context()
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], '_config_context'}
+
+        super().save(*args, **kwargs)
+        bump_config_context_version()
+
+    def invalidate_config_context(self):
+        """
+        Clear the cached config context data on the instance (but not in the database).
+        """
+        self._config_context = None
+        self.__dict__.pop('config_context_data', None)
+    invalidate_config_context.alters_data = True
+
     def get_config_context(self):
         """
         Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs.
@@ -242,15 +277,20 @@ class ConfigContextModel(models.Model):
         """
         data = {}
 
-        if not hasattr(self, 'config_context_data'):
-            # The annotation is not available, so we fall back to manually querying for the config context objects
-            config_context_data = ConfigContext.objects.get_for_object(self, aggregate_data=True) or []
+        if self._config_context is not None:
+            data = self._config_context
         else:
-            # The attribute may exist, but the annotated value could be None if there is no config context data
-            config_context_data = self.config_context_data or []
+            if not hasattr(self, 'config_context_data'):
+                # The annotation is not available, so we fall back to manually querying for the config context objects
+                config_context_data = ConfigContext.objects.get_for_object(self, aggregate_data=True) or []
+            else:
+                # The attribute may exist, but the annotated value could be None if there is no config context data
+                config_context_data = self.config_context_data or []
+
+            for context in config_context_data:
+                data = deepmerge(data, context)
 
-        for context in config_context_data:
-            data = deepmerge(data, context)
+            self._cache_config_context(data)
 
         # If the object has local config context data defined, merge it last
         if self.local_context_data:
@@ -258,6 +298,52 @@ class ConfigContextModel(models.Model):
 
         return data
 
+    def _cache_config_context(self, data):
+        """
+        Cache the merged ConfigContext data on the instance. While processing a request, the data is also queued to be
+        saved along with that of all other objects rendered by the request (see cache_config_contexts()).
+        """
+        self._config_context = data
+        if self.pk and (queue := config_context_cache_queue.get()) is not None:
+            queue[self._meta.model][self.pk] = data
+
+    @classmethod
+    def cache_config_contexts(cls, data, version):
+        """
+        Save the merged ConfigContext data for multiple objects (a dictionary mapping primary keys to data), using a
+        single query per batch of objects. Objects whose cache has been populated in the meantime are left untouched.
+
+        The data is discarded if any cached data has been invalidated since the given version of the config context
+        cache was retrieved (prior to rendering the data; see get_config_context_version()), as it may be stale.
+        """
+        if not data or get_config().MAINTENANCE_MODE:
+            return
+
+        connection = connections[router.db_for_write(cls)]
+        field = cls._meta.get_field('_config_context')
+        table = connection.ops.quote_name(cls._meta.db_table)
+        pk_column = connection.ops.quote_name(cls._meta.pk.column)
+        column = connection.ops.quote_name(field.column)
+
+        with transaction.atomic(using=connection.alias):
+            for batch in itertools.batched(data.items(), 1000):
+                params = [
+                    param for pk, context in batch for param in (pk, field.get_db_prep_value(context, connection))
+                ]
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"UPDATE {table} SET {column} = v.data "
+                        f"FROM (VALUES {', '.join(['(%s, %s::jsonb)'] * len(batch))}) AS v(id, data) "
+                        f"WHERE {table}.{pk_column} = v.id AND {table}.{column} IS NULL",
+                        params
+                    )
+
+            # The version must be checked after the rows have been updated (and locked): an invalidation committed
+            # before this point has bumped the version, whereas any later invalidation clears the rows once the data
+            # has been committed.
+            if get_config_context_version() != version:
+                transaction.set_rollback(True, using=connection.alias)
+
     def clean(self):
         super().clean()
 
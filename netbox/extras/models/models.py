@@ -1,12 +1,13 @@
 import json
 import re
 import urllib.parse
+from copy import deepcopy
 from pathlib import Path
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.core.validators import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator, ValidationError
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
@@ -165,13 +166,23 @@ class EventRule(CustomFieldsMixin, ExportTemplatesMixin, OwnerMixin, TagsMixin,
         logger = logging.getLogger('netbox.event_rules')
 
         try:
-            result = ConditionSet(self.conditions).eval(data)
+            result = self.get_condition_set().eval(data)
             logger.debug(f'{self.name}: Evaluated as {result}')
             return result
-        except InvalidCondition as e:
+        except (InvalidCondition, ValueError) as e:
             logger.error(f"{self.name}: Evaluation failed. {e}")
             return False
 
+    def get_condition_set(self):
+        """
+        Return the ConditionSet compiled from the event rule's conditions. This is cached on the instance until the
+        conditions are changed.
+        """
+        cached = getattr(self, '_condition_set', None)
+        if cached is None or cached[0] != self.conditions:
+            self._condition_set = (deepcopy(self.conditions), ConditionSet(self.conditions))
+        return self._condition_set[1]
+
 
 class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, OwnerMixin, ChangeLoggedModel):
     """
@@ -256,6 +267,26 @@ class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, OwnerMixin, Ch
             "The specific CA certificate file to use for SSL verification. Leave blank to use the system defaults."
         )
     )
+    batch_size = models.PositiveIntegerField(
+        verbose_name=_('batch size'),
+        default=1,
+        validators=(
+            MinValueValidator(1),
+            MaxValueValidator(WEBHOOK_BATCH_SIZE_MAX)
+        ),
+        help_text=_(
+            "The maximum number of events to deliver in a single request. When greater than one, events are sent as "
+            "a JSON array of the individual request bodies (requires a JSON content type)."
+        )
+    )
+    batch_linger = models.PositiveIntegerField(
+        verbose_name=_('batch linger'),
+        default=0,
+        validators=(
+            MaxValueValidator(WEBHOOK_BATCH_LINGER_MAX),
+        ),
+        help_text=_("The time (in seconds) to wait for additional events before delivering a partial batch")
+    )
     events = GenericRelation(
         EventRule,
         content_type_field='action_object_type',
@@ -312,6 +343,12 @@ class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, OwnerMixin, Ch
                 if scheme not in ('http', 'https') or not netloc:
                     errors['payload_url'] = _("Enter a valid URL, beginning with http:// or https://.")
 
+        # Batched events are delivered as a JSON array of the individual request bodies
+        if self.batch_size and self.batch_size > 1:
+            content_type = self.http_content_type.split(';')[0].strip().lower()
+            if content_type != HTTP_CONTENT_TYPE_JSON and not content_type.endswith('+json'):
+                errors['batch_size'] = _('Events can be delivered in batches only with a JSON content type.')
+
         if errors:
             raise ValidationError(errors)
 
@@ -332,6 +369,10 @@ class Webhook(CustomFieldsMixin, ExportTemplatesMixin, TagsMixin, OwnerMixin, Ch
             ret[header.strip()] = value.strip()
         return ret
 
+    @property
+    def is_batched(self):
+        return self.batch_size > 1
+
     def render_body(self, context):
         """
         Render the body template, if defined. Otherwise, jump the context as a JSON object.
@@ -1,7 +1,9 @@
 from django.contrib.postgres.aggregates import JSONBAgg
 from django.db.models import OuterRef, Q, Subquery
+from django.db.models.lookups import IsNull
 
 from extras.models.tags import TaggedItem
+from extras.utils import bump_config_context_version
 from utilities.query_functions import EmptyGroupByJSONBAgg
 from utilities.querysets import RestrictedQuerySet
 
@@ -87,19 +89,32 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     """
     def annotate_config_context_data(self):
         """
-        Attach the subquery annotation to the base queryset
+        Attach the subquery annotation to the base queryset. The subquery is evaluated only for objects which have no
+        cached config context data.
         """
         from extras.models import ConfigContext
         return self.annotate(
             config_context_data=Subquery(
                 ConfigContext.objects.filter(
-                    self._get_config_context_filters()
+                    self._get_config_context_filters(),
+                    IsNull(OuterRef('_config_context'), True),
                 ).annotate(
                     _data=EmptyGroupByJSONBAgg('data', order_by=['weight', 'name'])
                 ).values("_data").order_by()
             )
         )
 
+    def invalidate_config_context(self):
+        """
+        Clear the cached config context data of all objects in the queryset.
+        """
+        # Rows which are already empty are included so that the update waits for (and clears) any data being saved
+        # concurrently by cache_config_contexts(). The version is bumped after the update to discard any data saved
+        # after it instead.
+        count = self.update(_config_context=None)
+        bump_config_context_version()
+        return count
+
     def _get_config_context_filters(self):
         # Construct the set of Q objects for the specific object types
         tag_query_filters = {
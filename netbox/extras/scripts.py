@@ -387,6 +387,10 @@ class BaseScript:
     def fieldsets(self):
         return getattr(self.Meta, 'fieldsets', None)
 
+    @classproperty
+    def bulk_operation(self):
+        return getattr(self.Meta, 'bulk_operation', False)
+
     @classproperty
     def commit_default(self):
         return getattr(self.Meta, 'commit_default', True)
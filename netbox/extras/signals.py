@@ -1,10 +1,15 @@
+from collections import defaultdict
+from functools import cache
+
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
+from mptt.models import MPTTModel
 
 from core.events import *
 from core.signals import job_end, job_start
-from extras.events import EventContext, process_event_rules
+from extras.events import EventContext, get_event_rules, invalidate_event_rules_index, process_event_rules
 from extras.models import EventRule, Notification, Subscription
 from netbox.config import get_config
 from netbox.models.features import has_feature
@@ -12,7 +17,7 @@ from netbox.signals import post_clean
 from utilities.data import get_config_value_ci
 from utilities.exceptions import AbortRequest
 
-from .models import CustomField, TaggedItem
+from .models import ConfigContext, ConfigContextModel, CustomField, Tag, TaggedItem
 from .utils import run_validators
 
 #
@@ -102,20 +107,133 @@ def validate_assigned_tags(sender, instance, action, model, pk_set, **kwargs):
             raise AbortRequest(f"Tag {tag} cannot be assigned to {ct.model} objects.")
 
 
+#
+# Config contexts
+#
+
+@cache
+def get_config_context_models():
+    """
+    Return all models which support config contexts.
+    """
+    return [model for model in apps.get_models() if issubclass(model, ConfigContextModel)]
+
+
+@cache
+def get_config_context_dependencies():
+    """
+    Return a mapping of each model on which rendered config contexts depend to a list of (model, lookup) tuples,
+    identifying the objects whose cached config context data is invalidated by a change to an instance of that model.
+    """
+    dependencies = defaultdict(list)
+    for model in get_config_context_models():
+        for lookup in model.config_context_dependencies:
+            related_model = model
+            for field_name in lookup.split('__'):
+                related_model = related_model._meta.get_field(field_name).related_model
+            dependencies[related_model].append((model, lookup))
+    return dependencies
+
+
+def invalidate_config_contexts():
+    """
+    Clear the cached config context data of all objects.
+    """
+    for model in get_config_context_models():
+        model.objects.invalidate_config_context()
+
+
+@receiver((post_save, post_delete), sender=ConfigContext)
+def handle_config_context_changed(instance, **kwargs):
+    invalidate_config_contexts()
+
+
+@receiver(m2m_changed)
+def handle_config_context_assignments_changed(sender, instance, action, **kwargs):
+    """
+    Invalidate cached config context data when the assignments of a ConfigContext are modified.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, ConfigContext):
+        invalidate_config_contexts()
+
+
+@receiver(m2m_changed, sender=TaggedItem)
+def handle_config_context_object_tags_changed(sender, instance, action, **kwargs):
+    """
+    Invalidate the cached config context data of an object when its tags are modified.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, ConfigContextModel):
+        instance.invalidate_config_context()
+        instance._meta.model.objects.filter(pk=instance.pk).invalidate_config_context()
+
+
+@receiver(pre_delete, sender=Tag)
+def handle_config_context_tag_deleted(instance, **kwargs):
+    for model in get_config_context_models():
+        model.objects.filter(tags=instance).invalidate_config_context()
+
+
+def handle_config_context_dependency_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached config context data of all objects related to a modified region, site, tenant, etc. (as
+    declared by each model's config_context_dependencies).
+    """
+    if kwargs.get('created'):
+        return
+
+    # Deleting the sole assignment of a ConfigContext (for a type of object) broadens its scope to all objects
+    if 'created' not in kwargs:
+        for field in ConfigContext._meta.many_to_many:
+            if field.related_model is not sender:
+                continue
+            for context in ConfigContext.objects.filter(**{field.name: instance}):
+                if getattr(context, field.name).count() == 1:
+                    invalidate_config_contexts()
+                    return
+
+    # Account for all child objects of nested models (e.g. regions)
+    if isinstance(instance, MPTTModel):
+        objects = instance.get_descendants(include_self=True)
+    else:
+        objects = [instance]
+
+    for model, lookup in get_config_context_dependencies()[sender]:
+        model.objects.filter(**{f'{lookup}__in': objects}).invalidate_config_context()
+
+
+for dependency in get_config_context_dependencies():
+    post_save.connect(handle_config_context_dependency_changed, sender=dependency)
+    pre_delete.connect(handle_config_context_dependency_changed, sender=dependency)
+
+
 #
 # Event rules
 #
 
+@receiver((post_save, post_delete), sender=EventRule)
+def handle_eventrule_changed(instance, **kwargs):
+    """
+    Prompt the in-memory index of event rules to be rebuilt (see get_event_rules_index()) when an EventRule is saved
+    or deleted.
+    """
+    invalidate_event_rules_index()
+
+
+@receiver(m2m_changed, sender=EventRule.object_types.through)
+def handle_eventrule_object_types_changed(instance, action, **kwargs):
+    """
+    Prompt the in-memory index of event rules to be rebuilt when the object types assigned to EventRules change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_event_rules_index()
+
+
 @receiver(job_start)
 def process_job_start_event_rules(sender, **kwargs):
     """
     Process event rules for jobs starting.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_STARTED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = get_event_rules(sender.object_type, JOB_STARTED)
     event = EventContext(
         event_type=JOB_STARTED,
         data=sender.data,
@@ -129,11 +247,7 @@ def process_job_end_event_rules(sender, **kwargs):
     """
     Process event rules for jobs terminating.
     """
-    event_rules = EventRule.objects.filter(
-        event_types__contains=[JOB_COMPLETED],
-        enabled=True,
-        object_types=sender.object_type
-    )
+    event_rules = get_event_rules(sender.object_type, JOB_COMPLETED)
     event = EventContext(
         event_type=JOB_COMPLETED,
         data=sender.data,
@@ -133,9 +133,31 @@ class ConditionTestCase(TestCase):
         self.assertFalse(c.eval({'x': 'abc'}))
         self.assertTrue(c.eval({'x': '123'}))
 
+    def test_invalid_regex(self):
+        with self.assertRaises(ValueError):
+            Condition('x', '[a-z', 'regex')
+
+    def test_shared_accessor(self):
+        c1 = Condition('x.y', 1)
+        c2 = Condition('x.y', 2)
+        self.assertIs(c1.accessor, c2.accessor)
+        self.assertEqual(c1.accessor({'x': [{'y': 1}, {'y': 2}]}), [1, 2])
+
 
 class ConditionSetTestCase(TestCase):
 
+    def test_fields(self):
+        cs = ConditionSet({
+            'and': [
+                {'attr': 'status.value', 'value': 'active'},
+                {'or': [
+                    {'attr': 'name', 'value': 'foo'},
+                    {'attr': 'status.label', 'value': 'Active'},
+                ]},
+            ]
+        })
+        self.assertEqual(cs.fields, {'status', 'name'})
+
     def test_empty(self):
         with self.assertRaises(ValueError):
             ConditionSet({})
@@ -299,6 +321,26 @@ class ConditionSetTestCase(TestCase):
         # Evaluate the conditions (status NOT in ['planned, 'staging'])
         self.assertTrue(event_rule.eval_conditions(data))
 
+    def test_event_rule_conditions_compiled_once(self):
+        """
+        Test that the conditions of an EventRule are compiled once, and recompiled only when changed.
+        """
+        event_rule = EventRule(
+            name='Event Rule 1',
+            event_types=[OBJECT_CREATED, OBJECT_UPDATED],
+            conditions={
+                'attr': 'status.value',
+                'value': 'active',
+            }
+        )
+        condition_set = event_rule.get_condition_set()
+        self.assertIs(event_rule.get_condition_set(), condition_set)
+        self.assertTrue(event_rule.eval_conditions({'status': {'value': 'active'}}))
+
+        event_rule.conditions['value'] = 'planned'
+        self.assertIsNot(event_rule.get_condition_set(), condition_set)
+        self.assertFalse(event_rule.eval_conditions({'status': {'value': 'active'}}))
+
     def test_event_rule_conditions_with_incorrect_key_must_return_false(self):
         """
         Test Event Rule with incorrect condition (key "foo" is wrong). Must return false.
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch
 import django_rq
 from django.conf import settings
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase, tag
+from django.test import RequestFactory, TestCase, override_settings, tag
 from django.urls import reverse
 from PIL import Image
 from requests import Session
@@ -20,11 +20,22 @@ from core.models import Job, ObjectType
 from dcim.choices import SiteStatusChoices
 from dcim.models import DeviceType, Interface, Manufacturer, Site
 from extras.choices import EventRuleActionChoices
-from extras.events import enqueue_event, flush_events, serialize_for_event
+from extras.events import (
+    EVENTS_SPILL_KEY,
+    EVENTS_SPILL_TIMEOUT,
+    EventContext,
+    bump_event_rules_version,
+    enqueue_event,
+    flush_events,
+    get_event_rules,
+    get_event_rules_version,
+    process_spilled_events,
+    serialize_for_event,
+)
 from extras.models import EventRule, Script, ScriptModule, Tag, Webhook
 from extras.scripts import Script as ScriptBase
 from extras.signals import process_job_end_event_rules
-from extras.webhooks import generate_signature, send_webhook
+from extras.webhooks import flush_webhook_batch, generate_signature, send_webhook, send_webhook_batch
 from netbox.context_managers import event_tracking
 from utilities.testing import APITestCase, create_test_device
 from utilities.testing.mixins import RQQueueTestMixin
@@ -135,6 +146,39 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         # Evaluate the conditions (status='active')
         self.assertTrue(event_rule.eval_conditions(data))
 
+    def test_event_rules_index(self):
+        """
+        Test that the in-memory index of event rules is reused until an EventRule is changed.
+        """
+        site_type = ObjectType.objects.get_for_model(Site)
+        event_rules = get_event_rules(site_type, OBJECT_CREATED)
+        self.assertEqual([event_rule.name for event_rule in event_rules], ['Event Rule 1'])
+
+        # The index is not rebuilt if no event rules have changed
+        with self.assertNumQueries(0):
+            get_event_rules(site_type, OBJECT_CREATED)
+
+        # Disable the event rule
+        event_rule = EventRule.objects.get(name='Event Rule 1')
+        event_rule.enabled = False
+        event_rule.save()
+        self.assertEqual(get_event_rules(site_type, OBJECT_CREATED), [])
+
+        # Re-enable the event rule and remove its object types
+        event_rule.enabled = True
+        event_rule.save()
+        self.assertEqual(len(get_event_rules(site_type, OBJECT_CREATED)), 1)
+        event_rule.object_types.clear()
+        self.assertEqual(get_event_rules(site_type, OBJECT_CREATED), [])
+
+        # Other processes are prompted to rebuild their indexes once the change has been committed
+        with self.captureOnCommitCallbacks() as callbacks:
+            event_rule.save()
+        self.assertEqual(len(callbacks), 1)
+        version = get_event_rules_version()
+        bump_event_rules_version()
+        self.assertNotEqual(get_event_rules_version(), version)
+
     def test_single_create_process_eventrule(self):
         """
         Check that creating an object with an applicable EventRule queues a background task for the rule's action.
@@ -426,6 +470,76 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         with patch.object(Session, 'send', dummy_send):
             send_webhook(**job.kwargs)
 
+    def test_send_webhook_batch(self):
+        webhook = Webhook.objects.get(name='Webhook 1')
+        webhook.batch_size = 10
+        webhook.save()
+        request = RequestFactory().get(reverse('dcim:site_add'))
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        def dummy_send(_, request, **kwargs):
+            """
+            A dummy implementation of Session.send() to be used for testing.
+            Always returns a 200 HTTP response.
+            """
+            self.assertEqual(request.headers['X-Hook-Signature'], generate_signature(request.body, webhook.secret))
+
+            # Validate the outgoing request body
+            body = json.loads(request.body)
+            self.assertEqual(len(body), 3)
+            for i, event in enumerate(body, start=1):
+                self.assertEqual(event['event'], 'created')
+                self.assertEqual(event['data']['name'], f'Site {i}')
+                self.assertEqual(event['data']['foo'], 1)
+
+            return HttpResponse()
+
+        # Events for the webhook are added to its batch, the delivery of which is enqueued
+        with event_tracking(request):
+            for i in range(1, 4):
+                Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+        self.assertEqual(self.queue.count, 1)
+        job = self.queue.jobs[0]
+        self.assertEqual(job.func_name, 'extras.webhooks.flush_webhook_batch')
+        self.queue.empty()
+
+        # Flushing the batch enqueues a single delivery for all events
+        flush_webhook_batch(**job.kwargs)
+        self.assertEqual(self.queue.count, 1)
+        job = self.queue.jobs[0]
+        self.assertEqual(job.func_name, 'extras.webhooks.send_webhook_batch')
+        self.assertEqual(len(job.kwargs['events']), 3)
+
+        with patch.object(Session, 'send', dummy_send):
+            send_webhook_batch(**job.kwargs)
+
+    def test_send_webhook_batch_multiple_urls(self):
+        webhook = Webhook.objects.get(name='Webhook 1')
+        webhook.payload_url = 'http://localhost:9000/{{ data.slug }}'
+        webhook.batch_size = 10
+        webhook.save()
+        request = RequestFactory().get(reverse('dcim:site_add'))
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        with event_tracking(request):
+            for i in range(1, 4):
+                Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+        flush_webhook_batch(**self.queue.jobs[0].kwargs)
+        job = self.queue.jobs[-1]
+        self.queue.empty()
+
+        # The request to each URL is enqueued separately, so that it is retried independently
+        with patch.object(Session, 'send') as send:
+            send_webhook_batch(**job.kwargs)
+        send.assert_not_called()
+        self.assertEqual(self.queue.count, 3)
+        for i, job in enumerate(self.queue.jobs, start=1):
+            self.assertEqual(job.func_name, 'extras.webhooks.send_webhook_request')
+            self.assertEqual(job.kwargs['url'], f'http://localhost:9000/site-{i}')
+            self.assertEqual(len(json.loads(job.kwargs['body'])), 1)
+
     def test_job_completed_webhook_username_fallback(self):
         """
         Ensure job_end event processing can enqueue a webhook even when the EventContext
@@ -548,6 +662,72 @@ class EventRuleTestCase(RQQueueTestMixin, APITestCase):
         self.assertIsNone(event['snapshots']['postchange'])
 
     @tag('regression')  # #21338
+    def test_partial_event_data(self):
+        """
+        Check that only the requested fields of an object are serialized for an event.
+        """
+        site = Site.objects.create(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE)
+        event = EventContext(object=site)
+
+        data = event.get_data(fields=['name', 'status'])
+        self.assertEqual(set(data), {'name', 'status'})
+        self.assertEqual(data['status']['value'], SiteStatusChoices.STATUS_ACTIVE)
+        self.assertNotIn('data', event)
+
+        # The complete payload is returned once materialized
+        self.assertEqual(event['data']['slug'], 'site-1')
+        self.assertEqual(event.get_data(fields=['name']), event['data'])
+
+    def test_delete_event_payload_skipped_without_event_rules(self):
+        """
+        Check that the payload of a delete event is not serialized if no EventRule applies to it.
+        """
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+
+        queue = {}
+        with patch('extras.events.serialize_for_event') as serialize:
+            enqueue_event(queue, manufacturer, request, OBJECT_DELETED)
+        serialize.assert_not_called()
+        self.assertNotIn('data', list(queue.values())[0])
+
+        # The payload of an object having applicable EventRules is frozen
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        enqueue_event(queue, site, request, OBJECT_DELETED)
+        self.assertIn('data', queue[f'dcim.site:{site.pk}'])
+
+    @override_settings(EVENTS_QUEUE_SPILL_THRESHOLD=2)
+    def test_spill_events(self):
+        """
+        Check that queued events are moved to Redis once the threshold is reached, and processed by a worker.
+        """
+        request = RequestFactory().get(reverse('dcim:site_add'))
+        request.id = uuid.uuid4()
+        request.user = self.user
+        sites = [Site.objects.create(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)]
+
+        queue = {}
+        for site in sites:
+            enqueue_event(queue, site, request, OBJECT_CREATED)
+
+        # The first two events were moved to Redis once the threshold was reached
+        self.assertEqual(list(queue), [f'dcim.site:{sites[2].pk}'])
+        key = EVENTS_SPILL_KEY.format(request.id)
+        self.assertEqual(self.queue.connection.llen(key), 2)
+        self.assertTrue(0 < self.queue.connection.ttl(key) <= EVENTS_SPILL_TIMEOUT)
+
+        # The remaining event is spilled on flush, and processing of all events is deferred to a worker
+        flush_events(list(queue.values()), request=request)
+        self.assertEqual(self.queue.count, 1)
+        self.assertEqual(self.queue.jobs[0].func_name, 'extras.events.process_spilled_events')
+
+        process_spilled_events(key)
+        self.assertFalse(self.queue.connection.exists(key))
+        webhook_jobs = [job for job in self.queue.jobs if job.func_name == 'extras.webhooks.send_webhook']
+        self.assertEqual([job.kwargs['data']['name'] for job in webhook_jobs], ['Site 1', 'Site 2', 'Site 3'])
+
     def test_cable_creation_event_payload_includes_connected_endpoints(self):
         """
         Interface update events queued during cable creation must include the
@@ -3,15 +3,16 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
 
 from dcim.choices import InterfaceTypeChoices
 from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
-from extras.management.commands import renaturalize, webhook_receiver
+from extras.management.commands import reindex, renaturalize, webhook_receiver
 from extras.management.commands.webhook_receiver import WebhookHandler
-from extras.models import ImageAttachment
+from extras.models import CachedValue, ImageAttachment
 from extras.tests.test_models import OverwriteStyleMemoryStorage, UnreadableSizeMemoryStorage
 from users.models import User
 from utilities.fields import NaturalOrderingField
@@ -159,6 +160,41 @@ class ReindexTestCase(TestCase):
         with self.assertRaisesMessage(CommandError, 'Invalid model'):
             call_command('reindex', 'dcim.rack.extra', stdout=StringIO())
 
+    def test_get_shards(self):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+        start = Site.objects.order_by('pk').first().pk
+
+        self.assertEqual(
+            reindex.Command()._get_shards(Site, 2),
+            [(None, start + 2), (start + 2, start + 4), (start + 4, None)]
+        )
+        self.assertEqual(reindex.Command()._get_shards(Manufacturer, 2), [(None, None)])
+
+    def test_reindex_resume(self):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+        sites = list(Site.objects.order_by('pk'))
+        split = sites[2].pk
+        cache.set(reindex.CHECKPOINT_KEY, {
+            'shards': [('dcim.site', None, split), ('dcim.site', split, None)],
+            'completed': {('dcim.site', None, split)},
+        })
+        out = StringIO()
+
+        call_command('reindex', 'dcim.site', resume=True, stdout=out)
+
+        # Only objects in the incomplete shard have been reindexed
+        cached_ids = CachedValue.objects.filter(
+            object_type=ContentType.objects.get_for_model(Site)
+        ).values_list('object_id', flat=True)
+        self.assertEqual(set(cached_ids), {site.pk for site in sites[2:]})
+        self.assertIsNone(cache.get(reindex.CHECKPOINT_KEY))
+        self.assertIn('Completed.', out.getvalue())
+
+    def test_reindex_resume_without_checkpoint(self):
+        cache.delete(reindex.CHECKPOINT_KEY)
+        with self.assertRaisesMessage(CommandError, "No interrupted reindex found to resume."):
+            call_command('reindex', resume=True, stdout=StringIO())
+
 
 class RenaturalizeTestCase(TestCase):
     @classmethod
@@ -35,6 +35,7 @@ from extras.models import (
     Webhook,
 )
 from extras.models.mixins import RenderTemplateMixin
+from netbox.context_managers import config_context_cache_tracking
 from tenancy.models import Tenant, TenantGroup
 from utilities.exceptions import AbortRequest
 from utilities.jinja2 import env_filter, render_jinja2, sanitize_http_header
@@ -1051,6 +1052,133 @@ class ConfigContextTestCase(TestCase):
         self.assertEqual(len(distinct_subqueries), 1)
         self.assertTrue(distinct_subqueries[0].distinct)
 
+    @staticmethod
+    def _render_config_context(obj):
+        """
+        Render the config context of an object as though while processing a request, caching the result.
+        """
+        with config_context_cache_tracking(None):
+            return obj.get_config_context()
+
+    def test_config_context_cache(self):
+        ConfigContext.objects.create(name='context 1', weight=100, data={'a': 1})
+        device = Device.objects.first()
+        self.assertIsNone(device._config_context)
+
+        # Rendering the config context outside of a request does not populate the cache
+        self.assertEqual(device.get_config_context(), {'a': 1})
+        self.assertIsNone(Device.objects.get(pk=device.pk)._config_context)
+
+        # Rendering the config context while processing a request populates the cache
+        device = Device.objects.get(pk=device.pk)
+        self.assertEqual(self._render_config_context(device), {'a': 1})
+        device = Device.objects.annotate_config_context_data().get(pk=device.pk)
+        self.assertEqual(device._config_context, {'a': 1})
+
+        # The annotation is skipped for objects with cached data
+        self.assertIsNone(device.config_context_data)
+        self.assertEqual(device.get_config_context(), {'a': 1})
+
+        # Local context data is not cached
+        device.local_context_data = {'b': 2}
+        device.save()
+        self.assertEqual(self._render_config_context(device), {'a': 1, 'b': 2})
+        device.refresh_from_db()
+        self.assertEqual(device._config_context, {'a': 1})
+
+    def test_config_context_cache_bulk(self):
+        ConfigContext.objects.create(name='context 1', weight=100, data={'a': 1})
+        device = Device.objects.first()
+        for i in range(2, 4):
+            Device.objects.create(
+                name=f'Device {i}', device_type=device.device_type, role=device.role, site=device.site
+            )
+        devices = list(Device.objects.annotate_config_context_data())
+
+        # The cache of all objects rendered by a request is populated using a single query
+        with CaptureQueriesContext(connection) as ctx:
+            with config_context_cache_tracking(None):
+                for device in devices:
+                    self.assertEqual(device.get_config_context(), {'a': 1})
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]), 1)
+        self.assertFalse(Device.objects.filter(_config_context__isnull=True).exists())
+
+    def test_config_context_cache_concurrent_invalidation(self):
+        context = ConfigContext.objects.create(name='context 1', weight=100, data={'a': 1})
+        device = Device.objects.first()
+
+        # Data invalidated after being rendered by a request is not saved to the cache
+        with config_context_cache_tracking(None):
+            self.assertEqual(device.get_config_context(), {'a': 1})
+            context.data = {'a': 2}
+            context.save()
+        device.refresh_from_db()
+        self.assertIsNone(device._config_context)
+        self.assertEqual(self._render_config_context(device), {'a': 2})
+        device.refresh_from_db()
+        self.assertEqual(device._config_context, {'a': 2})
+
+    def test_config_context_cache_invalidation(self):
+        site = Site.objects.first()
+        region = Region.objects.create(name='Region 2', slug='region-2')
+        tag = Tag.objects.first()
+        context = ConfigContext.objects.create(name='context 1', weight=100, data={'a': 1})
+        device = Device.objects.first()
+
+        def assert_invalidated():
+            device.refresh_from_db()
+            self.assertIsNone(device._config_context)
+            self._render_config_context(device)
+
+        self._render_config_context(device)
+
+        # Modifying a ConfigContext
+        context.data = {'a': 2}
+        context.save()
+        assert_invalidated()
+
+        # Modifying the assignments of a ConfigContext
+        context.regions.add(region)
+        assert_invalidated()
+        self.assertEqual(self._render_config_context(device), {})
+
+        # Modifying a related object
+        site.region = region
+        site.save()
+        assert_invalidated()
+        self.assertEqual(self._render_config_context(device), {'a': 2})
+
+        # Modifying the tags of an object
+        device.tags.add(tag)
+        assert_invalidated()
+
+        # Deleting a Tag
+        tag.delete()
+        assert_invalidated()
+
+        # Moving a parent object
+        region.parent = Region.objects.get(name='Region')
+        region.save()
+        assert_invalidated()
+
+        # Deleting an unrelated object
+        Tenant.objects.create(name='Tenant 2', slug='tenant-2').delete()
+        device.refresh_from_db()
+        self.assertIsNotNone(device._config_context)
+
+        # Deleting the sole assignment of a ConfigContext
+        Region.objects.create(name='Region 3', slug='region-3').delete()
+        device.refresh_from_db()
+        self.assertIsNotNone(device._config_context)
+        region.delete()
+        assert_invalidated()
+
+    def test_config_context_annotation_uncached(self):
+        ConfigContext.objects.create(name='context 1', weight=100, data={'a': 1})
+        device = Device.objects.annotate_config_context_data().get(name='Device 1')
+        self.assertEqual(device.config_context_data, [{'a': 1}])
+        self.assertEqual(device.get_config_context(), {'a': 1})
+
 
 class ConfigTemplateTestCase(TestCase):
     """
@@ -1662,6 +1790,16 @@ class WebhookTestCase(TestCase):
         webhook = Webhook(name='Webhook 1', payload_url='{{ data.custom_fields.callback_url }}')
         webhook.clean()
 
+    def test_batch_size_requires_json_content_type(self):
+        webhook = Webhook(name='Webhook 1', payload_url='http://example.com/hook', batch_size=10)
+        webhook.clean()
+        webhook.http_content_type = 'application/vnd.api+json; charset=utf-8'
+        webhook.clean()
+        webhook.http_content_type = 'application/x-www-form-urlencoded'
+        with self.assertRaises(ValidationError) as cm:
+            webhook.clean()
+        self.assertIn('batch_size', cm.exception.message_dict)
+
     def test_payload_url_rejects_malformed_bracketed_host_gracefully(self):
         """A malformed netloc must raise ValidationError, not an uncaught ValueError from urlsplit() (#22832)."""
         webhook = Webhook(name='Webhook 1', payload_url='http://[2001:db8::1/hook')
@@ -348,6 +348,13 @@ class WebhookSSLPanel(panels.ObjectAttributesPanel):
     ca_file_path = attrs.TextAttr('ca_file_path', label=_('CA file path'))
 
 
+class WebhookBatchingPanel(panels.ObjectAttributesPanel):
+    title = _('Batching')
+
+    batch_size = attrs.NumericAttr('batch_size', label=_('Batch size'))
+    batch_linger = attrs.NumericAttr('batch_linger', label=_('Batch linger (seconds)'))
+
+
 #
 # EventRule panels
 #
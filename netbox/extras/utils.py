@@ -1,7 +1,9 @@
 import importlib
 import types
+import uuid
 from pathlib import Path
 
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured, SuspiciousFileOperation
 from django.core.files.storage import Storage, default_storage
 from django.core.files.utils import validate_file_name
@@ -15,7 +17,9 @@ from .validators import CustomValidator
 
 __all__ = (
     'SharedObjectViewMixin',
+    'bump_config_context_version',
     'filename_from_model',
+    'get_config_context_version',
     'image_upload',
     'is_report',
     'is_script',
@@ -24,6 +28,9 @@ __all__ = (
     'validate_script_content',
 )
 
+# Cache key holding the current version of the cached config context data (see get_config_context_version())
+CONFIG_CONTEXT_VERSION_KEY = 'netbox:extras:configcontext:version'
+
 
 class SharedObjectViewMixin:
 
@@ -170,3 +177,23 @@ def run_validators(instance, validators):
             raise ImproperlyConfigured(f"Invalid value for custom validator: {validator}")
 
         validator(instance, request)
+
+
+def get_config_context_version():
+    """
+    Return the current version of the config context data cached on devices and virtual machines, which changes
+    whenever the cached data of any object is invalidated (see bump_config_context_version()).
+    """
+    if (version := cache.get(CONFIG_CONTEXT_VERSION_KEY)) is None:
+        # The version has not been set (or has been evicted): assign a new one, unless another process has done so
+        cache.add(CONFIG_CONTEXT_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CONFIG_CONTEXT_VERSION_KEY)
+    return version
+
+
+def bump_config_context_version():
+    """
+    Assign a new version to the cached config context data, so that any data rendered before the invalidation is not
+    saved to the cache (see ConfigContextModel.cache_config_contexts()).
+    """
+    cache.set(CONFIG_CONTEXT_VERSION_KEY, uuid.uuid4().hex, timeout=None)
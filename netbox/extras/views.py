@@ -768,6 +768,7 @@ class WebhookView(generic.ObjectView):
             panels.WebhookPanel(),
             panels.WebhookHTTPPanel(),
             panels.WebhookSSLPanel(),
+            panels.WebhookBatchingPanel(),
         ],
         right_panels=[
             TextCodePanel('additional_headers', title=_('Additional Headers')),
@@ -1,24 +1,35 @@
 import hashlib
 import hmac
 import logging
+import pickle
+from datetime import timedelta
 
 import requests
-from django_rq import job
+from django_rq import get_queue, job
 from jinja2.exceptions import TemplateError
 
+from netbox.constants import RQ_QUEUE_DEFAULT
 from netbox.registry import registry
 from utilities.proxy import resolve_proxies
+from utilities.rqworker import get_rq_retry
 
 from .constants import WEBHOOK_EVENT_TYPES
 
 __all__ = (
+    'enqueue_webhook_batch',
+    'flush_webhook_batch',
     'generate_signature',
     'register_webhook_callback',
     'send_webhook',
+    'send_webhook_batch',
+    'send_webhook_request',
 )
 
 logger = logging.getLogger('netbox.webhooks')
 
+# Redis key under which the pending events for a batched webhook are held
+WEBHOOK_BATCH_KEY = 'netbox:webhooks:batch:{}'
+
 
 def register_webhook_callback(func):
     """
@@ -41,14 +52,10 @@ def generate_signature(request_body, secret):
     return hmac_prep.hexdigest()
 
 
-@job('default')
-def send_webhook(event_rule, object_type, event_type, data, timestamp, username, request=None, snapshots=None):
+def get_webhook_context(object_type, event_type, data, timestamp, username, request=None, snapshots=None):
     """
-    Make a POST request to the defined Webhook
+    Return the context data with which the headers, body, and URL of a webhook request are rendered for an event.
     """
-    webhook = event_rule.action_object
-
-    # Prepare context data for headers & body templates
     context = {
         'event': WEBHOOK_EVENT_TYPES.get(event_type, event_type),
         'timestamp': timestamp,
@@ -81,34 +88,20 @@ def send_webhook(event_rule, object_type, event_type, data, timestamp, username,
     if callback_data:
         context['context'] = callback_data
 
-    # Build the headers for the HTTP request
-    headers = {
-        'Content-Type': webhook.http_content_type,
-    }
-    try:
-        headers.update(webhook.render_headers(context))
-    except (TemplateError, ValueError) as e:
-        logger.error(f"Error parsing HTTP headers for webhook {webhook}: {e}")
-        raise e
+    return context
 
-    # Render the request body
-    try:
-        body = webhook.render_body(context)
-    except TemplateError as e:
-        logger.error(f"Error rendering request body for webhook {webhook}: {e}")
-        raise e
 
-    # Prepare the HTTP request
-    url = webhook.render_payload_url(context)
+def send_request(webhook, url, headers, body, description):
+    """
+    Send a request for the webhook to the specified URL, raising a RequestException if it fails.
+    """
     params = {
         'method': webhook.http_method,
         'url': url,
         'headers': headers,
         'data': body.encode('utf8'),
     }
-    logger.info(
-        f"Sending {params['method']} request to {params['url']} ({context['object_type']} {context['event']})"
-    )
+    logger.info(f"Sending {params['method']} request to {params['url']} ({description})")
     logger.debug(params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -130,8 +123,148 @@ def send_webhook(event_rule, object_type, event_type, data, timestamp, username,
 
     if 200 <= response.status_code <= 299:
         logger.info(f"Request succeeded; response status {response.status_code}")
-        return f"Status {response.status_code} returned, webhook successfully processed."
+        return response
     logger.warning(f"Request failed; response status {response.status_code}: {response.content}")
     raise requests.exceptions.RequestException(
         f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
     )
+
+
+def render_request(webhook, context):
+    """
+    Render and return the URL, headers, and body of a webhook request for the given context.
+    """
+    # Build the headers for the HTTP request
+    headers = {
+        'Content-Type': webhook.http_content_type,
+    }
+    try:
+        headers.update(webhook.render_headers(context))
+    except (TemplateError, ValueError) as e:
+        logger.error(f"Error parsing HTTP headers for webhook {webhook}: {e}")
+        raise e
+
+    # Render the request body
+    try:
+        body = webhook.render_body(context)
+    except TemplateError as e:
+        logger.error(f"Error rendering request body for webhook {webhook}: {e}")
+        raise e
+
+    return webhook.render_payload_url(context), headers, body
+
+
+@job('default')
+def send_webhook(event_rule, object_type, event_type, data, timestamp, username, request=None, snapshots=None):
+    """
+    Make a POST request to the defined Webhook
+    """
+    webhook = event_rule.action_object
+    context = get_webhook_context(object_type, event_type, data, timestamp, username, request, snapshots)
+    url, headers, body = render_request(webhook, context)
+
+    response = send_request(webhook, url, headers, body, f"{context['object_type']} {context['event']}")
+
+    return f"Status {response.status_code} returned, webhook successfully processed."
+
+
+@job('default')
+def send_webhook_batch(webhook, events, queue_name=RQ_QUEUE_DEFAULT):
+    """
+    Deliver a batch of events for the Webhook. Events are grouped by their rendered URL, and a single request is sent
+    to each URL. The body of each request is a JSON array of the bodies rendered for its events individually (with
+    the headers rendered for the first event).
+
+    If the events are destined for multiple URLs, the request to each is enqueued as a separate job, so that a failed
+    delivery is retried without repeating those which succeeded.
+    """
+    requests_by_url = {}
+    for event in events:
+        url, headers, body = render_request(webhook, get_webhook_context(**event))
+        if url in requests_by_url:
+            requests_by_url[url][1].append(body)
+        else:
+            requests_by_url[url] = (headers, [body])
+
+    if len(requests_by_url) == 1:
+        url, (headers, bodies) = next(iter(requests_by_url.items()))
+        return send_webhook_request(webhook, url, headers, '[' + ','.join(bodies) + ']', f"{len(bodies)} events")
+
+    rq_queue = get_queue(queue_name)
+    for url, (headers, bodies) in requests_by_url.items():
+        rq_queue.enqueue(
+            'extras.webhooks.send_webhook_request',
+            webhook=webhook,
+            url=url,
+            headers=headers,
+            body='[' + ','.join(bodies) + ']',
+            description=f"{len(bodies)} events",
+            retry=get_rq_retry()
+        )
+
+    return f"Enqueued delivery of {len(events)} events in {len(requests_by_url)} requests."
+
+
+@job('default')
+def send_webhook_request(webhook, url, headers, body, description):
+    """
+    Send a rendered request for the Webhook (see send_webhook_batch()).
+    """
+    response = send_request(webhook, url, headers, body, description)
+
+    return f"Status {response.status_code} returned, webhook successfully processed."
+
+
+def enqueue_webhook_batch(rq_queue, webhook, events):
+    """
+    Append events to the pending batch for a Webhook. Delivery of the batch is enqueued once it reaches the
+    maximum batch size (or immediately, if the webhook does not linger); otherwise, it is scheduled for after the
+    linger time when the first event is added.
+
+    Each event is a dictionary of the keyword arguments accepted by get_webhook_context().
+    """
+    key = WEBHOOK_BATCH_KEY.format(webhook.pk)
+    length = rq_queue.connection.rpush(key, *[pickle.dumps(event) for event in events])
+
+    if length >= webhook.batch_size or not webhook.batch_linger:
+        rq_queue.enqueue('extras.webhooks.flush_webhook_batch', webhook_id=webhook.pk, queue_name=rq_queue.name)
+    elif length == len(events):
+        # This is the first pending event for the webhook
+        rq_queue.enqueue_in(
+            timedelta(seconds=webhook.batch_linger),
+            'extras.webhooks.flush_webhook_batch',
+            webhook_id=webhook.pk,
+            queue_name=rq_queue.name
+        )
+
+
+def flush_webhook_batch(webhook_id, queue_name):
+    """
+    Divide all pending events for a Webhook into batches, and enqueue the delivery of each.
+    """
+    from extras.models import Webhook
+
+    rq_queue = get_queue(queue_name)
+    key = WEBHOOK_BATCH_KEY.format(webhook_id)
+
+    try:
+        webhook = Webhook.objects.get(pk=webhook_id)
+    except Webhook.DoesNotExist:
+        rq_queue.connection.delete(key)
+        return
+
+    while True:
+        # Atomically pop up to batch_size events from the head of the list
+        with rq_queue.connection.pipeline() as pipe:
+            pipe.lrange(key, 0, webhook.batch_size - 1)
+            pipe.ltrim(key, webhook.batch_size, -1)
+            items, __ = pipe.execute()
+        if not items:
+            break
+        rq_queue.enqueue(
+            'extras.webhooks.send_webhook_batch',
+            webhook=webhook,
+            events=[pickle.loads(item) for item in items],
+            queue_name=queue_name,
+            retry=get_rq_retry()
+        )
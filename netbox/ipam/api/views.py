@@ -17,9 +17,9 @@ from rest_framework.views import APIView
 from dcim.models import Interface
 from ipam import filtersets
 from ipam.models import *
-from ipam.utils import get_next_available_prefix
+from ipam.utils import batched_prefix_hierarchy, get_next_available_prefix
 from netbox.api.viewsets import NetBoxModelViewSet
-from netbox.api.viewsets.mixins import ObjectValidationMixin
+from netbox.api.viewsets.mixins import BulkInsertMixin, ObjectValidationMixin
 from netbox.config import get_config
 from netbox.constants import ADVISORY_LOCK_KEYS
 from utilities.api import get_serializer_for_model
@@ -46,7 +46,7 @@ class ASNRangeViewSet(NetBoxModelViewSet):
     filterset_class = filtersets.ASNRangeFilterSet
 
 
-class ASNViewSet(NetBoxModelViewSet):
+class ASNViewSet(BulkInsertMixin, NetBoxModelViewSet):
     queryset = ASN.objects.all()
     serializer_class = serializers.ASNSerializer
     filterset_class = filtersets.ASNFilterSet
@@ -83,6 +83,11 @@ class RoleViewSet(NetBoxModelViewSet):
 
 
 class PrefixViewSet(NetBoxModelViewSet):
+    """
+    Rebuilds the prefix hierarchy once per modified VRF for each bulk write request (see batched_prefix_hierarchy()).
+    Bulk creation is batched by the bulk operation which NetBoxModelViewSet enters for list payloads; a single prefix
+    is slotted into the hierarchy incrementally.
+    """
     queryset = Prefix.objects.prefetch_related("scope")
     serializer_class = serializers.PrefixSerializer
     filterset_class = filtersets.PrefixFilterSet
@@ -94,6 +99,14 @@ class PrefixViewSet(NetBoxModelViewSet):
             return serializers.PrefixLengthSerializer
         return super().get_serializer_class()
 
+    def perform_bulk_update(self, objects, update_data, partial):
+        with batched_prefix_hierarchy():
+            return super().perform_bulk_update(objects, update_data, partial)
+
+    def perform_bulk_destroy(self, objects, changelog_messages=None):
+        with batched_prefix_hierarchy():
+            super().perform_bulk_destroy(objects, changelog_messages)
+
 
 class IPRangeViewSet(NetBoxModelViewSet):
     queryset = IPRange.objects.all()
@@ -149,7 +162,7 @@ class VLANGroupViewSet(NetBoxModelViewSet):
     filterset_class = filtersets.VLANGroupFilterSet
 
 
-class VLANViewSet(NetBoxModelViewSet):
+class VLANViewSet(BulkInsertMixin, NetBoxModelViewSet):
     queryset = VLAN.objects.prefetch_related(
         'l2vpn_terminations',  # Referenced by VLANSerializer.l2vpn_termination
     )
@@ -5,6 +5,7 @@ from dcim.models import Device
 from virtualization.models import VirtualMachine
 
 from .models import IPAddress, Prefix
+from .utils import get_prefix_hierarchy_batch
 
 
 def update_parents_children(prefix):
@@ -33,6 +34,13 @@ def handle_prefix_saved(instance, created, **kwargs):
     # Prefix has changed (or new instance has been created)
     if created or instance.vrf_id != instance._vrf_id or instance.prefix != instance._prefix:
 
+        # Defer to the active batch (if any)
+        if (vrfs := get_prefix_hierarchy_batch()) is not None:
+            vrfs.add(instance.vrf_id)
+            if not created:
+                vrfs.add(instance._vrf_id)
+            return
+
         update_parents_children(instance)
         update_children_depth(instance)
 
@@ -46,6 +54,11 @@ def handle_prefix_saved(instance, created, **kwargs):
 @receiver(post_delete, sender=Prefix)
 def handle_prefix_deleted(instance, **kwargs):
 
+    # Defer to the active batch (if any)
+    if (vrfs := get_prefix_hierarchy_batch()) is not None:
+        vrfs.add(instance.vrf_id)
+        return
+
     update_parents_children(instance)
     update_children_depth(instance)
 
@@ -1,5 +1,6 @@
 import json
 import logging
+from unittest.mock import patch
 
 from django.test import tag
 from django.urls import reverse
@@ -9,6 +10,7 @@ from rest_framework import status
 from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
 from ipam.choices import *
 from ipam.models import *
+from ipam.utils import rebuild_prefixes
 from tenancy.models import Tenant
 from utilities.data import string_to_ranges
 from utilities.testing import APITestCase, APIViewTestCases, create_test_device, disable_logging
@@ -452,6 +454,34 @@ class PrefixTestCase(APIViewTestCases.APIViewTestCase):
         )
         Prefix.objects.bulk_create(prefixes)
 
+    def test_create_single_prefix_incrementally(self):
+        """
+        Creating a single prefix updates the hierarchy incrementally, rather than rebuilding it.
+        """
+        self.add_permissions('ipam.add_prefix')
+        url = reverse('ipam-api:prefix-list')
+
+        with patch('ipam.utils.rebuild_prefixes') as rebuild_prefixes:
+            response = self.client.post(url, {'prefix': '192.168.0.0/16'}, format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        rebuild_prefixes.assert_not_called()
+
+    def test_bulk_create_prefixes_batched(self):
+        """
+        Creating a list of prefixes rebuilds the hierarchy once, before the response is rendered.
+        """
+        self.add_permissions('ipam.add_prefix')
+        url = reverse('ipam-api:prefix-list')
+        data = [{'prefix': '10.0.0.0/8'}, {'prefix': '10.1.0.0/16'}, {'prefix': '10.1.1.0/24'}]
+
+        with patch('ipam.utils.rebuild_prefixes', wraps=rebuild_prefixes) as mock_rebuild_prefixes:
+            response = self.client.post(url, data, format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        mock_rebuild_prefixes.assert_called_once_with(None)
+        self.assertEqual([prefix['_depth'] for prefix in response.data], [0, 1, 2])
+
     @tag('regression')
     def test_create_with_invalid_prefix(self):
         """
@@ -9,7 +9,7 @@ from dcim.models import Location, Region, Site, SiteGroup
 from ipam.choices import *
 from ipam.constants import SERVICE_PORT_MAX, SERVICE_PORT_MIN
 from ipam.models import *
-from ipam.utils import rebuild_prefixes
+from ipam.utils import batched_prefix_hierarchy, rebuild_prefixes
 from utilities.data import string_to_ranges
 from virtualization.models import VirtualMachine
 
@@ -1563,6 +1563,54 @@ class PrefixHierarchyTestCase(TestCase):
         self.assertEqual((parent._depth, parent._children), (0, 1))
         self.assertEqual((child._depth, child._children), (1, 0))
 
+    def test_rebuild_prefixes_duplicate_prefix(self):
+        # Duplicate prefixes each count as a child of their parents
+        Prefix.objects.create(prefix=IPNetwork('10.0.0.0/16'))
+        Prefix.objects.filter(prefix__family=4).update(_depth=0, _children=0)
+
+        rebuild_prefixes(None)
+
+        prefixes = Prefix.objects.filter(prefix__family=4)
+        self.assertEqual(
+            [(p._depth, p._children) for p in prefixes],
+            [(0, 3), (1, 1), (1, 1), (2, 0)]
+        )
+
+    def test_batched_prefix_hierarchy(self):
+        vrf = VRF.objects.create(name='VRF 1')
+
+        with batched_prefix_hierarchy():
+            Prefix.objects.create(prefix=IPNetwork('10.0.0.0/12'))
+            Prefix.objects.create(prefix=IPNetwork('10.0.1.0/24'))
+            Prefix.objects.get(prefix='2001:db8::/40').delete()
+            prefix = Prefix.objects.get(prefix='10.0.0.0/24')
+            prefix.vrf = vrf
+            prefix.save()
+
+            # The hierarchy is not updated until the block exits
+            self.assertEqual(Prefix.objects.get(prefix='10.0.0.0/8')._children, 2)
+
+        prefixes = Prefix.objects.filter(vrf__isnull=True, prefix__family=4)
+        self.assertEqual(
+            [(str(p.prefix), p._depth, p._children) for p in prefixes],
+            [
+                ('10.0.0.0/8', 0, 3),
+                ('10.0.0.0/12', 1, 2),
+                ('10.0.0.0/16', 2, 1),
+                ('10.0.1.0/24', 3, 0),
+            ]
+        )
+        prefixes = Prefix.objects.filter(prefix__family=6)
+        self.assertEqual(
+            [(str(p.prefix), p._depth, p._children) for p in prefixes],
+            [
+                ('2001:db8::/32', 0, 1),
+                ('2001:db8::/48', 1, 0),
+            ]
+        )
+        prefix = Prefix.objects.get(vrf=vrf)
+        self.assertEqual((prefix._depth, prefix._children), (0, 0))
+
 
 class IPAddressTestCase(TestCase):
 
@@ -1,9 +1,14 @@
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 import netaddr
 from django.apps import apps
+from django.db import router, transaction
 from django.utils.translation import gettext_lazy as _
 
+from netbox.bulk import register_bulk_context
+
 from .constants import *
 
 __all__ = (
@@ -11,10 +16,15 @@ __all__ = (
     'add_available_vlans',
     'add_requested_prefixes',
     'annotate_ip_space',
+    'batched_prefix_hierarchy',
     'get_next_available_prefix',
+    'get_prefix_hierarchy_batch',
     'rebuild_prefixes',
 )
 
+# Holds the set of VRFs (if any) whose prefix hierarchy is to be rebuilt for the current thread
+_local = threading.local()
+
 
 @dataclass
 class AvailableIPSpace:
@@ -200,7 +210,8 @@ def add_available_vlans(vlans, vlan_group):
 
 def rebuild_prefixes(vrf):
     """
-    Rebuild the prefix hierarchy for all prefixes in the specified VRF (or global table).
+    Rebuild the prefix hierarchy for all prefixes in the specified VRF (or global table). Only prefixes whose depth or
+    child count has changed are written.
     """
     Prefix = apps.get_model('ipam', 'Prefix')
     prefix_queryset = Prefix.objects.filter(vrf=vrf)
@@ -218,30 +229,38 @@ def rebuild_prefixes(vrf):
             'children': 0,
         })
 
+    def pop_from_stack():
+        node = stack.pop()
+        for pk in node['pk']:
+            if current[pk] != (len(stack), node['children']):
+                update_queue.append(
+                    Prefix(pk=pk, _depth=len(stack), _children=node['children'])
+                )
+
     stack = []
     update_queue = []
-    prefixes = prefix_queryset.order_by('prefix', 'pk').values('pk', 'prefix')
+    current = {}
+    prefixes = prefix_queryset.order_by('prefix', 'pk').values('pk', 'prefix', '_depth', '_children')
 
     # Iterate through all Prefixes in the table, growing and shrinking the stack as we go
     for p in prefixes:
+        current[p['pk']] = (p['_depth'], p['_children'])
 
         # Grow the stack if this is a child of the most recent prefix
         if not stack or contains(stack[-1]['prefix'], p['prefix']):
             push_to_stack(p)
 
-        # Handle duplicate prefixes
+        # Handle duplicate prefixes (which count as children of each containing prefix)
         elif stack[-1]['prefix'] == p['prefix']:
             stack[-1]['pk'].append(p['pk'])
+            for n in stack[:-1]:
+                n['children'] += 1
 
         # If this is a sibling or parent of the most recent prefix, pop nodes from the
         # stack until we reach a parent prefix (or the root)
         else:
             while stack and not contains(stack[-1]['prefix'], p['prefix']):
-                node = stack.pop()
-                for pk in node['pk']:
-                    update_queue.append(
-                        Prefix(pk=pk, _depth=len(stack), _children=node['children'])
-                    )
+                pop_from_stack()
             push_to_stack(p)
 
         # Flush the update queue once it reaches 100 Prefixes
@@ -251,16 +270,49 @@ def rebuild_prefixes(vrf):
 
     # Clear out any prefixes remaining in the stack
     while stack:
-        node = stack.pop()
-        for pk in node['pk']:
-            update_queue.append(
-                Prefix(pk=pk, _depth=len(stack), _children=node['children'])
-            )
+        pop_from_stack()
 
     # Final flush of any remaining Prefixes
     Prefix.objects.bulk_update(update_queue, ['_depth', '_children'])
 
 
+def get_prefix_hierarchy_batch():
+    """
+    Return the set of VRF IDs collected for a hierarchy rebuild by batched_prefix_hierarchy() on the current thread,
+    or None if the prefix hierarchy is being maintained immediately.
+    """
+    return getattr(_local, 'vrfs', None)
+
+
+@register_bulk_context
+@contextmanager
+def batched_prefix_hierarchy():
+    """
+    Defer maintenance of the prefix hierarchy (the cached _depth and _children values) until the end of the block.
+    Within the block, saving or deleting a Prefix only marks its VRF as modified; when the block exits, the hierarchy
+    of each modified VRF (or the global table) is rebuilt once with rebuild_prefixes(). This turns a bulk operation on
+    N prefixes into a single linear pass per VRF, rather than N hierarchy queries. The block runs inside a
+    transaction, so the rebuilt hierarchy is committed along with the changes.
+
+    Nested invocations join the outermost block.
+    """
+    Prefix = apps.get_model('ipam', 'Prefix')
+
+    if get_prefix_hierarchy_batch() is not None:
+        yield
+        return
+
+    vrfs = _local.vrfs = set()
+    try:
+        with transaction.atomic(using=router.db_for_write(Prefix)):
+            yield
+            _local.vrfs = None
+            for vrf in vrfs:
+                rebuild_prefixes(vrf)
+    finally:
+        _local.vrfs = None
+
+
 def get_next_available_prefix(ipset, prefix_size):
     """
     Given a prefix length, allocate the next available prefix from an IPSet.
@@ -35,7 +35,7 @@ from .choices import PrefixStatusChoices
 from .constants import *
 from .models import *
 from .ui import panels
-from .utils import add_available_vlans, add_requested_prefixes, annotate_ip_space
+from .utils import add_available_vlans, add_requested_prefixes, annotate_ip_space, batched_prefix_hierarchy
 
 #
 # VRFs
@@ -967,12 +967,22 @@ class PrefixBulkCreateView(generic.BulkCreateView):
     pattern_target = 'prefix'
     template_name = 'ipam/prefix_bulk_add.html'
 
+    def _create_objects(self, form, request):
+        # Rebuild the prefix hierarchy once all prefixes have been created
+        with batched_prefix_hierarchy():
+            return super()._create_objects(form, request)
+
 
 @register_model_view(Prefix, 'bulk_import', path='import', detail=False)
 class PrefixBulkImportView(generic.BulkImportView):
     queryset = Prefix.objects.all()
     model_form = forms.PrefixImportForm
 
+    def create_and_update_objects(self, form, request):
+        # Rebuild the prefix hierarchy once all prefixes have been imported
+        with batched_prefix_hierarchy():
+            return super().create_and_update_objects(form, request)
+
 
 @register_model_view(Prefix, 'bulk_edit', path='edit', detail=False)
 class PrefixBulkEditView(generic.BulkEditView):
@@ -981,6 +991,11 @@ class PrefixBulkEditView(generic.BulkEditView):
     table = tables.PrefixTable
     form = forms.PrefixBulkEditForm
 
+    def _update_objects(self, form, request):
+        # Rebuild the prefix hierarchy once all prefixes have been updated
+        with batched_prefix_hierarchy():
+            return super()._update_objects(form, request)
+
 
 @register_model_view(Prefix, 'bulk_delete', path='delete', detail=False)
 class PrefixBulkDeleteView(generic.BulkDeleteView):
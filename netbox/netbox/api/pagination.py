@@ -1,5 +1,9 @@
+import hashlib
 import warnings
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from rest_framework.exceptions import ValidationError
@@ -8,11 +12,23 @@ from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.config import get_config
+from utilities.keyset import apply_keyset, decode_cursor, encode_cursor, get_keyset_ordering, get_keyset_values
+from utilities.query import estimate_count
+
+__all__ = (
+    'COUNT_CACHE_KEY',
+    'LimitOffsetListPagination',
+    'NetBoxPagination',
+    'StripCountAnnotationsPaginator',
+)
+
+# Cache key for the object counts of list queries (per API_COUNT_STRATEGY), identified by a hash of the count query
+COUNT_CACHE_KEY = 'netbox:api:count:{}'
 
 
 class NetBoxPagination(LimitOffsetPagination):
     """
-    Provides two mutually exclusive pagination mechanisms: offset-based and cursor-based.
+    Provides three mutually exclusive pagination mechanisms: offset-based, cursor-based, and keyset-based.
 
     Offset-based pagination employs `offset` and (optionally) `limit` parameters to page through results following the
     model's natural order. `offset` indicates the number of results to skip. This provides very human-friendly behavior,
@@ -25,18 +41,32 @@ class NetBoxPagination(LimitOffsetPagination):
     to ensure pagination is consistent. This approach is less human-friendly but offers superior performance to
     offset-based pagination. In cursor mode, `count` is omitted (null) for performance.
 
-    Offset- and cursor-based pagination are mutually exclusive: Only `offset` _or_ `start` is permitted for a request.
+    Keyset-based pagination employs `cursor` and (optionally) `limit` parameters to page through results following
+    any requested ordering. `cursor` is an opaque value encoding the sort key of the last object on the previous page
+    (as provided in the `next` link), or empty to request the first page. Like cursor-based pagination, `count` is
+    omitted (null).
+
+    Only one of `offset`, `start`, or `cursor` is permitted for a request.
+
+    The total number of objects reported for offset-based pagination is determined per API_COUNT_STRATEGY: exactly,
+    by planner estimate, or from a short-lived cache. The method employed is indicated by the X-Count-Type response
+    header.
 
     `limit` may be set to zero (`?limit=0`). This returns all objects matching a query, but retains the same format as
     a paginated request. The limit can only be disabled if `MAX_PAGE_SIZE` has been set to 0 or None.
     """
     start_query_param = 'start'
+    cursor_query_param = 'cursor'
 
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
         self.start = None
+        self.cursor = None
         self._page_length = 0
         self._last_pk = None
+        self._next_cursor = None
+        self._has_next = None
+        self.count_type = None
 
     def paginate_queryset(self, queryset, request, view=None):
 
@@ -47,9 +77,24 @@ class NetBoxPagination(LimitOffsetPagination):
             )
 
         self.start = self.get_start(request)
+        self.cursor = request.query_params.get(self.cursor_query_param)
         self.limit = self.get_limit(request)
         self.request = request
 
+        # Keyset-based pagination
+        if self.cursor is not None:
+            if self.offset_query_param in request.query_params or self.start is not None:
+                raise ValidationError(
+                    _("'{cursor_param}' is mutually exclusive with '{offset_param}' and '{start_param}'.").format(
+                        cursor_param=self.cursor_query_param,
+                        offset_param=self.offset_query_param,
+                        start_param=self.start_query_param,
+                    )
+                )
+            if not isinstance(queryset, QuerySet):
+                raise ValidationError(_("Keyset pagination is not supported for this endpoint."))
+            return self.paginate_keyset(queryset)
+
         # Cursor-based pagination
         if self.start is not None:
             if self.offset_query_param in request.query_params:
@@ -75,17 +120,28 @@ class NetBoxPagination(LimitOffsetPagination):
             return results
 
         # Offset-based pagination
+        self._has_next = None
         if isinstance(queryset, QuerySet):
             self.count = self.get_queryset_count(queryset)
         else:
             # We're dealing with an iterable, not a QuerySet
             self.count = len(queryset)
+            self.count_type = 'exact'
 
         self.offset = self.get_offset(request)
 
         if self.limit and self.count > self.limit and self.template is not None:
             self.display_page_controls = True
 
+        # An estimated or cached count may not reflect the objects actually present, so determine whether a following
+        # page exists by retrieving one object beyond the current page
+        if self.count_type != 'exact':
+            if not self.limit:
+                return list(queryset[self.offset:])
+            results = list(queryset[self.offset:self.offset + self.limit + 1])
+            self._has_next = len(results) > self.limit
+            return results[:self.limit]
+
         if self.count == 0 or self.offset > self.count:
             return list()
 
@@ -93,6 +149,31 @@ class NetBoxPagination(LimitOffsetPagination):
             return list(queryset[self.offset:self.offset + self.limit])
         return list(queryset[self.offset:])
 
+    def paginate_keyset(self, queryset):
+        """
+        Return the page of objects following the sort key encoded in the current cursor (if any).
+        """
+        self.count = None
+        self.offset = 0
+
+        try:
+            keys = get_keyset_ordering(queryset)
+            values = decode_cursor(self.cursor, keys) if self.cursor else None
+            queryset = apply_keyset(queryset, keys, values)
+        except ValueError as e:
+            raise ValidationError({self.cursor_query_param: str(e)})
+
+        results = list(queryset[:self.limit]) if self.limit else list(queryset)
+
+        # Encode the sort key of the last object as the cursor for the next page
+        self._page_length = len(results)
+        if self.limit and self._page_length == self.limit:
+            last = results[-1]
+            last_pk = last.pk if hasattr(last, 'pk') else last['pk']
+            self._next_cursor = encode_cursor(keys, get_keyset_values(queryset, keys, last_pk))
+
+        return results
+
     def get_start(self, request):
         try:
             value = int(request.query_params[self.start_query_param])
@@ -136,15 +217,64 @@ class NetBoxPagination(LimitOffsetPagination):
 
         return max_limit
 
+    def get_count_queryset(self, queryset):
+        """
+        Return the queryset to be counted in place of the given queryset.
+        """
+        return queryset
+
     def get_queryset_count(self, queryset):
+        """
+        Return the number of objects in the queryset per API_COUNT_STRATEGY, recording the method by which the count
+        was determined as `count_type`.
+        """
+        queryset = self.get_count_queryset(queryset)
+        strategy = settings.API_COUNT_STRATEGY
+
+        if strategy == 'estimate':
+            # Count small result sets exactly, as doing so is inexpensive (and estimates for them are least reliable)
+            if (count := estimate_count(queryset)) >= settings.API_COUNT_ESTIMATE_THRESHOLD:
+                self.count_type = 'estimated'
+                return count
+
+        elif strategy == 'cache':
+            try:
+                sql, params = queryset.query.sql_with_params()
+            except EmptyResultSet:
+                self.count_type = 'exact'
+                return 0
+            key = COUNT_CACHE_KEY.format(hashlib.sha256(f'{sql}{params!r}'.encode()).hexdigest())
+            if (count := cache.get(key)) is not None:
+                self.count_type = 'cached'
+                return count
+            count = queryset.count()
+            cache.set(key, count, settings.API_COUNT_CACHE_TIMEOUT)
+            self.count_type = 'exact'
+            return count
+
+        self.count_type = 'exact'
         return queryset.count()
 
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count_type:
+            response['X-Count-Type'] = self.count_type
+        return response
+
     def get_next_link(self):
 
         # Pagination has been disabled
         if not self.limit:
             return None
 
+        # Keyset mode
+        if self.cursor is not None:
+            if self._next_cursor is None:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.cursor_query_param, self._next_cursor)
+            return replace_query_param(url, self.limit_query_param, self.limit)
+
         # Cursor mode
         if self.start is not None:
             if self._page_length < self.limit:
@@ -155,6 +285,14 @@ class NetBoxPagination(LimitOffsetPagination):
             url = remove_query_param(url, self.offset_query_param)
             return url
 
+        # The count is approximate: a following page exists only if one more object was found beyond this page
+        if self._has_next is not None:
+            if not self._has_next:
+                return None
+            url = self.request.build_absolute_uri()
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -163,8 +301,8 @@ class NetBoxPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
-        # Cursor mode: forward-only
-        if self.start is not None:
+        # Cursor & keyset modes: forward-only
+        if self.start is not None or self.cursor is not None:
             return None
 
         return super().get_previous_link()
@@ -183,6 +321,19 @@ class NetBoxPagination(LimitOffsetPagination):
                 'type': 'integer',
             },
         })
+        parameters.append({
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': (
+                'Keyset pagination: return results following the opaque cursor provided in the `next` link, in the '
+                'requested ordering. Pass an empty value to request the first page. Mutually exclusive with offset '
+                'and start.'
+            ),
+            'schema': {
+                'type': 'string',
+            },
+        })
         return parameters
 
 
@@ -191,12 +342,12 @@ class StripCountAnnotationsPaginator(NetBoxPagination):
     Strips the annotations on the queryset before getting the count
     to optimize pagination of complex queries.
     """
-    def get_queryset_count(self, queryset):
+    def get_count_queryset(self, queryset):
         # Clone the queryset to avoid messing up the actual query
         cloned_queryset = queryset.all()
         cloned_queryset.query.annotations.clear()
 
-        return cloned_queryset.count()
+        return cloned_queryset
 
 
 class LimitOffsetListPagination(LimitOffsetPagination):
@@ -1,7 +1,8 @@
-from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
 
 __all__ = (
     'FormlessBrowsableAPIRenderer',
+    'NDJSONRenderer',
     'TextRenderer',
 )
 
@@ -26,3 +27,18 @@ class TextRenderer(BaseRenderer):
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         return str(data)
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Render data as newline-delimited JSON, i.e. a single line of compact JSON terminated by a newline. List results
+    are streamed one object per line (see StreamingListMixin).
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def get_indent(self, accepted_media_type, renderer_context):
+        return None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(data, accepted_media_type, renderer_context) + b'\n'
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from functools import cached_property
 
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
@@ -8,11 +9,20 @@ from django_pglocks import advisory_lock
 from rest_framework import mixins as drf_mixins
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer
 from rest_framework.viewsets import GenericViewSet
 
+from core.changelog import batched_change_logging
+from netbox.api.serializers import BaseModelSerializer, WritableNestedSerializer
 from netbox.api.serializers.features import ChangeLogMessageSerializer
+from netbox.bulk import bulk_operation
 from netbox.constants import ADVISORY_LOCK_KEYS
-from utilities.api import get_annotations_for_serializer, get_prefetches_for_serializer
+from utilities.api import (
+    get_annotations_for_serializer,
+    get_prefetches_for_serializer,
+    prefetch_related_objects_by_attrs,
+    prefetch_related_objects_by_pk,
+)
 from utilities.exceptions import AbortRequest, PreconditionFailed
 from utilities.query import reapply_model_ordering
 
@@ -142,6 +152,7 @@ class NetBoxReadOnlyModelViewSet(
     ETagMixin,
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.ListModelMixin,
     BaseViewSet
@@ -156,6 +167,7 @@ class NetBoxModelViewSet(
     mixins.ObjectValidationMixin,
     mixins.CustomFieldsMixin,
     mixins.ExportTemplatesMixin,
+    mixins.StreamingListMixin,
     drf_mixins.CreateModelMixin,
     drf_mixins.RetrieveModelMixin,
     drf_mixins.UpdateModelMixin,
@@ -187,6 +199,42 @@ class NetBoxModelViewSet(
 
         return super().get_serializer(*args, **kwargs)
 
+    def prefetch_related_objects(self, data):
+        """
+        Resolve all related objects referenced across a list of objects in the request data (e.g. for bulk creation
+        or modification) using one query per model, rather than one query per reference. References to objects of
+        the model being written are excluded, as these may change while the request is processed.
+        """
+        pks, attrs = defaultdict(set), defaultdict(list)
+
+        for name, field in self.get_serializer().fields.items():
+            if field.read_only:
+                continue
+            nested = field.child if isinstance(field, ListSerializer) else field
+            if not isinstance(nested, WritableNestedSerializer) and not (
+                isinstance(nested, BaseModelSerializer) and nested.nested
+            ):
+                continue
+            if (model := nested.Meta.model) is self.queryset.model:
+                continue
+
+            for row in data:
+                if not isinstance(row, dict) or name not in row:
+                    continue
+                values = row[name]
+                for value in values if isinstance(values, list) else [values]:
+                    if isinstance(value, dict) and list(value) == ['id']:
+                        value = value['id']
+                    if isinstance(value, dict):
+                        attrs[model].append(value)
+                    elif type(value) is int:
+                        pks[model].add(value)
+
+        for model, model_pks in pks.items():
+            prefetch_related_objects_by_pk(model, model_pks)
+        for model, model_attrs in attrs.items():
+            prefetch_related_objects_by_attrs(model, model_attrs, user=self.request.user)
+
     def dispatch(self, request, *args, **kwargs):
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
 
@@ -218,6 +266,8 @@ class NetBoxModelViewSet(
     # Creates
 
     def create(self, request, *args, **kwargs):
+        if isinstance(request.data, list):
+            self.prefetch_related_objects(request.data)
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         bulk_create = getattr(serializer, 'many', False)
@@ -251,9 +301,13 @@ class NetBoxModelViewSet(
         logger = logging.getLogger(f'netbox.api.views.{self.__class__.__name__}')
         logger.info(f"Creating new {model._meta.verbose_name}")
 
+        # A bulk operation is entered only when creating multiple objects, as a single object is handled more cheaply
+        # as it is saved (e.g. a Prefix is slotted into the hierarchy incrementally)
+        batch = bulk_operation() if getattr(serializer, 'many', False) else batched_change_logging()
+
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic(using=router.db_for_write(model)):
+            with transaction.atomic(using=router.db_for_write(model)), batch:
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
@@ -1,21 +1,35 @@
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import router, transaction
-from django.http import Http404
-from rest_framework import status
+from itertools import batched
+
+from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
+from django.db import IntegrityError, models, router, transaction
+from django.db.models.signals import post_save, pre_save
+from django.http import Http404, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.utils import model_meta
 
 from core.models import ObjectType
-from extras.models import ExportTemplate
-from netbox.api.serializers import BulkOperationSerializer
+from extras.models import CustomField, ExportTemplate
+from netbox.api.renderers import NDJSONRenderer
+from netbox.api.serializers import BulkOperationSerializer, TaggableModelSerializer
 from netbox.api.serializers.bulk import get_bulk_update_serializer_class
+from netbox.bulk import bulk_operation
+from netbox.config import get_config
+from netbox.models import BaseModel
+from netbox.models.features import CustomFieldsMixin as CustomFieldsModelMixin
 
 __all__ = (
     'BulkDestroyModelMixin',
+    'BulkInsertMixin',
     'BulkUpdateModelMixin',
     'CustomFieldsMixin',
     'ExportTemplatesMixin',
     'ObjectValidationMixin',
     'SequentialBulkCreatesMixin',
+    'StreamingListMixin',
 )
 
 
@@ -54,6 +68,54 @@ class ExportTemplatesMixin:
         return super().list(request, *args, **kwargs)
 
 
+class StreamingListMixin:
+    """
+    Enable the streaming of list results, either as newline-delimited JSON (when `application/x-ndjson` is accepted or
+    `?format=ndjson` is passed) or as a JSON array (when `?stream=true` is passed). All objects matching the request
+    are returned without pagination. Objects are retrieved and serialized in chunks as the response is written, so that
+    memory consumption remains constant regardless of the number of results.
+
+    As with `?limit=0`, streaming is available only if `MAX_PAGE_SIZE` has been set to 0 or None.
+    """
+    stream_chunk_size = 1000
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if self.action == 'list':
+            renderers.append(NDJSONRenderer())
+        return renderers
+
+    def list(self, request, *args, **kwargs):
+        ndjson = isinstance(request.accepted_renderer, NDJSONRenderer)
+        if not ndjson and request.query_params.get('stream', '').lower() not in ('true', '1'):
+            return super().list(request, *args, **kwargs)
+        if get_config().MAX_PAGE_SIZE:
+            raise ValidationError(_("Streaming is not available while MAX_PAGE_SIZE is set."))
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if ndjson:
+            return StreamingHttpResponse(
+                self.stream_queryset(queryset, NDJSONRenderer()),
+                content_type=NDJSONRenderer.media_type
+            )
+
+        def stream_array():
+            yield b'['
+            for i, chunk in enumerate(self.stream_queryset(queryset, JSONRenderer(), separator=b',')):
+                yield chunk if not i else b',' + chunk
+            yield b']'
+
+        return StreamingHttpResponse(stream_array(), content_type=JSONRenderer.media_type)
+
+    def stream_queryset(self, queryset, renderer, separator=b''):
+        """
+        Yield the rendered representations of all objects in the queryset, one chunk of objects at a time.
+        """
+        for chunk in batched(queryset.iterator(chunk_size=self.stream_chunk_size), self.stream_chunk_size):
+            serializer = self.get_serializer(chunk, many=True)
+            yield separator.join(renderer.render(data) for data in serializer.data)
+
+
 class SequentialBulkCreatesMixin:
     """
     Perform bulk creation of new objects sequentially, rather than all at once. This ensures that any validation
@@ -61,11 +123,12 @@ class SequentialBulkCreatesMixin:
     appropriately.
     """
     def create(self, request, *args, **kwargs):
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
-            if not isinstance(request.data, list):
-                # Creating a single object
-                return super().create(request, *args, **kwargs)
+        if not isinstance(request.data, list):
+            # Creating a single object
+            return super().create(request, *args, **kwargs)
 
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), bulk_operation():
+            self.prefetch_related_objects(request.data)
             return_data = []
             for data in request.data:
                 serializer = self.get_serializer(data=data)
@@ -78,6 +141,86 @@ class SequentialBulkCreatesMixin:
             return Response(return_data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+class BulkInsertMixin:
+    """
+    Create multiple objects using a single INSERT query, rather than saving each object individually. All objects are
+    validated before any are created. Signals are sent for each object (within a bulk operation, so that change
+    logging, event rules, and search caching are processed in batch).
+
+    This is suitable only for models which do not perform any processing on save(), and whose validation does not
+    depend on other objects being created in the same request. Where the model overrides save() (or the serializer
+    overrides create()), objects are created individually.
+    """
+    # Classes whose save() methods are replicated by perform_bulk_insert()
+    bulk_insert_safe_classes = (models.Model, BaseModel, CustomFieldsModelMixin)
+
+    def supports_bulk_insert(self, serializer):
+        model = self.queryset.model
+        for cls in model.__mro__:
+            if 'save' in cls.__dict__ and cls not in self.bulk_insert_safe_classes:
+                return False
+        return type(serializer.child).create is TaggableModelSerializer.create
+
+    def perform_create(self, serializer):
+        if not getattr(serializer, 'many', False) or not self.supports_bulk_insert(serializer):
+            return super().perform_create(serializer)
+
+        model = self.queryset.model
+        using = router.db_for_write(model)
+        try:
+            with transaction.atomic(using=using), bulk_operation():
+                serializer.instance = self.perform_bulk_insert(serializer.validated_data, using)
+                self._validate_objects(serializer.instance)
+        except ObjectDoesNotExist:
+            raise PermissionDenied()
+        except IntegrityError as e:
+            raise serializers.ValidationError(str(e))
+
+    def perform_bulk_insert(self, validated_data, using):
+        """
+        Create an object for each set of validated data, and return the list of new objects.
+        """
+        model = self.queryset.model
+        m2m_fields = [name for name, info in model_meta.get_field_info(model).relations.items() if info.to_many]
+        custom_fields = CustomField.objects.get_for_model(model) if issubclass(model, CustomFieldsModelMixin) else []
+
+        instances, related_data = [], []
+        for data in validated_data:
+            data = dict(data)
+            tags, add_tags = data.pop('tags', None), data.pop('add_tags', None)
+            data.pop('remove_tags', None)
+            m2m_values = {name: data.pop(name) for name in m2m_fields if name in data}
+            instance = model(**data)
+
+            # Replicate the processing performed by BaseModel.save() and CustomFieldsMixin.save()
+            instance._coerce_nullable_unique_chars()
+            for cf in custom_fields:
+                if cf.name not in instance.custom_field_data and cf.default is not None:
+                    instance.custom_field_data[cf.name] = cf.default
+
+            instances.append(instance)
+            related_data.append((m2m_values, tags, add_tags))
+
+        for instance in instances:
+            pre_save.send(sender=model, instance=instance, raw=False, using=using, update_fields=None)
+        model.objects.using(using).bulk_create(instances)
+
+        # As with ModelSerializer.create(), post_save is sent before many-to-many values are assigned, so that the
+        # assignments are recorded as part of the object's creation
+        for instance, (m2m_values, tags, add_tags) in zip(instances, related_data):
+            post_save.send(sender=model, instance=instance, created=True, update_fields=None, raw=False, using=using)
+            for name, value in m2m_values.items():
+                getattr(instance, name).set(value)
+            if tags:
+                # Cache tags on the instance so that change logging can reuse them
+                instance._tags = tags
+                instance.tags.set([t.name for t in tags])
+            elif add_tags:
+                instance.tags.add(*[t.name for t in add_tags])
+
+        return instances
+
+
 class BulkUpdateModelMixin:
     """
     Support bulk modification of objects using the list endpoint for a model. Accepts a PATCH action with a list of one
@@ -106,6 +249,7 @@ class BulkUpdateModelMixin:
         qs = self.get_bulk_update_queryset().filter(
             pk__in=[o['id'] for o in serializer.data]
         )
+        self.prefetch_related_objects(request.data)
 
         # Map update data by object ID
         update_data = {
@@ -122,7 +266,7 @@ class BulkUpdateModelMixin:
 
     def perform_bulk_update(self, objects, update_data, partial):
         updated_pks = []
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), bulk_operation():
             for obj in objects:
                 data = update_data.get(obj.id)
                 if hasattr(obj, 'snapshot'):
@@ -185,7 +329,7 @@ class BulkDestroyModelMixin:
 
     def perform_bulk_destroy(self, objects, changelog_messages=None):
         changelog_messages = changelog_messages or {}
-        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+        with transaction.atomic(using=router.db_for_write(self.queryset.model)), bulk_operation():
             for obj in objects:
                 if hasattr(obj, 'snapshot'):
                     obj.snapshot()
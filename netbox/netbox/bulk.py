@@ -0,0 +1,102 @@
+import logging
+import threading
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+
+from django.db import transaction
+
+from netbox.registry import registry
+
+__all__ = (
+    'BulkOperation',
+    'bulk_operation',
+    'get_bulk_operation',
+    'register_bulk_context',
+)
+
+logger = logging.getLogger('netbox.bulk')
+
+# Holds the active BulkOperation (if any) for the current thread
+_local = threading.local()
+
+
+class BulkOperation:
+    """
+    Collects the instances passed to signal receivers during a bulk operation, so that each receiver's batch handler
+    can be called once with all affected instances of a model, rather than once per instance.
+    """
+    def __init__(self):
+        # Maps each batch handler to the affected instances of each model, keyed by primary key
+        self.pending = defaultdict(lambda: defaultdict(dict))
+
+    def defer(self, handler, sender, instance, pk=None):
+        """
+        Defer the processing of an instance to the given batch handler. The handler is called as handler(sender,
+        instances) when the bulk operation completes, where `instances` maps the primary key of each instance to the
+        instance. (Keys are recorded when deferred, as the primary key of a deleted instance is subsequently cleared;
+        `pk` may be passed where the instance's primary key has already been cleared.) If the same instance is
+        deferred more than once, only its most recent state is passed.
+        """
+        self.pending[handler][sender][instance.pk if pk is None else pk] = instance
+
+    def discard(self, handler, sender, pk):
+        """
+        Cancel the processing of an instance previously deferred to the given batch handler (if any).
+        """
+        if handler in self.pending:
+            self.pending[handler][sender].pop(pk, None)
+
+    def flush(self):
+        """
+        Call each batch handler with its pending instances. Any instances deferred by the handlers themselves are
+        processed in turn.
+        """
+        while self.pending:
+            pending, self.pending = self.pending, defaultdict(lambda: defaultdict(dict))
+            for handler, senders in pending.items():
+                for sender, instances in senders.items():
+                    if instances:
+                        logger.debug(f'Calling {handler.__qualname__} for {len(instances)} {sender._meta.label}')
+                        handler(sender, instances)
+
+
+def get_bulk_operation():
+    """
+    Return the BulkOperation for the current thread, or None if no bulk operation is in progress.
+    """
+    return getattr(_local, 'operation', None)
+
+
+def register_bulk_context(func):
+    """
+    Decorator for registering a context manager to be entered for every bulk operation, e.g. to defer some
+    maintenance until the operation completes.
+    """
+    registry['bulk_contexts'].append(func)
+
+    return func
+
+
+@contextmanager
+def bulk_operation():
+    """
+    Perform a bulk operation (e.g. the creation, modification, or deletion of many objects at once). The block runs
+    inside a transaction, and within all registered bulk contexts (see register_bulk_context()). Signal receivers may
+    defer the processing of each instance to a batch handler (see BulkOperation.defer()), which is called once for all
+    affected instances when the block exits.
+
+    Nested invocations join the outermost block.
+    """
+    if (operation := get_bulk_operation()) is not None:
+        yield operation
+        return
+
+    operation = _local.operation = BulkOperation()
+    try:
+        with transaction.atomic(), ExitStack() as stack:
+            for context in registry['bulk_contexts']:
+                stack.enter_context(context())
+            yield operation
+            operation.flush()
+    finally:
+        _local.operation = None
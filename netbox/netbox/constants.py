@@ -42,6 +42,9 @@ ADVISORY_LOCK_KEYS = {
 
     # Jobs
     'job-schedules': 110100,
+
+    # Cable path tracing
+    'cable-path-tracing': 115100,
 }
 
 # TODO: Remove in NetBox v4.7
@@ -1,12 +1,16 @@
 from contextvars import ContextVar
 
 __all__ = (
+    'config_context_cache_queue',
     'current_request',
     'events_queue',
     'query_cache',
+    'search_cache_queue',
 )
 
 
+config_context_cache_queue = ContextVar('config_context_cache_queue', default=None)
 current_request = ContextVar('current_request', default=None)
 events_queue = ContextVar('events_queue', default=dict())
 query_cache = ContextVar('query_cache', default=None)
+search_cache_queue = ContextVar('search_cache_queue', default=None)
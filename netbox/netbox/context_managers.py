@@ -1,8 +1,19 @@
 from collections import defaultdict
 from contextlib import contextmanager
 
+from django.db import router, transaction
+
 from extras.events import flush_events
-from netbox.context import current_request, events_queue, query_cache
+from extras.models import CachedValue
+from extras.utils import get_config_context_version
+from netbox.bulk import BulkOperation
+from netbox.context import (
+    config_context_cache_queue,
+    current_request,
+    events_queue,
+    query_cache,
+    search_cache_queue,
+)
 from netbox.utils import register_request_processor
 
 
@@ -22,10 +33,52 @@ def event_tracking(request):
     yield
 
     # Flush queued webhooks to RQ
-    if events := list(events_queue.get().values()):
-        flush_events(events)
+    flush_events(list(events_queue.get().values()), request=request)
 
     # Clear context vars
     current_request.set(None)
     events_queue.set({})
     query_cache.set(None)
+
+
+@register_request_processor
+@contextmanager
+def search_cache_tracking(request):
+    """
+    Collect changes to searchable objects while processing a request, then update the search cache once for each
+    affected object before returning the response.
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    queue = BulkOperation()
+    search_cache_queue.set(queue)
+
+    yield
+
+    # Apply all committed changes to the search cache
+    search_cache_queue.set(None)
+    if queue.pending:
+        with transaction.atomic(using=router.db_for_write(CachedValue)):
+            queue.flush()
+
+
+@register_request_processor
+@contextmanager
+def config_context_cache_tracking(request):
+    """
+    Collect the config context data rendered for devices and virtual machines while processing a request, then save
+    it to the cache of each object in bulk before returning the response.
+
+    :param request: WSGIRequest object with a unique `id` set
+    """
+    queue = defaultdict(dict)
+    config_context_cache_queue.set(queue)
+
+    # The version must be retrieved before any data is rendered, so that data invalidated in the meantime is discarded
+    version = get_config_context_version()
+
+    yield
+
+    config_context_cache_queue.set(None)
+    for model, data in queue.items():
+        model.cache_config_contexts(data, version)
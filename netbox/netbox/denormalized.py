@@ -1,12 +1,21 @@
 import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import cache
 
+from django.db import connection, connections, router, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from netbox.bulk import register_bulk_context
 from netbox.registry import registry
 
 logger = logging.getLogger('netbox.denormalized')
 
+# Holds the objects (if any) whose denormalized fields are to be updated for the current thread
+_local = threading.local()
+
 
 def register(model, field_name, mappings):
     """
@@ -27,31 +36,102 @@ def register(model, field_name, mappings):
     )
 
 
+@cache
+def _compile_update(model, field_name, mappings):
+    """
+    Compile the SQL statement used to update a registered denormalized field from its related objects. Only rows
+    having one or more outdated values are written. The statement expects a single parameter: a list of the related
+    objects' primary keys.
+    """
+    qn = connection.ops.quote_name
+    field = model._meta.get_field(field_name)
+    rel_model = field.related_model
+    columns = [
+        (qn(model._meta.get_field(denorm).column), qn(rel_model._meta.get_field(origin).column))
+        for denorm, origin in mappings
+    ]
+    assignments = ', '.join(f'{column} = s.{origin_column}' for column, origin_column in columns)
+    changed = ' OR '.join(f't.{column} IS DISTINCT FROM s.{origin_column}' for column, origin_column in columns)
+    rel_pk = qn(rel_model._meta.pk.column)
+
+    return (
+        f'UPDATE {qn(model._meta.db_table)} AS t SET {assignments} '
+        f'FROM {qn(rel_model._meta.db_table)} AS s '
+        f'WHERE t.{qn(field.column)} = s.{rel_pk} AND s.{rel_pk} = ANY(%s) AND ({changed})'
+    )
+
+
+def update_denormalized_values(sender, pks):
+    """
+    Update all denormalized fields which reference the specified objects of the sender model, using one UPDATE
+    statement per registered field. Returns the total number of rows updated.
+    """
+    total = 0
+    pks = list(pks)
+
+    for model, field_name, mappings in registry['denormalized_fields'].get(sender, []):
+        sql = _compile_update(model, field_name, tuple(mappings.items()))
+        with connections[router.db_for_write(model)].cursor() as cursor:
+            cursor.execute(sql, [pks])
+            count = cursor.rowcount
+        logger.debug(f'Updated {count} rows for {model._meta.label}.{field_name} ({len(pks)} {sender._meta.label})')
+        total += count
+
+    return total
+
+
+def get_denormalized_batch():
+    """
+    Return the mapping of models to primary keys of objects collected by batched_denormalized_updates() for the
+    current thread, or None if denormalized fields are being updated immediately.
+    """
+    return getattr(_local, 'pending', None)
+
+
+@register_bulk_context
+@contextmanager
+def batched_denormalized_updates():
+    """
+    Defer the update of denormalized fields until the end of the block. Within the block, saving an object only
+    records it as modified; when the block exits, the denormalized fields referencing all modified objects of each
+    model are updated together. The block runs inside a transaction, so the updates are committed along with the
+    changes.
+
+    Nested invocations join the outermost block.
+    """
+    if get_denormalized_batch() is not None:
+        yield
+        return
+
+    pending = _local.pending = defaultdict(set)
+    try:
+        with transaction.atomic():
+            yield
+            _local.pending = None
+            for sender, pks in pending.items():
+                count = update_denormalized_values(sender, pks)
+                logger.info(f'Updated denormalized fields on {count} rows for {len(pks)} {sender._meta.label}')
+    finally:
+        _local.pending = None
+
+
 @receiver(post_save)
 def update_denormalized_fields(sender, instance, created, raw, **kwargs):
     """
     Check if the sender has denormalized fields registered, and update them as necessary.
     """
-    def _get_field_value(instance, field_name):
-        field = instance._meta.get_field(field_name)
-        return field.value_from_object(instance)
-
     # Skip for new objects or those being populated from raw data
     if created or raw:
         return
 
-    # Look up any denormalized fields referencing this model from the application registry
-    for model, field_name, mappings in registry['denormalized_fields'].get(sender, []):
-        logger.debug(f'Updating denormalized values for {model}.{field_name}')
-        filter_params = {
-            field_name: instance.pk,
-        }
-        update_params = {
-            # Map the denormalized field names to the instance's values
-            denorm: _get_field_value(instance, origin) for denorm, origin in mappings.items()
-        }
-
-        # TODO: Improve efficiency here by placing conditions on the query?
-        # Update all the denormalized fields with the triggering object's new values
-        count = model.objects.filter(**filter_params).update(**update_params)
-        logger.debug(f'Updated {count} rows')
+    # Skip models which have no denormalized fields referencing them
+    if sender not in registry['denormalized_fields']:
+        return
+
+    # Defer to the active batch (if any)
+    if (pending := get_denormalized_batch()) is not None:
+        pending[sender].add(instance.pk)
+        return
+
+    count = update_denormalized_values(sender, [instance.pk])
+    logger.debug(f'Updated denormalized fields on {count} rows for {instance._meta.label} {instance.pk}')
@@ -3,6 +3,7 @@ from strawberry.types.unset import UNSET
 from strawberry_django.pagination import _QS, apply
 
 from netbox.config import get_config
+from utilities.keyset import apply_keyset, get_keyset_ordering, get_keyset_values
 
 __all__ = (
     'OffsetPaginationInfo',
@@ -16,12 +17,13 @@ class OffsetPaginationInfo:
     offset: int = 0
     limit: int | None = UNSET
     start: int | None = UNSET
+    after: int | None = UNSET
 
 
 @strawberry.input
 class OffsetPaginationInput(OffsetPaginationInfo):
     """
-    Customized implementation of OffsetPaginationInput to support cursor-based pagination.
+    Customized implementation of OffsetPaginationInput to support cursor-based and keyset pagination.
     """
     pass
 
@@ -34,8 +36,20 @@ def apply_pagination(
     related_field_id: str | None = None,
 ) -> _QS:
     """
-    Replacement for the `apply_pagination()` method on StrawberryDjangoField to support cursor-based pagination.
+    Replacement for the `apply_pagination()` method on StrawberryDjangoField to support cursor-based and keyset
+    pagination.
     """
+    if pagination is not None and pagination.after not in (None, UNSET):
+        if pagination.offset or pagination.start not in (None, UNSET):
+            raise ValueError('Cannot specify `after` in conjunction with `start` or `offset` in pagination.')
+
+        # Filter the queryset to include only records which follow the specified record in the requested ordering,
+        # employing the record's sort key (rather than an offset) to locate the first result.
+        keys = get_keyset_ordering(queryset)
+        if (values := get_keyset_values(queryset, keys, pagination.after)) is None:
+            raise ValueError(f'The record specified by `after` ({pagination.after}) was not found.')
+        queryset = apply_keyset(queryset, keys, values)
+
     if pagination is not None and pagination.start not in (None, UNSET):
         if pagination.offset:
             raise ValueError('Cannot specify both `start` and `offset` in pagination.')
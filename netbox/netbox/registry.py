@@ -32,6 +32,7 @@ class Registry(dict):
 
 # Initialize the global registry
 registry = Registry({
+    'bulk_contexts': list(),
     'counter_fields': collections.defaultdict(dict),
     'data_backends': dict(),
     'denormalized_fields': collections.defaultdict(list),
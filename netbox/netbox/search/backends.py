@@ -1,21 +1,28 @@
 import logging
 from collections import defaultdict
+from functools import partial
 
 import netaddr
+from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import TrigramSimilarity
 from django.core.exceptions import ImproperlyConfigured
-from django.db import ProgrammingError
+from django.db import ProgrammingError, connections, router, transaction
 from django.db.models import F, Q, Window, prefetch_related_objects
 from django.db.models.fields.related import ForeignKey
 from django.db.models.functions import window
 from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
+from django_rq import get_queue
 from netaddr.core import AddrFormatError
 
 from core.models import ObjectType
 from extras.models import CachedValue, CustomField
+from netbox.bulk import get_bulk_operation
+from netbox.constants import RQ_QUEUE_DEFAULT
+from netbox.context import search_cache_queue
 from netbox.registry import registry
 from utilities.object_types import object_type_identifier
 from utilities.querysets import RestrictedPrefetch
@@ -26,6 +33,9 @@ from . import FieldTypes, LookupTypes, get_indexer
 DEFAULT_LOOKUP_TYPE = LookupTypes.PARTIAL
 MAX_RESULTS = 1000
 
+# The minimum number of cached values to be written using COPY rather than INSERT
+COPY_THRESHOLD = 500
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +77,13 @@ class SearchBackend:
         """
         Receiver for the post_save signal, responsible for caching object creation/changes.
         """
+        if sender._meta.label_lower not in registry['search']:
+            return
+
+        # Defer caching until the end of any bulk operation or request
+        if self.defer_caching(sender, [instance]):
+            return
+
         try:
             self.cache(instance, remove_existing=not created)
         except ProgrammingError as e:
@@ -74,12 +91,94 @@ class SearchBackend:
             logger.warning(f"Skipping search cache update due to schema error: {e}")
             pass
 
+    def bulk_caching_handler(self, sender, instances):
+        """
+        Cache all objects of a model created or changed during a bulk operation or request. If the number of objects
+        meets SEARCH_CACHE_BACKGROUND_THRESHOLD, they are instead cached by a background worker once the current
+        transaction has been committed.
+        """
+        threshold = settings.SEARCH_CACHE_BACKGROUND_THRESHOLD
+        if threshold and len(instances) >= threshold:
+            model_label, object_ids = sender._meta.label_lower, list(instances)
+
+            def enqueue():
+                get_queue(RQ_QUEUE_DEFAULT).enqueue('netbox.search.backends.cache_objects', model_label, object_ids)
+
+            transaction.on_commit(enqueue, using=router.db_for_write(sender))
+            logger.debug(f"Deferred caching of {len(object_ids)} {model_label} objects to a background worker")
+            return
+
+        try:
+            self.cache(instances.values())
+        except ProgrammingError as e:
+            logger.warning(f"Skipping search cache update due to schema error: {e}")
+
     def removal_handler(self, sender, instance, **kwargs):
         """
         Receiver for the post_delete signal, responsible for caching object deletion.
         """
+        if sender._meta.label_lower not in registry['search']:
+            return
+
+        # Defer removal until the end of any bulk operation or request
+        if self.defer_removal(sender, instance):
+            return
+
         self.remove(instance)
 
+    def bulk_removal_handler(self, sender, instances):
+        """
+        Remove all objects of a model deleted during a bulk operation or request.
+        """
+        self.remove_objects(sender, list(instances))
+
+    def defer_caching(self, model, instances):
+        """
+        Defer the caching of instances of a model until the end of the bulk operation or request in progress (if
+        any), so that each object is cached only once however many times it is saved. Returns False if caching cannot
+        be deferred, in which case the instances should be cached immediately.
+        """
+        if (operation := get_bulk_operation()) is not None:
+            for instance in instances:
+                operation.defer(self.bulk_caching_handler, model, instance)
+            return True
+
+        if (queue := search_cache_queue.get()) is not None:
+            instances = [(instance.pk, instance) for instance in instances]
+
+            # Queue the instances only once their changes have been committed
+            def defer():
+                for pk, instance in instances:
+                    queue.defer(self.bulk_caching_handler, model, instance, pk=pk)
+
+            transaction.on_commit(defer, using=router.db_for_write(model))
+            return True
+
+        return False
+
+    def defer_removal(self, model, instance):
+        """
+        Defer the removal of a deleted instance from the cache until the end of the bulk operation or request in
+        progress (if any). Returns False if removal cannot be deferred, in which case the instance should be removed
+        immediately.
+        """
+        # Record the primary key, which is cleared once the instance has been deleted
+        pk = instance.pk
+
+        def defer(queue):
+            queue.discard(self.bulk_caching_handler, model, pk)
+            queue.defer(self.bulk_removal_handler, model, instance, pk=pk)
+
+        if (operation := get_bulk_operation()) is not None:
+            defer(operation)
+            return True
+
+        if (queue := search_cache_queue.get()) is not None:
+            transaction.on_commit(partial(defer, queue), using=router.db_for_write(model))
+            return True
+
+        return False
+
     def cache(self, instances, indexer=None, remove_existing=True):
         """
         Create or update the cached representation of an instance.
@@ -92,6 +191,12 @@ class SearchBackend:
         """
         raise NotImplementedError
 
+    def remove_objects(self, model, object_ids):
+        """
+        Delete any cached representations of the specified objects of a model.
+        """
+        raise NotImplementedError
+
     def clear(self, object_types=None):
         """
         Delete *all* cached data (optionally filtered by object type).
@@ -136,7 +241,7 @@ class CachedValueSearchBackend(SearchBackend):
                 pass
 
         # Construct the base queryset to retrieve matching results
-        queryset = CachedValue.objects.filter(query_filter).annotate(
+        queryset = self.get_queryset(query_filter, value, lookup).annotate(
             # Annotate the rank of each result for its object according to its weight
             row_number=Window(
                 expression=window.RowNumber(),
@@ -196,7 +301,14 @@ class CachedValueSearchBackend(SearchBackend):
 
         return ret
 
+    def get_queryset(self, query_filter, value, lookup):
+        """
+        Return all CachedValues matching the given filter, ordered by relevance.
+        """
+        return CachedValue.objects.filter(query_filter)
+
     def cache(self, instances, indexer=None, remove_existing=True):
+        object_type = None
         custom_fields = None
 
         # Convert a single instance to an iterable
@@ -204,11 +316,12 @@ class CachedValueSearchBackend(SearchBackend):
             instances = [instances]
 
         buffer = []
+        object_ids = []
         counter = 0
         for instance in instances:
 
             # First item
-            if not counter:
+            if object_type is None:
 
                 # Determine the indexer
                 if indexer is None:
@@ -217,18 +330,16 @@ class CachedValueSearchBackend(SearchBackend):
                     except KeyError:
                         break
 
+                object_type = ObjectType.objects.get_for_model(indexer.model)
+
                 # Prefetch any associated custom fields (excluding those with a zero search weight)
                 custom_fields = [
                     cf for cf in CustomField.objects.get_for_model(indexer.model)
                     if cf.search_weight > 0
                 ]
 
-            # Wipe out any previously cached values for the object
-            if remove_existing:
-                self.remove(instance)
-
             # Generate cache data
-            object_type = ObjectType.objects.get_for_model(indexer.model)
+            object_ids.append(instance.pk)
             for field in indexer.to_cache(instance, custom_fields=custom_fields):
                 buffer.append(
                     CachedValue(
@@ -243,15 +354,51 @@ class CachedValueSearchBackend(SearchBackend):
 
             # Check whether the buffer needs to be flushed
             if len(buffer) >= 2000:
-                counter += len(CachedValue.objects.bulk_create(buffer))
+                counter += self._write(buffer, object_type, object_ids if remove_existing else None)
                 buffer = []
+                object_ids = []
 
         # Final buffer flush
-        if buffer:
-            counter += len(CachedValue.objects.bulk_create(buffer))
+        if buffer or (object_ids and remove_existing):
+            counter += self._write(buffer, object_type, object_ids if remove_existing else None)
 
         return counter
 
+    def _write(self, cached_values, object_type, remove_ids=None):
+        """
+        Save a batch of CachedValues for an object type, first wiping out any previously cached values for the
+        objects with the specified IDs (if any). Returns the number of values written.
+        """
+        if remove_ids:
+            qs = CachedValue.objects.filter(object_type=object_type, object_id__in=remove_ids)
+            qs._raw_delete(using=qs.db)
+
+        # Use COPY rather than INSERT for large batches
+        if len(cached_values) >= COPY_THRESHOLD:
+            return self._copy(cached_values)
+
+        return len(CachedValue.objects.bulk_create(cached_values))
+
+    @staticmethod
+    def _copy(cached_values):
+        """
+        Insert CachedValues using PostgreSQL's COPY command, which is considerably faster than a multi-row INSERT.
+        """
+        connection = connections[router.db_for_write(CachedValue)]
+        fields = CachedValue._meta.concrete_fields
+        table = connection.ops.quote_name(CachedValue._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+
+        with connection.cursor() as cursor:
+            with cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for cached_value in cached_values:
+                    copy.write_row([
+                        field.get_db_prep_save(field.pre_save(cached_value, add=True), connection)
+                        for field in fields
+                    ])
+
+        return len(cached_values)
+
     def remove(self, instance):
         # Avoid attempting to query for non-cacheable objects
         try:
@@ -259,8 +406,17 @@ class CachedValueSearchBackend(SearchBackend):
         except KeyError:
             return None
 
-        ct = ContentType.objects.get_for_model(instance)
-        qs = CachedValue.objects.filter(object_type=ct, object_id=instance.pk)
+        return self.remove_objects(instance._meta.model, [instance.pk])
+
+    def remove_objects(self, model, object_ids):
+        # Avoid attempting to query for non-cacheable objects
+        try:
+            get_indexer(model)
+        except KeyError:
+            return None
+
+        ct = ContentType.objects.get_for_model(model)
+        qs = CachedValue.objects.filter(object_type=ct, object_id__in=object_ids)
 
         # Call _raw_delete() on the queryset to avoid first loading instances into memory
         return qs._raw_delete(using=qs.db)
@@ -284,6 +440,23 @@ class CachedValueSearchBackend(SearchBackend):
         return CachedValue.objects.count()
 
 
+class TrigramSearchBackend(CachedValueSearchBackend):
+    """
+    A variant of CachedValueSearchBackend which ranks partial matches by their trigram similarity (using PostgreSQL's
+    pg_trgm extension) to the search value, in addition to the weight of the matching field. Matching employs the
+    trigram index on cached values, so the cap on the number of results retrieved keeps the closest matches rather
+    than an arbitrary subset of them.
+    """
+    def get_queryset(self, query_filter, value, lookup):
+        queryset = super().get_queryset(query_filter, value, lookup)
+        if lookup != LookupTypes.PARTIAL:
+            return queryset
+
+        return queryset.annotate(
+            similarity=TrigramSimilarity('value', value)
+        ).order_by('weight', '-similarity', 'object_type', 'object_id')
+
+
 def get_backend():
     """
     Initializes and returns the configured search backend.
@@ -302,3 +475,12 @@ search_backend = get_backend()
 # Connect handlers to the appropriate model signals
 post_save.connect(search_backend.caching_handler)
 post_delete.connect(search_backend.removal_handler)
+
+
+def cache_objects(model_label, object_ids):
+    """
+    Cache the specified objects of a model (identified as "<app_label>.<model_name>"). This is called by a background
+    worker per SEARCH_CACHE_BACKGROUND_THRESHOLD.
+    """
+    model = apps.get_model(model_label)
+    search_backend.cache(model.objects.filter(pk__in=object_ids), remove_existing=True)
@@ -76,6 +76,9 @@ elif hasattr(configuration, 'DATABASE') and hasattr(configuration, 'DATABASES'):
 # Set static config parameters
 ADMINS = getattr(configuration, 'ADMINS', [])
 ALLOWED_HOSTS = getattr(configuration, 'ALLOWED_HOSTS')  # Required
+API_COUNT_CACHE_TIMEOUT = getattr(configuration, 'API_COUNT_CACHE_TIMEOUT', 60)
+API_COUNT_ESTIMATE_THRESHOLD = getattr(configuration, 'API_COUNT_ESTIMATE_THRESHOLD', 100000)
+API_COUNT_STRATEGY = getattr(configuration, 'API_COUNT_STRATEGY', 'exact')
 API_TOKEN_PEPPERS = getattr(configuration, 'API_TOKEN_PEPPERS', {})
 AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
     {
@@ -89,6 +92,9 @@ AUTH_PASSWORD_VALIDATORS = getattr(configuration, 'AUTH_PASSWORD_VALIDATORS', [
     },
 ])
 BASE_PATH = trailing_slash(getattr(configuration, 'BASE_PATH', ''))
+CHANGELOG_COMPACT_RECORDS = getattr(configuration, 'CHANGELOG_COMPACT_RECORDS', False)
+CHANGELOG_PRUNE_BATCH_SIZE = getattr(configuration, 'CHANGELOG_PRUNE_BATCH_SIZE', 10000)
+CHANGELOG_PRUNE_DELAY = getattr(configuration, 'CHANGELOG_PRUNE_DELAY', 0)
 CHANGELOG_SKIP_EMPTY_CHANGES = getattr(configuration, 'CHANGELOG_SKIP_EMPTY_CHANGES', True)
 CENSUS_REPORTING_ENABLED = getattr(configuration, 'CENSUS_REPORTING_ENABLED', True)
 CORS_ORIGIN_ALLOW_ALL = getattr(configuration, 'CORS_ORIGIN_ALLOW_ALL', False)
@@ -127,6 +133,7 @@ DEFAULT_PERMISSIONS = getattr(configuration, 'DEFAULT_PERMISSIONS', {
     'users.change_token': ({'user': '$user'},),
     'users.delete_token': ({'user': '$user'},),
 })
+DEFER_CABLE_PATH_TRACING = getattr(configuration, 'DEFER_CABLE_PATH_TRACING', False)
 DEVELOPER = getattr(configuration, 'DEVELOPER', False)
 DOCS_ROOT = getattr(configuration, 'DOCS_ROOT', _PATHS.docs_root)
 EMAIL = getattr(configuration, 'EMAIL', {})
@@ -134,6 +141,7 @@ STREAMING_EXPORTS = getattr(configuration, 'STREAMING_EXPORTS', False)
 EVENTS_PIPELINE = getattr(configuration, 'EVENTS_PIPELINE', [
     'extras.events.process_event_queue',
 ])
+EVENTS_QUEUE_SPILL_THRESHOLD = getattr(configuration, 'EVENTS_QUEUE_SPILL_THRESHOLD', None)
 EXEMPT_VIEW_PERMISSIONS = getattr(configuration, 'EXEMPT_VIEW_PERMISSIONS', [])
 FIELD_CHOICES = getattr(configuration, 'FIELD_CHOICES', {})
 FILE_UPLOAD_MAX_MEMORY_SIZE = getattr(configuration, 'FILE_UPLOAD_MAX_MEMORY_SIZE', 2621440)
@@ -198,6 +206,7 @@ RQ_RETRY_INTERVAL = getattr(configuration, 'RQ_RETRY_INTERVAL', 60)
 RQ_RETRY_MAX = getattr(configuration, 'RQ_RETRY_MAX', 0)
 SCRIPTS_ROOT = getattr(configuration, 'SCRIPTS_ROOT', os.path.join(NETBOX_ROOT, 'scripts')).rstrip('/')
 SEARCH_BACKEND = getattr(configuration, 'SEARCH_BACKEND', 'netbox.search.backends.CachedValueSearchBackend')
+SEARCH_CACHE_BACKGROUND_THRESHOLD = getattr(configuration, 'SEARCH_CACHE_BACKGROUND_THRESHOLD', None)
 SECRET_KEY = getattr(configuration, 'SECRET_KEY')  # Required
 SECURE_HSTS_INCLUDE_SUBDOMAINS = getattr(configuration, 'SECURE_HSTS_INCLUDE_SUBDOMAINS', False)
 SECURE_HSTS_PRELOAD = getattr(configuration, 'SECURE_HSTS_PRELOAD', False)
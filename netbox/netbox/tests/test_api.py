@@ -1,19 +1,29 @@
+import json
 import uuid
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
 
 from django.contrib.contenttypes.models import ContentType
 from django.db.backends.postgresql.psycopg_any import NumericRange
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 
+from core.events import OBJECT_CREATED
+from core.models import ObjectChange, ObjectType
 from dcim.api.serializers import RackSerializer
-from dcim.models import Device, Site
+from dcim.choices import InterfaceTypeChoices
+from dcim.models import Device, Interface, Site
+from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField, Tag
 from netbox.api.exceptions import QuerySetNotOrdered
 from netbox.api.fields import ContentTypeField, IntegerRangeSerializer, RelatedObjectCountField
 from netbox.api.pagination import NetBoxPagination
+from netbox.api.viewsets.mixins import StreamingListMixin
+from tenancy.models import Contact, ContactGroup, Tenant, TenantGroup
 from users.models import Token
-from utilities.testing import APITestCase
+from utilities.testing import APITestCase, create_test_device
 
 
 class AppTestCase(APITestCase):
@@ -51,6 +61,109 @@ class AppTestCase(APITestCase):
         self.assertEqual(response.data['id'], self.user.pk)
 
 
+class StreamingListTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'], MAX_PAGE_SIZE=0)
+    def test_stream_ndjson(self):
+        url = reverse('dcim-api:site-list')
+        with patch.object(StreamingListMixin, 'stream_chunk_size', 2):
+            response = self.client.get(url, HTTP_ACCEPT='application/x-ndjson', **self.header)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['name'] for line in lines], [f'Site {i}' for i in range(1, 6)])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'], MAX_PAGE_SIZE=0)
+    def test_stream_json_array(self):
+        url = reverse('dcim-api:site-list')
+        with patch.object(StreamingListMixin, 'stream_chunk_size', 2):
+            response = self.client.get(f'{url}?stream=true&name=Site 2&name=Site 4', **self.header)
+
+        self.assertEqual(response.status_code, 200)
+        results = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([result['name'] for result in results], ['Site 2', 'Site 4'])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'], MAX_PAGE_SIZE=3)
+    def test_stream_max_page_size(self):
+        url = reverse('dcim-api:site-list')
+
+        response = self.client.get(f'{url}?stream=true', **self.header)
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(url, HTTP_ACCEPT='application/x-ndjson', **self.header)
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkInsertTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = TenantGroup.objects.create(name='Tenant Group 1', slug='tenant-group-1')
+        cls.tags = Tag.objects.bulk_create([Tag(name=f'Tag {i}', slug=f'tag-{i}') for i in range(1, 3)])
+        cf = CustomField.objects.create(name='cf1', type=CustomFieldTypeChoices.TYPE_TEXT, default='foo')
+        cf.object_types.set([ObjectType.objects.get_for_model(Tenant)])
+
+    def test_bulk_insert(self):
+        self.add_permissions('tenancy.add_tenant')
+        data = [
+            {
+                'name': f'Tenant {i}',
+                'slug': f'tenant-{i}',
+                'group': self.group.pk,
+                'tags': [{'id': tag.pk} for tag in self.tags],
+            } for i in range(1, 4)
+        ]
+
+        response = self.client.post(reverse('tenancy-api:tenant-list'), data, format='json', **self.header)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([result['name'] for result in response.data], ['Tenant 1', 'Tenant 2', 'Tenant 3'])
+        for tenant in Tenant.objects.all():
+            self.assertEqual(tenant.group, self.group)
+            self.assertEqual(set(tenant.tags.all()), set(self.tags))
+            self.assertEqual(tenant.custom_field_data, {'cf1': 'foo'})
+        changes = ObjectChange.objects.filter(changed_object_type=ObjectType.objects.get_for_model(Tenant))
+        self.assertEqual(changes.count(), 3)
+        self.assertEqual(len(changes.first().postchange_data['tags']), 2)
+
+    def test_bulk_insert_many_to_many(self):
+        self.add_permissions('tenancy.add_contact')
+        groups = [
+            ContactGroup.objects.create(name=f'Contact Group {i}', slug=f'contact-group-{i}') for i in range(1, 3)
+        ]
+        data = [{'name': f'Contact {i}', 'groups': [group.pk for group in groups]} for i in range(1, 4)]
+
+        with patch('extras.events.run_events_pipeline') as run_events_pipeline:
+            response = self.client.post(reverse('tenancy-api:contact-list'), data, format='json', **self.header)
+
+        self.assertEqual(response.status_code, 201)
+        for contact in Contact.objects.all():
+            self.assertEqual(set(contact.groups.all()), set(groups))
+
+        # Each contact is recorded (and its event queued) only as having been created
+        changes = ObjectChange.objects.filter(changed_object_type=ObjectType.objects.get_for_model(Contact))
+        self.assertEqual(list(changes.values_list('action', flat=True)), ['create'] * 3)
+        self.assertEqual(len(changes.first().postchange_data['groups']), 2)
+        events = run_events_pipeline.call_args.args[0]
+        self.assertEqual([event['event_type'] for event in events], [OBJECT_CREATED] * 3)
+
+    def test_bulk_insert_integrity_error(self):
+        self.add_permissions('tenancy.add_tenant')
+        data = [
+            {'name': 'Tenant 1', 'slug': 'tenant-1'},
+            {'name': 'Tenant 1', 'slug': 'tenant-2'},
+        ]
+
+        response = self.client.post(reverse('tenancy-api:tenant-list'), data, format='json', **self.header)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Tenant.objects.exists())
+
+
 class RelatedObjectCountFieldTestCase(TestCase):
     """
     RelatedObjectCountFields are populated by annotations applied to a viewset's queryset, which are only
@@ -140,6 +253,91 @@ class OptionalLimitOffsetPaginationTestCase(TestCase):
         with self.assertRaises(ValidationError):
             self.paginator.paginate_queryset(queryset, request)
 
+    def test_count_strategies(self):
+        """get_queryset_count() determines the count per API_COUNT_STRATEGY and records the method employed"""
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+        queryset = Site.objects.order_by('name')
+
+        self.assertEqual(self.paginator.get_queryset_count(queryset), 5)
+        self.assertEqual(self.paginator.count_type, 'exact')
+
+        with override_settings(API_COUNT_STRATEGY='estimate', API_COUNT_ESTIMATE_THRESHOLD=0):
+            self.assertIsInstance(self.paginator.get_queryset_count(queryset), int)
+            self.assertEqual(self.paginator.count_type, 'estimated')
+
+        locmem = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        with override_settings(API_COUNT_STRATEGY='cache', CACHES=locmem):
+            self.assertEqual(self.paginator.get_queryset_count(queryset), 5)
+            self.assertEqual(self.paginator.count_type, 'exact')
+            Site.objects.create(name='Site 6', slug='site-6')
+            self.assertEqual(self.paginator.get_queryset_count(queryset), 5)
+            self.assertEqual(self.paginator.count_type, 'cached')
+
+            # The count type is indicated by a response header
+            self.paginator.paginate_queryset(queryset, self._make_drf_request())
+            response = self.paginator.get_paginated_response([])
+            self.assertEqual(response['X-Count-Type'], 'cached')
+
+            # The next link reflects the objects present, rather than the (stale) count
+            request = self._make_drf_request(query_params={'limit': '5'})
+            self.assertEqual(len(self.paginator.paginate_queryset(queryset, request)), 5)
+            self.assertIsNotNone(self.paginator.get_next_link())
+            request = self._make_drf_request(query_params={'limit': '5', 'offset': '5'})
+            self.assertEqual([site.name for site in self.paginator.paginate_queryset(queryset, request)], ['Site 6'])
+            self.assertIsNone(self.paginator.get_next_link())
+            self.assertIsNotNone(self.paginator.get_previous_link())
+
+    def test_keyset_pagination(self):
+        """paginate_queryset() pages through results in the requested ordering by cursor"""
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+        queryset = Site.objects.order_by('-name')
+
+        names = []
+        query_params = {'cursor': '', 'limit': 2}
+        while query_params:
+            paginator = NetBoxPagination()
+            names.extend(site.name for site in paginator.paginate_queryset(queryset, self._make_drf_request(
+                query_params=query_params
+            )))
+            self.assertIsNone(paginator.count)
+            next_link = paginator.get_next_link()
+            query_params = dict(parse_qsl(urlsplit(next_link).query)) if next_link else None
+
+        self.assertEqual(names, [f'Site {i}' for i in range(5, 0, -1)])
+
+    def test_keyset_pagination_collated(self):
+        """paginate_queryset() pages by cursor through a default ordering which includes a collated field"""
+        device = create_test_device('Device 1')
+        for name in ('eth10', 'Eth2', 'eth1', 'GigabitEthernet1/0/1', 'ge-0/0/1'):
+            Interface.objects.create(device=device, name=name, type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+        queryset = Interface.objects.all()
+
+        pks = []
+        query_params = {'cursor': '', 'limit': 2}
+        while query_params:
+            paginator = NetBoxPagination()
+            pks.extend(interface.pk for interface in paginator.paginate_queryset(queryset, self._make_drf_request(
+                query_params=query_params
+            )))
+            next_link = paginator.get_next_link()
+            query_params = dict(parse_qsl(urlsplit(next_link).query)) if next_link else None
+
+        self.assertEqual(pks, list(queryset.values_list('pk', flat=True)))
+
+    def test_cursor_and_start_conflict_raises_validation_error(self):
+        """paginate_queryset() raises ValidationError when both cursor and start are specified"""
+        queryset = Token.objects.all().order_by('created')
+        request = self._make_drf_request(query_params={'cursor': '', 'start': '1'})
+        with self.assertRaises(ValidationError):
+            self.paginator.paginate_queryset(queryset, request)
+
+    def test_invalid_cursor_raises_validation_error(self):
+        """paginate_queryset() raises ValidationError for a malformed cursor"""
+        queryset = Token.objects.all().order_by('created')
+        request = self._make_drf_request(query_params={'cursor': 'invalid'})
+        with self.assertRaises(ValidationError):
+            self.paginator.paginate_queryset(queryset, request)
+
 
 class IntegerRangeSerializerTestCase(TestCase):
 
@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from core.models import ObjectType
+from dcim.models import Site
+from extras.models import CachedValue
+from netbox.bulk import bulk_operation, get_bulk_operation
+
+
+class BulkOperationTestCase(TestCase):
+
+    def test_deferred_handler(self):
+        calls = []
+
+        def handler(sender, instances):
+            calls.append((sender, dict(instances)))
+
+        sites = (
+            Site.objects.create(name='Site 1', slug='site-1'),
+            Site.objects.create(name='Site 2', slug='site-2'),
+        )
+        with bulk_operation() as operation:
+            for site in sites:
+                operation.defer(handler, Site, site)
+
+            # Nested operations join the outer operation
+            with bulk_operation() as nested_operation:
+                self.assertIs(nested_operation, operation)
+                operation.defer(handler, Site, sites[0])
+
+            # Handlers are not called until the operation is complete
+            self.assertEqual(calls, [])
+
+        self.assertIsNone(get_bulk_operation())
+        self.assertEqual(calls, [(Site, {site.pk: site for site in sites})])
+
+    def test_search_cache(self):
+        object_type = ObjectType.objects.get_for_model(Site)
+
+        with bulk_operation():
+            site = Site.objects.create(name='Site 1', slug='site-1')
+            self.assertFalse(CachedValue.objects.filter(object_type=object_type, object_id=site.pk).exists())
+        self.assertTrue(CachedValue.objects.filter(object_type=object_type, object_id=site.pk).exists())
+
+        site_id = site.pk
+        with bulk_operation():
+            site.delete()
+            self.assertTrue(CachedValue.objects.filter(object_type=object_type, object_id=site_id).exists())
+        self.assertFalse(CachedValue.objects.filter(object_type=object_type, object_id=site_id).exists())
@@ -0,0 +1,57 @@
+from django.test import TestCase
+
+from dcim.models import Region, Site
+from ipam.models import Prefix
+from netbox.denormalized import batched_denormalized_updates, update_denormalized_values
+
+
+class DenormalizedFieldsTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        regions = (
+            Region(name='Region 1', slug='region-1'),
+            Region(name='Region 2', slug='region-2'),
+        )
+        for region in regions:
+            region.save()
+
+        sites = (
+            Site(name='Site 1', slug='site-1', region=regions[0]),
+            Site(name='Site 2', slug='site-2', region=regions[0]),
+        )
+        Site.objects.bulk_create(sites)
+
+        Prefix.objects.create(prefix='10.0.1.0/24', scope=sites[0])
+        Prefix.objects.create(prefix='10.0.2.0/24', scope=sites[0])
+        Prefix.objects.create(prefix='10.0.3.0/24', scope=sites[1])
+
+    def test_update_on_save(self):
+        region = Region.objects.get(name='Region 2')
+        site = Site.objects.get(name='Site 1')
+        site.region = region
+        site.save()
+
+        self.assertEqual(Prefix.objects.filter(_region=region).count(), 2)
+
+    def test_update_only_changed_rows(self):
+        sites = Site.objects.all()
+
+        # Values are already current, so no rows are written
+        self.assertEqual(update_denormalized_values(Site, [site.pk for site in sites]), 0)
+
+        Site.objects.filter(name='Site 1').update(region=Region.objects.get(name='Region 2'))
+        self.assertEqual(update_denormalized_values(Site, [site.pk for site in sites]), 2)
+
+    def test_batched_updates(self):
+        region = Region.objects.get(name='Region 2')
+
+        with batched_denormalized_updates():
+            for site in Site.objects.all():
+                site.region = region
+                site.save()
+
+            # Denormalized fields are not updated until the batch is complete
+            self.assertFalse(Prefix.objects.filter(_region=region).exists())
+
+        self.assertEqual(Prefix.objects.filter(_region=region).count(), 3)
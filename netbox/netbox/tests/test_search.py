@@ -1,10 +1,14 @@
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 
 from dcim.models import Site
 from dcim.search import SiteIndex
 from extras.models import CachedValue
-from netbox.search.backends import search_backend
+from netbox.context_managers import search_cache_tracking
+from netbox.search import LookupTypes
+from netbox.search.backends import TrigramSearchBackend, search_backend
 
 
 class SearchBackendTestCase(TestCase):
@@ -123,6 +127,31 @@ class SearchBackendTestCase(TestCase):
             CachedValue.objects.filter(object_type=content_type, object_id=site.pk).exists()
         )
 
+    def test_deferred_caching_in_request(self):
+        """
+        Test that search cache updates made while processing a request are applied once per object upon its completion.
+        """
+        content_type = ContentType.objects.get_for_model(Site)
+        site1, site2 = Site.objects.all()[:2]
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+
+        with search_cache_tracking(request):
+            with self.captureOnCommitCallbacks(execute=True):
+                site1.description = 'Modified'
+                site1.save()
+                site1.save()
+                site2.save()
+                site2.delete()
+
+            # Nothing is cached until the request has completed
+            self.assertFalse(CachedValue.objects.exists())
+
+        self.assertTrue(
+            CachedValue.objects.filter(object_type=content_type, object_id=site1.pk, value='Modified').exists()
+        )
+        self.assertFalse(CachedValue.objects.filter(object_type=content_type).exclude(object_id=site1.pk).exists())
+
     def test_clear_all(self):
         """
         Test that calling clear() on the backend removes all cached entries.
@@ -151,3 +180,22 @@ class SearchBackendTestCase(TestCase):
         self.assertEqual(len(results), 1)
         results = search_backend.search('xxxxx')
         self.assertEqual(len(results), 0)
+
+    def test_search_trigram_backend(self):
+        """
+        Test searches using the trigram backend.
+        """
+        backend = TrigramSearchBackend()
+        sites = Site.objects.all()
+        backend.cache(sites)
+
+        results = backend.search('site')
+        self.assertEqual(len(results), 3)
+        results = backend.search('first')
+        self.assertEqual(len(results), 1)
+        results = backend.search('xxxxx')
+        self.assertEqual(len(results), 0)
+        results = backend.search('site 2', lookup=LookupTypes.EXACT)
+        self.assertEqual(len(results), 1)
+        results = backend.search('ravo')
+        self.assertEqual([r.value for r in results], ['Bravo'])
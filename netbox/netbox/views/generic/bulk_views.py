@@ -24,6 +24,7 @@ from core.models import ObjectType
 from core.signals import clear_events
 from extras.choices import CustomFieldUIEditableChoices
 from extras.models import CustomField, ExportTemplate
+from netbox.bulk import bulk_operation
 from netbox.forms.bulk_rename import NetBoxModelBulkRenameForm
 from netbox.models.features import ChangeLoggingMixin
 from netbox.object_actions import AddObject, BulkDelete, BulkEdit, BulkExport, BulkImport, BulkRename
@@ -410,7 +411,7 @@ class BulkCreateView(GetReturnURLMixin, BaseMultiObjectView):
             logger.debug("Form validation was successful")
 
             try:
-                with transaction.atomic(using=router.db_for_write(model)):
+                with transaction.atomic(using=router.db_for_write(model)), bulk_operation():
                     new_objs = self._create_objects(form, request)
 
                     # Enforce object-level permissions
@@ -723,7 +724,10 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
             try:
                 # Iterate through data and bind each record to a new model form instance. Object-level
                 # permissions are enforced within create_and_update_objects().
-                with transaction.atomic(using=router.db_for_write(model)):
+                with (
+                    transaction.atomic(using=router.db_for_write(model)),
+                    bulk_operation(),
+                ):
                     new_objects = self.create_and_update_objects(form, request)
 
                 msg = _('Imported {count} {object_type}').format(
@@ -927,7 +931,10 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
                         return redirect(self.get_return_url(request))
 
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
+                    with (
+                        transaction.atomic(using=router.db_for_write(model)),
+                        bulk_operation(),
+                    ):
                         updated_objects = self._update_objects(form, request)
 
                         # Enforce object-level permissions
@@ -1080,7 +1087,10 @@ class BulkRenameView(GetReturnURLMixin, BaseMultiObjectView):
                     field_names = submitted
                 if not form.errors:
                     try:
-                        with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                        with (
+                            transaction.atomic(using=router.db_for_write(self.queryset.model)),
+                            bulk_operation(),
+                        ):
                             renamed_pks = self._rename_objects(form, selected_objects, field_names)
 
                             if '_apply' in request.POST:
@@ -1187,7 +1197,7 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    with transaction.atomic(using=router.db_for_write(model)):
+                    with transaction.atomic(using=router.db_for_write(model)), bulk_operation():
                         for obj in queryset:
 
                             # Take a snapshot of change-logged models
@@ -1324,7 +1334,10 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
                 }
 
                 try:
-                    with transaction.atomic(using=router.db_for_write(self.queryset.model)):
+                    with (
+                        transaction.atomic(using=router.db_for_write(self.queryset.model)),
+                        bulk_operation(),
+                    ):
 
                         for obj in data['pk']:
 
@@ -1,6 +1,7 @@
 from rest_framework.routers import APIRootView
 
 from netbox.api.viewsets import MPTTLockedMixin, NetBoxModelViewSet
+from netbox.api.viewsets.mixins import BulkInsertMixin
 from tenancy import filtersets
 from tenancy.models import *
 
@@ -31,7 +32,7 @@ class TenantGroupViewSet(MPTTLockedMixin, NetBoxModelViewSet):
     filterset_class = filtersets.TenantGroupFilterSet
 
 
-class TenantViewSet(NetBoxModelViewSet):
+class TenantViewSet(BulkInsertMixin, NetBoxModelViewSet):
     queryset = Tenant.objects.all()
     serializer_class = serializers.TenantSerializer
     filterset_class = filtersets.TenantFilterSet
@@ -53,7 +54,7 @@ class ContactRoleViewSet(NetBoxModelViewSet):
     filterset_class = filtersets.ContactRoleFilterSet
 
 
-class ContactViewSet(NetBoxModelViewSet):
+class ContactViewSet(BulkInsertMixin, NetBoxModelViewSet):
     queryset = Contact.objects.all()
     serializer_class = serializers.ContactSerializer
     filterset_class = filtersets.ContactFilterSet
@@ -1,4 +1,7 @@
 import logging
+import operator
+from collections import defaultdict
+from functools import reduce
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import (
@@ -8,6 +11,7 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     ValidationError,
 )
+from django.db.models import Q
 from django.db.models.fields.related import ManyToOneRel, RelatedField
 from django.urls import reverse
 from django.utils.module_loading import import_string
@@ -19,6 +23,7 @@ from rest_framework.views import get_view_name as drf_get_view_name
 from extras.constants import HTTP_CONTENT_TYPE_JSON
 from netbox.api.exceptions import GraphQLTypeNotFound, SerializerNotFound
 from netbox.api.fields import RelatedObjectCountField
+from netbox.context import query_cache
 from netbox.registry import registry
 
 from .query import count_related, dict_to_filter_params
@@ -36,6 +41,8 @@ __all__ = (
     'get_view_name',
     'is_api_request',
     'is_graphql_request',
+    'prefetch_related_objects_by_attrs',
+    'prefetch_related_objects_by_pk',
 )
 
 
@@ -228,6 +235,9 @@ def get_related_object_by_attrs(queryset, attrs, user=None):
     attributes. Referencing an object directly by its numeric ID is always permitted, regardless of the user's view
     permissions.
 
+    Objects previously resolved for the current request by prefetch_related_objects() are reused where the queryset
+    is unfiltered.
+
     :param queryset: The base queryset from which to retrieve the related object
     :param attrs: A dictionary of attributes or a numeric primary key identifying the related object
     :param user: The user making the request (used to enforce view permissions on attribute-based lookups)
@@ -235,15 +245,26 @@ def get_related_object_by_attrs(queryset, attrs, user=None):
     if attrs is None:
         return None
 
+    # Prefetched objects can be reused only if the base queryset has not been filtered
+    cache = query_cache.get() if not queryset.query.has_filters() else None
+
+    # A dictionary specifying only the ID is equivalent to passing the ID directly
+    if isinstance(attrs, dict) and list(attrs) == ['id']:
+        attrs = attrs['id']
+
     # Dictionary of related object attributes
     if isinstance(attrs, dict):
+        params = dict_to_filter_params(attrs)
+        if cache is not None and (key := _get_attrs_cache_key(queryset.model, params, user)) is not None:
+            if (obj := cache['related_objects_by_attrs'].get(key)) is not None:
+                return obj
+
         # Restrict the queryset to only those objects the user is permitted to view. This ensures that filtering by
         # attributes cannot be used to enumerate objects which the user is not otherwise permitted to see. Referencing
         # an object solely by its numeric ID (e.g. {"id": 123}) is equivalent to passing the ID directly, and is
         # always permitted regardless of the user's view permissions.
-        if list(attrs) != ['id'] and user is not None and hasattr(queryset, 'restrict'):
+        if user is not None and hasattr(queryset, 'restrict'):
             queryset = queryset.restrict(user, 'view')
-        params = dict_to_filter_params(attrs)
         try:
             return queryset.get(**params)
         except ObjectDoesNotExist:
@@ -268,8 +289,84 @@ def get_related_object_by_attrs(queryset, attrs, user=None):
             ).format(value=attrs)
         )
 
+    if cache is not None:
+        if (obj := cache['related_objects'].get((queryset.model._meta.label_lower, pk))) is not None:
+            return obj
+
     # Look up object by PK
     try:
         return queryset.get(pk=pk)
     except ObjectDoesNotExist:
         raise ValidationError(_("Related object not found using the provided numeric ID: {id}").format(id=pk))
+
+
+def _get_attrs_cache_key(model, params, user):
+    """
+    Return the key under which an object resolved by the given filter parameters is cached for the current request,
+    or None if the parameters cannot be cached (e.g. because they include a null or unhashable value).
+    """
+    if any(value is None for value in params.values()):
+        return None
+    key = (model._meta.label_lower, getattr(user, 'pk', None), tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def prefetch_related_objects_by_pk(model, pks):
+    """
+    Retrieve the objects of a model having the given primary keys using a single query, and cache them for reuse by
+    get_related_object_by_attrs() while processing the current request. Has no effect outside of a request.
+    """
+    if (cache := query_cache.get()) is None:
+        return
+
+    label = model._meta.label_lower
+    if pks := {pk for pk in pks if (label, pk) not in cache['related_objects']}:
+        for pk, obj in model.objects.in_bulk(pks).items():
+            cache['related_objects'][(label, pk)] = obj
+
+
+def prefetch_related_objects_by_attrs(model, attrs, user=None):
+    """
+    Resolve the objects of a model identified by each of the given dictionaries of attributes, and cache them for
+    reuse by get_related_object_by_attrs() while processing the current request. References sharing the same set of
+    attributes are resolved together using a single query, restricted to the objects which the user is permitted to
+    view. An object is cached only if it is the sole match for its attributes; any other reference is left to be
+    resolved (and reported) individually. Has no effect outside of a request.
+    """
+    if (cache := query_cache.get()) is None:
+        return
+
+    # Group references by the attributes they specify
+    groups = defaultdict(dict)
+    for params in attrs:
+        params = dict_to_filter_params(params)
+        key = _get_attrs_cache_key(model, params, user)
+        if key is not None and key not in cache['related_objects_by_attrs']:
+            groups[tuple(sorted(params))][key] = params
+
+    queryset = model.objects.all()
+    if user is not None and hasattr(queryset, 'restrict'):
+        queryset = queryset.restrict(user, 'view')
+
+    for fields, references in groups.items():
+        if len(fields) == 1:
+            query = Q(**{f'{fields[0]}__in': [params[fields[0]] for params in references.values()]})
+        else:
+            query = reduce(operator.or_, (Q(**params) for params in references.values()))
+        try:
+            matches = defaultdict(set)
+            for pk, *values in queryset.filter(query).values_list('pk', *fields):
+                matches[tuple(zip(fields, values))].add(pk)
+        except (FieldError, TypeError, ValueError, ValidationError):
+            # Invalid references are reported when resolved individually
+            continue
+
+        unique_matches = {values: next(iter(pks)) for values, pks in matches.items() if len(pks) == 1}
+        objects = queryset.in_bulk(unique_matches.values())
+        for key in references:
+            if (obj := objects.get(unique_matches.get(key[2]))) is not None:
+                cache['related_objects_by_attrs'][key] = obj
@@ -1,11 +1,20 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
 from django.apps import apps
-from django.db.models import Count, F, OuterRef, QuerySet, Subquery
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, QuerySet, Subquery
 from django.db.models.signals import post_delete, post_save, pre_delete
 
+from netbox.bulk import register_bulk_context
 from netbox.registry import registry
 
 from .fields import CounterCacheField
 
+# Holds the counter changes (if any) being batched for the current thread
+_local = threading.local()
+
 
 def get_counters_for_model(model):
     """
@@ -17,14 +26,53 @@ def get_counters_for_model(model):
 def update_counter(model, pk, counter_name, value):
     """
     Increment or decrement a counter field on an object identified by its model and primary key (PK). Positive values
-    will increment; negative values will decrement.
+    will increment; negative values will decrement. If counter updates are being batched (see
+    batched_counter_updates()), the change is recorded for application at the end of the batch.
     """
+    if (deltas := getattr(_local, 'deltas', None)) is not None:
+        deltas[(model, pk)][counter_name] += value
+        return
+
     model.objects.filter(pk=pk).update(
         **{counter_name: F(counter_name) + value}
     )
 
 
-def update_counts(model, field_name, related_query):
+@register_bulk_context
+@contextmanager
+def batched_counter_updates():
+    """
+    Accumulate all counter changes made within the block, and apply them once the block exits: one UPDATE per set of
+    objects sharing identical changes (e.g. a single UPDATE for a Device to which 96 Interfaces have been added).
+    The block runs inside a transaction, so the counters are committed along with the changes.
+
+    Nested invocations join the outermost block.
+    """
+    if getattr(_local, 'deltas', None) is not None:
+        yield
+        return
+
+    deltas = _local.deltas = defaultdict(lambda: defaultdict(int))
+    try:
+        with transaction.atomic():
+            yield
+            _local.deltas = None
+
+            # Group objects by model and (non-zero) counter changes
+            updates = defaultdict(list)
+            for (model, pk), counters in deltas.items():
+                if changes := frozenset((name, value) for name, value in counters.items() if value):
+                    updates[(model, changes)].append(pk)
+
+            for (model, changes), pks in updates.items():
+                model.objects.filter(pk__in=pks).update(**{
+                    name: F(name) + value for name, value in changes
+                })
+    finally:
+        _local.deltas = None
+
+
+def update_counts(model, field_name, related_query, pk_range=None):
     """
     Perform a bulk update for the given model and counter field. For example,
 
@@ -33,11 +81,18 @@ def update_counts(model, field_name, related_query):
     will effectively set
 
         Device.objects.update(_interface_count=Count('interfaces'))
+
+    Only objects whose counter has drifted from the actual count are updated. Optionally, the update can be limited
+    to objects within a range of primary keys (start, end), where end is exclusive. Returns the number of objects
+    updated.
     """
     subquery = Subquery(
         model.objects.filter(pk=OuterRef('pk')).annotate(_count=Count(related_query)).values('_count')
     )
-    return model.objects.update(**{
+    queryset = model.objects.all()
+    if pk_range is not None:
+        queryset = queryset.filter(pk__gte=pk_range[0], pk__lt=pk_range[1])
+    return queryset.filter(~Q(**{field_name: subquery})).update(**{
         field_name: subquery
     })
 
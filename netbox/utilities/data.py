@@ -11,6 +11,7 @@ __all__ = (
     'deepmerge',
     'drange',
     'flatten_dict',
+    'get_changed_data',
     'get_config_value_ci',
     'get_inclusive_integer_range_bounds',
     'normalize_integer_range',
@@ -115,6 +116,27 @@ def deep_compare_dict(source_dict, destination_dict, exclude=tuple()):
     return added, removed
 
 
+def get_changed_data(data, reference):
+    """
+    Return the items of `data` which differ from those of `reference`, such that deepmerge(reference, result) == data.
+    For values which are dicts in both, the comparison is performed recursively. Returns None if the dictionaries (or
+    any changed nested dicts) do not have the same keys, as a removed key cannot be represented.
+    """
+    if set(data) != set(reference):
+        return None
+
+    ret = {}
+    for key, value in data.items():
+        if value == reference[key]:
+            continue
+        if isinstance(value, dict) and isinstance(reference[key], dict):
+            if (value := get_changed_data(value, reference[key])) is None:
+                return None
+        ret[key] = value
+
+    return ret
+
+
 #
 # Array utilities
 #
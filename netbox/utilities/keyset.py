@@ -0,0 +1,228 @@
+import base64
+import datetime
+import json
+from typing import NamedTuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, OrderBy, Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Collate
+
+from utilities.query_functions import CollateAsChar
+
+__all__ = (
+    'KeysetKey',
+    'apply_keyset',
+    'decode_cursor',
+    'encode_cursor',
+    'get_keyset_ordering',
+    'get_keyset_values',
+)
+
+
+class KeysetKey(NamedTuple):
+    """
+    A single component of the ordering by which a queryset is paginated.
+    """
+    path: str
+    descending: bool = False
+    nulls_first: bool = False
+    nullable: bool = True
+    collation: str | None = None
+
+    def __str__(self):
+        return f'-{self.path}' if self.descending else self.path
+
+
+class _CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Encode the sort key values of a cursor, retaining the full precision of time values (which DjangoJSONEncoder
+    truncates to milliseconds).
+    """
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def _parse_ordering(item):
+    """
+    Return the field path, direction, explicit null placement (if any), and collation (if any) of an ordering item.
+    """
+    if isinstance(item, str):
+        if item == '?':
+            raise ValueError("Random ordering cannot be paginated by cursor.")
+        return item.lstrip('-'), item.startswith('-'), None, None
+
+    descending, nulls_first, collation = False, None, None
+    expression = item
+    if isinstance(expression, OrderBy):
+        descending = expression.descending
+        nulls_first = True if expression.nulls_first else False if expression.nulls_last else None
+        expression = expression.expression
+    if isinstance(expression, Collate):
+        collation, expression = expression.collation, expression.get_source_expressions()[0]
+    elif isinstance(expression, CollateAsChar):
+        collation, expression = CollateAsChar.function, expression.get_source_expressions()[0]
+    if isinstance(expression, F):
+        return expression.name, descending, nulls_first, collation
+    raise ValueError(f"Ordering by {item} cannot be paginated by cursor.")
+
+
+def _resolve_ordering(queryset, item, prefix='', descending=False):
+    """
+    Resolve an ordering item to a list of KeysetKeys, expanding any relation to the ordering of its related model (as
+    Django does when ordering by a related object).
+    """
+    path, desc, nulls_first, collation = _parse_ordering(item)
+    path, desc = f'{prefix}{path}', desc != descending
+
+    if path in queryset.query.annotations:
+        return [KeysetKey(path, desc, desc if nulls_first is None else nulls_first, collation=collation)]
+
+    # Walk the path to determine its final field, and whether its value may be null
+    opts, nullable = queryset.model._meta, False
+    parts = path.split(LOOKUP_SEP)
+    for part in parts:
+        try:
+            field = opts.pk if part == 'pk' else opts.get_field(part)
+        except FieldDoesNotExist:
+            raise ValueError(f"Ordering by {path} cannot be paginated by cursor.")
+        if field.many_to_many or field.one_to_many:
+            raise ValueError(f"Ordering by a multi-valued relation ({path}) cannot be paginated by cursor.")
+        nullable |= field.null
+        if field.is_relation:
+            opts = field.related_model._meta
+
+    if field.is_relation and opts.ordering and parts[-1] not in ('pk', getattr(field, 'attname', None)):
+        keys = []
+        for related_item in opts.ordering:
+            keys.extend(_resolve_ordering(queryset, related_item, prefix=f'{path}{LOOKUP_SEP}', descending=desc))
+        return keys
+
+    return [KeysetKey(path, desc, desc if nulls_first is None else nulls_first, nullable, collation)]
+
+
+def get_keyset_ordering(queryset):
+    """
+    Return the ordering of a queryset as a list of KeysetKeys, to which the primary key is appended (if not already
+    present) to ensure a total ordering. Raises ValueError if the ordering cannot be employed for keyset pagination.
+    """
+    if queryset.query.order_by:
+        ordering = queryset.query.order_by
+    elif queryset.query.default_ordering:
+        ordering = queryset.model._meta.ordering
+    else:
+        ordering = ()
+
+    keys = {}
+    for item in ordering:
+        for key in _resolve_ordering(queryset, item):
+            keys.setdefault(key.path, key)
+    pk_name = queryset.model._meta.pk.name
+    if 'pk' not in keys and pk_name not in keys:
+        keys['pk'] = KeysetKey('pk', nullable=False)
+
+    return list(keys.values())
+
+
+def get_keyset_values(queryset, keys, pk):
+    """
+    Return the values of the given KeysetKeys for the object with the specified primary key, or None if the queryset
+    does not include it.
+    """
+    return queryset.filter(pk=pk).values_list(*[key.path for key in keys]).first()
+
+
+def _get_equal_filter(key, value):
+    if value is None:
+        return Q(**{f'{key.path}__isnull': True})
+    return Q(**{key.path: value})
+
+
+def _get_following_filter(key, value):
+    """
+    Return a Q object matching values which follow the given value for a key, or None if no value can follow it.
+    """
+    if value is None:
+        # Only non-null values can follow a null, and only when nulls are ordered first
+        return Q(**{f'{key.path}__isnull': False}) if key.nulls_first else None
+    q = Q(**{f'{key.path}__{"lt" if key.descending else "gt"}': value})
+    if key.nullable and not key.nulls_first:
+        q |= Q(**{f'{key.path}__isnull': True})
+    return q
+
+
+def apply_keyset(queryset, keys, values=None):
+    """
+    Order a queryset by the given KeysetKeys. If values are given, the queryset is also filtered to include only
+    objects which follow the object having those values for the keys, i.e. a lexicographic comparison of the sort key
+    tuples. (Any appropriate index can then be used to locate the first object without scanning those preceding it.)
+    Keys having a collation are compared and ordered under that collation.
+    """
+    # Refer to each collated key by an alias for its collated expression
+    aliases = {
+        f'_keyset_{i}': Collate(F(key.path), key.collation) for i, key in enumerate(keys) if key.collation
+    }
+    if aliases:
+        queryset = queryset.alias(**aliases)
+        keys = [key._replace(path=f'_keyset_{i}') if key.collation else key for i, key in enumerate(keys)]
+
+    if values is not None:
+        if len(values) != len(keys):
+            raise ValueError("The number of values does not match the ordering.")
+
+        # Compose the filter from the last key outward: (k1 > v1) OR (k1 = v1 AND ((k2 > v2) OR (k2 = v2 AND ...)))
+        q = None
+        for key, value in reversed(list(zip(keys, values))):
+            following = _get_following_filter(key, value)
+            if q is not None:
+                q = _get_equal_filter(key, value) & q
+                if following is not None:
+                    q = following | q
+            else:
+                q = following
+
+        # Bound the leading key explicitly, to enable an index range scan
+        key, value = keys[0], values[0]
+        if q is not None and len(keys) > 1 and value is not None and not key.nullable:
+            q &= Q(**{f'{key.path}__{"lte" if key.descending else "gte"}': value})
+
+        queryset = queryset.filter(q if q is not None else Q(pk__in=[]))
+
+    return queryset.order_by(*[
+        OrderBy(
+            F(key.path),
+            descending=key.descending,
+            # Specify the placement of nulls only where it differs from PostgreSQL's default
+            nulls_first=True if key.nulls_first and not key.descending else None,
+            nulls_last=True if not key.nulls_first and key.descending else None,
+        ) for key in keys
+    ])
+
+
+def encode_cursor(keys, values):
+    """
+    Return an opaque cursor encoding the given sort key values, for the ordering represented by the given KeysetKeys.
+    """
+    data = json.dumps([[str(key) for key in keys], list(values)], cls=_CursorJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, keys):
+    """
+    Return the sort key values encoded in a cursor. Raises ValueError if the cursor is malformed or was issued for an
+    ordering other than the one represented by the given KeysetKeys.
+    """
+    try:
+        ordering, values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if ordering != [str(key) for key in keys] or not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("The cursor does not match the requested ordering.")
+
+    return values
@@ -1,14 +1,41 @@
+import multiprocessing
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-from django.core.management.base import BaseCommand
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max, Min
 
 from netbox.registry import registry
 from utilities.counters import update_counts
 
 
+def update_counts_shard(label, field_name, related_query, pk_range):
+    """
+    Recalculate a counter field for objects of the specified model within a range of primary keys. (This is a
+    module-level function so that it can be dispatched to a worker process.)
+    """
+    return update_counts(apps.get_model(label), field_name, related_query, pk_range=pk_range)
+
+
 class Command(BaseCommand):
     help = "Force a recalculation of all cached counter fields"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help="The number of worker processes among which to divide the recalculation of counters"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=100000,
+            help="The range of primary keys to be recalculated by a worker at once"
+        )
+
     @staticmethod
     def collect_models():
         """
@@ -27,8 +54,37 @@ class Command(BaseCommand):
         return models
 
     def handle(self, *model_names, **options):
-        for model, mappings in self.collect_models().items():
-            for field_name, related_query in mappings.items():
-                update_counts(model, field_name, related_query)
+        if options['workers'] < 1:
+            raise CommandError("The number of workers must be at least 1.")
+        if options['chunk_size'] < 1:
+            raise CommandError("The chunk size must be at least 1.")
+
+        if options['workers'] > 1:
+            self._handle_parallel(options['workers'], options['chunk_size'])
+        else:
+            for model, mappings in self.collect_models().items():
+                for field_name, related_query in mappings.items():
+                    update_counts(model, field_name, related_query)
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
+
+    def _handle_parallel(self, workers, chunk_size):
+        """
+        Divide the recalculation of each counter field into ranges of primary keys, and distribute them among a pool
+        of worker processes.
+        """
+        tasks = []
+        for model, mappings in self.collect_models().items():
+            pk_range = model.objects.aggregate(start=Min('pk'), end=Max('pk'))
+            if pk_range['start'] is None:
+                continue
+            for start in range(pk_range['start'], pk_range['end'] + 1, chunk_size):
+                for field_name, related_query in mappings.items():
+                    tasks.append((model._meta.label, field_name, related_query, (start, start + chunk_size)))
+
+        # Close any open database connections, which must not be shared with forked worker processes
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            updated_count = sum(executor.map(update_counts_shard, *zip(*tasks))) if tasks else 0
+
+        self.stdout.write(f'Corrected {updated_count} counters.')
@@ -1,3 +1,7 @@
+import json
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
@@ -6,6 +10,7 @@ from utilities.mptt import TreeManager
 __all__ = (
     'count_related',
     'dict_to_filter_params',
+    'estimate_count',
     'reapply_model_ordering',
 )
 
@@ -59,6 +64,26 @@ def dict_to_filter_params(d, prefix=''):
     return params
 
 
+def estimate_count(queryset):
+    """
+    Return the number of rows the PostgreSQL query planner estimates a queryset will return. This is derived from the
+    table statistics gathered by ANALYZE (e.g. pg_class.reltuples for an unfiltered table), so it is obtained without
+    scanning the table, but may be inaccurate.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
 def reapply_model_ordering(queryset: QuerySet) -> QuerySet:
     """
     Reapply model-level ordering in case it has been lost through .annotate().
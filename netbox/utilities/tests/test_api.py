@@ -1,3 +1,6 @@
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
 from django.test import Client, TestCase, override_settings, tag
 from django.urls import reverse
 from drf_spectacular.drainage import GENERATOR_STATS
@@ -13,10 +16,18 @@ from ipam.api.serializers import VLANSerializer
 from ipam.models import VLAN
 from netbox.api.serializers import BaseModelSerializer
 from netbox.config import get_config
+from netbox.context import query_cache
 from netbox.plugins import register_serializer_resolver
 from netbox.registry import registry
 from users.models import ObjectPermission
-from utilities.api import get_prefetches_for_serializer, get_serializer_for_model, get_view_name
+from utilities.api import (
+    get_prefetches_for_serializer,
+    get_related_object_by_attrs,
+    get_serializer_for_model,
+    get_view_name,
+    prefetch_related_objects_by_attrs,
+    prefetch_related_objects_by_pk,
+)
 from utilities.testing import APITestCase, disable_warnings
 
 
@@ -223,6 +234,73 @@ class WritableNestedSerializerTestCase(APITestCase):
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(VLAN.objects.count(), 0)
 
+    def test_bulk_related_by_attributes(self):
+        data = [
+            {'vid': 100, 'name': 'Test VLAN 100', 'site': {'name': 'Site 1'}},
+            {'vid': 101, 'name': 'Test VLAN 101', 'site': {'name': 'Site 2'}},
+            {'vid': 102, 'name': 'Test VLAN 102', 'site': {'name': 'Site 1'}},
+        ]
+        url = reverse('ipam-api:vlan-list')
+        self.add_permissions('ipam.add_vlan', 'dcim.view_site')
+
+        response = self.client.post(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual([vlan['site']['id'] for vlan in response.data], [self.site1.pk, self.site2.pk, self.site1.pk])
+
+    def test_bulk_related_by_attributes_constrained_view_permission(self):
+        """
+        References resolved together for a bulk request must honor the user's view permissions.
+        """
+        data = [
+            {'vid': 100, 'name': 'Test VLAN 100', 'site': {'name': 'Site 1'}},
+            {'vid': 101, 'name': 'Test VLAN 101', 'site': {'name': 'Site 2'}},
+        ]
+        url = reverse('ipam-api:vlan-list')
+        self.add_permissions('ipam.add_vlan')
+        obj_perm = ObjectPermission(name='Constrained view', constraints={'name': 'Site 1'}, actions=['view'])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ObjectType.objects.get_for_model(Site))
+
+        with disable_warnings('django.request'):
+            response = self.client.post(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(VLAN.objects.count(), 0)
+        self.assertTrue(response.data[1]['site'][0].startswith("Related object not found"))
+
+    def test_bulk_update_related_by_attributes(self):
+        vlans = VLAN.objects.bulk_create([VLAN(vid=vid, name=f'Test VLAN {vid}') for vid in (100, 101)])
+        data = [{'id': vlan.pk, 'site': {'name': 'Site 2'}} for vlan in vlans]
+        url = reverse('ipam-api:vlan-list')
+        self.add_permissions('ipam.change_vlan', 'dcim.view_site')
+
+        response = self.client.patch(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        for vlan in VLAN.objects.all():
+            self.assertEqual(vlan.site, self.site2)
+
+    def test_prefetch_related_objects(self):
+        token = query_cache.set(defaultdict(dict))
+        self.addCleanup(query_cache.reset, token)
+        prefetch_related_objects_by_pk(Site, [self.site1.pk])
+        prefetch_related_objects_by_attrs(Site, [
+            {'name': 'Site 2'},
+            {'region': {'name': 'Region A'}},
+            {'name': 'Site 3'},
+        ])
+
+        # References matching exactly one object are resolved without further queries
+        with self.assertNumQueries(0):
+            self.assertEqual(get_related_object_by_attrs(Site.objects.all(), self.site1.pk), self.site1)
+            self.assertEqual(get_related_object_by_attrs(Site.objects.all(), {'id': self.site1.pk}), self.site1)
+            self.assertEqual(get_related_object_by_attrs(Site.objects.all(), {'name': 'Site 2'}), self.site2)
+
+        # Other references are resolved individually
+        with self.assertRaisesMessage(ValidationError, "Multiple objects match"):
+            get_related_object_by_attrs(Site.objects.all(), {'region': {'name': 'Region A'}})
+        with self.assertRaisesMessage(ValidationError, "Related object not found"):
+            get_related_object_by_attrs(Site.objects.all(), {'name': 'Site 3'})
+
 
 class APIPaginationTestCase(APITestCase):
     user_permissions = ('dcim.view_site',)
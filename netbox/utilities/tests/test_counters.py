@@ -3,7 +3,7 @@ from unittest.mock import patch
 from django.urls import reverse
 
 from dcim.models import *
-from utilities.counters import connect_counters, update_counter
+from utilities.counters import batched_counter_updates, connect_counters, update_counter, update_counts
 from utilities.testing.base import TestCase
 from utilities.testing.utils import create_test_device
 
@@ -140,6 +140,46 @@ class CountersTestCase(TestCase):
         self.assertEqual(device1.interface_count, 1)
         self.assertEqual(device2.interface_count, 3)
 
+    def test_batched_counter_updates(self):
+        device1, device2 = Device.objects.all()
+
+        with batched_counter_updates():
+            Interface.objects.create(device=device1, name='Interface 5')
+            Interface.objects.create(device=device1, name='Interface 6')
+            Interface.objects.get(name='Interface 3').delete()
+            interface4 = Interface.objects.get(name='Interface 4')
+            interface4.device = device1
+            interface4.save()
+
+            # Counters are not updated until the batch is complete
+            device1.refresh_from_db()
+            self.assertEqual(device1.interface_count, 2)
+
+        device1.refresh_from_db()
+        device2.refresh_from_db()
+        self.assertEqual(device1.interface_count, 5)
+        self.assertEqual(device2.interface_count, 0)
+
+    def test_instantiated_component_counts(self):
+        device_type = DeviceType.objects.first()
+        InterfaceTemplate.objects.bulk_create([
+            InterfaceTemplate(device_type=device_type, name=f'Interface {i}', type='1000base-t')
+            for i in range(1, 4)
+        ])
+
+        device = create_test_device('Device 3')
+        device.refresh_from_db()
+        self.assertEqual(device.interface_count, 3)
+
+    def test_update_counts(self):
+        Device.objects.update(interface_count=0)
+
+        # Only counters which have drifted are updated
+        self.assertEqual(update_counts(Device, 'interface_count', 'interfaces'), 2)
+        self.assertEqual(update_counts(Device, 'interface_count', 'interfaces'), 0)
+        for device in Device.objects.all():
+            self.assertEqual(device.interface_count, 2)
+
     def test_mptt_child_delete(self):
         device1 = Device.objects.first()
         inventory_item1 = InventoryItem.objects.create(device=device1, name='Inventory Item 1')
@@ -4,6 +4,8 @@ from django.test import TestCase
 from utilities.data import (
     check_ranges_overlap,
     deep_compare_dict,
+    deepmerge,
+    get_changed_data,
     get_config_value_ci,
     get_inclusive_integer_range_bounds,
     normalize_integer_range,
@@ -209,6 +211,28 @@ class DeepCompareDictTestCase(TestCase):
         self.assertEqual(removed, {'a': 1})
 
 
+class GetChangedDataTestCase(TestCase):
+
+    def test_changed_data(self):
+        data = {'name': 'old', 'status': 'active', 'custom_fields': {'cf1': 'old', 'cf2': 'same'}}
+        reference = {'name': 'new', 'status': 'active', 'custom_fields': {'cf1': 'new', 'cf2': 'same'}}
+        changed = get_changed_data(data, reference)
+        self.assertEqual(changed, {'name': 'old', 'custom_fields': {'cf1': 'old'}})
+        self.assertEqual(deepmerge(reference, changed), data)
+
+    def test_dict_replaced(self):
+        data = {'a': {'x': 1}, 'b': None}
+        reference = {'a': None, 'b': {'y': 2}}
+        changed = get_changed_data(data, reference)
+        self.assertEqual(changed, data)
+        self.assertEqual(deepmerge(reference, changed), data)
+
+    def test_keys_differ(self):
+        self.assertIsNone(get_changed_data({'a': 1}, {'a': 1, 'b': 2}))
+        self.assertIsNone(get_changed_data({'a': 1, 'b': 2}, {'a': 2}))
+        self.assertIsNone(get_changed_data({'cf': {'x': 1}}, {'cf': {'x': 2, 'y': 3}}))
+
+
 class GetConfigValueCITestCase(TestCase):
 
     def test_exact_match(self):
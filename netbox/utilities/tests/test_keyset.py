@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from dcim.choices import InterfaceTypeChoices
+from dcim.models import Device, Interface, Site
+from utilities.keyset import (
+    KeysetKey,
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    get_keyset_ordering,
+    get_keyset_values,
+)
+from utilities.testing import create_test_device
+
+
+class KeysetTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        latitudes = (None, Decimal('1.5'), Decimal('2.5'), None, Decimal('1.5'), Decimal('3.5'))
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}', latitude=latitude) for i, latitude in enumerate(latitudes, 1)
+        ])
+
+    def _paginate(self, queryset, limit=2):
+        """
+        Page through the queryset by keyset, returning the primary keys of all objects in order.
+        """
+        keys = get_keyset_ordering(queryset)
+        pks, values = [], None
+        while page := list(apply_keyset(queryset, keys, values)[:limit]):
+            pks.extend(obj.pk for obj in page)
+            values = get_keyset_values(queryset, keys, page[-1].pk)
+        return pks
+
+    def test_get_keyset_ordering(self):
+        # The primary key is appended to the model's default ordering
+        self.assertEqual(
+            get_keyset_ordering(Site.objects.all()),
+            [KeysetKey('name', nullable=False), KeysetKey('pk', nullable=False)]
+        )
+
+        # Ordering by a related object employs the related model's ordering
+        self.assertEqual(
+            [str(key) for key in get_keyset_ordering(Device.objects.order_by('-site'))],
+            ['-site__name', 'pk']
+        )
+
+        with self.assertRaises(ValueError):
+            get_keyset_ordering(Site.objects.order_by('?'))
+
+    def test_paginate_nullable_field(self):
+        for ordering in ('latitude', '-latitude'):
+            queryset = Site.objects.order_by(ordering)
+            self.assertEqual(
+                self._paginate(queryset),
+                list(queryset.order_by(ordering, 'pk').values_list('pk', flat=True)),
+                msg=f"Keyset pagination differs for ordering by {ordering}"
+            )
+
+    def test_paginate_collated_field(self):
+        # Interfaces are ordered by their naturalized names, collated as plain character strings
+        device = create_test_device('Device 1')
+        for name in ('eth10', 'Eth2', 'eth1', 'ge-0/0/1', 'GigabitEthernet1/0/1', 'xe-0/0/0', 'Ethernet1/1'):
+            Interface.objects.create(device=device, name=name, type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+
+        queryset = Interface.objects.all()
+        keys = get_keyset_ordering(queryset)
+        self.assertEqual([str(key) for key in keys], ['device__name', 'device__pk', '_name', 'pk'])
+        self.assertEqual(keys[2].collation, 'C')
+        self.assertEqual(self._paginate(queryset), list(queryset.values_list('pk', flat=True)))
+
+    def test_cursor(self):
+        keys = [KeysetKey('last_updated', descending=True), KeysetKey('pk', nullable=False)]
+        now = timezone.now().replace(microsecond=123456)
+        cursor = encode_cursor(keys, [now, 10])
+
+        values = decode_cursor(cursor, keys)
+        self.assertEqual(values, [now.isoformat(), 10])
+
+        # A cursor is valid only for the ordering with which it was issued
+        with self.assertRaises(ValueError):
+            decode_cursor(cursor, keys[1:])
+        with self.assertRaises(ValueError):
+            decode_cursor('invalid', keys)
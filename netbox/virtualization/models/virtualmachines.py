@@ -241,6 +241,11 @@ class VirtualMachine(
 
     objects = ConfigContextModelQuerySet.as_manager()
 
+    config_context_dependencies = (
+        'site', 'site__region', 'site__group', 'role', 'platform', 'cluster', 'cluster__type', 'cluster__group',
+        'tenant', 'tenant__group',
+    )
+
     clone_fields = (
         'virtual_machine_type', 'site', 'cluster', 'device', 'tenant', 'platform', 'status', 'role', 'vcpus', 'memory',
         'disk',
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark the evaluation of event rule conditions.
+
+Evaluates a set of synthetic event rules against a stream of synthetic events, comparing
+the compilation of each rule's conditions per event (as done prior to the introduction of
+compiled conditions) with evaluation of conditions compiled once per rule. Rules are
+indexed by (object type, event type), as they are by extras.events.get_event_rules_index().
+
+Usage: python scripts/benchmark_event_rules.py [--rules 100] [--events 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'netbox'))
+
+from extras.conditions import ConditionSet  # noqa: E402
+
+OBJECT_TYPES = ('dcim.device', 'dcim.interface', 'dcim.site', 'ipam.prefix', 'ipam.ipaddress')
+EVENT_TYPES = ('object_created', 'object_updated', 'object_deleted')
+STATUSES = ('active', 'planned', 'staging', 'offline')
+
+
+def make_conditions(i):
+    """Return a representative set of conditions for the ith rule."""
+    return {'and': [
+        {'attr': 'status.value', 'value': STATUSES[i % len(STATUSES)]},
+        {'or': [
+            {'attr': 'name', 'value': f'^[a-z]+-{i % 10}', 'op': 'regex'},
+            {'attr': 'tags.slug', 'value': f'tag-{i % 7}', 'op': 'contains'},
+        ]},
+        {'attr': 'custom_fields.priority', 'value': i % 5, 'op': 'gte', 'negate': True},
+    ]}
+
+
+def make_event(i):
+    """Return a representative serialized object for the ith event."""
+    return {
+        'id': i,
+        'name': f'object-{i % 10}',
+        'status': {'value': random.choice(STATUSES), 'label': 'Status'},
+        'tags': [{'slug': f'tag-{j}'} for j in range(i % 4)],
+        'custom_fields': {'priority': i % 5},
+    }
+
+
+def run(rules, events, compiled):
+    """Evaluate each event against its applicable rules, returning the number of matches."""
+    matches = 0
+    for object_type, event_type, data in events:
+        for conditions, condition_set in rules.get((object_type, event_type), ()):
+            if not compiled:
+                condition_set = ConditionSet(conditions)
+            if condition_set.eval(data):
+                matches += 1
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rules', type=int, default=100, help='The number of event rules')
+    parser.add_argument('--events', type=int, default=100000, help='The number of events')
+    args = parser.parse_args()
+    random.seed(0)
+
+    # Index the rules by (object type, event type)
+    rules = defaultdict(list)
+    for i in range(args.rules):
+        conditions = make_conditions(i)
+        key = (OBJECT_TYPES[i % len(OBJECT_TYPES)], EVENT_TYPES[i % len(EVENT_TYPES)])
+        rules[key].append((conditions, ConditionSet(conditions)))
+    events = [
+        (random.choice(OBJECT_TYPES), random.choice(EVENT_TYPES), make_event(i)) for i in range(args.events)
+    ]
+
+    print(f'{args.rules} rules x {args.events} events')
+    results = {}
+    for label, compiled in (('Compiled per event', False), ('Compiled once', True)):
+        start = time.perf_counter()
+        matches = run(rules, events, compiled)
+        results[label] = time.perf_counter() - start
+        print(f'  {label:<20} {results[label]:8.3f}s ({matches} matches)')
+    print(f'  Speedup: {results["Compiled per event"] / results["Compiled once"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()